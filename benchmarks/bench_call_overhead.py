@@ -0,0 +1,80 @@
+# Measures the client-side overhead per call of the optional tracer, metrics, and timing
+# hook, against an in-process mock transport so that no time is spent on the network.
+#
+# Run with: uv run python benchmarks/bench_call_overhead.py
+
+from http import HTTPMethod, HTTPStatus
+from time import perf_counter
+
+from httpx2 import Client, MockTransport, Request, Response
+
+from fastapi_typed_client import (
+    FastAPIClientBase,
+    FastAPIClientMetrics,
+    FastAPIClientOptions,
+    FastAPIClientRoute,
+    FastAPIClientRouteParam,
+    FastAPIClientTiming,
+    FastAPIClientTracer,
+)
+
+CALLS = 10_000
+REPEAT = 10
+
+ROUTE = FastAPIClientRoute(
+    name="get_item",
+    path="/items/{item_id}",
+    method=HTTPMethod.GET,
+    default_status=HTTPStatus.OK,
+    models={HTTPStatus.OK: dict[str, int]},
+    params=(FastAPIClientRouteParam("path", "item_id", "identity"),),
+)
+
+
+def _handler(_request: Request) -> Response:
+    return Response(200, content=b'{"id": 1}')
+
+
+def _ignore_timing(_timing: FastAPIClientTiming) -> None:
+    pass
+
+
+def _time(client: FastAPIClientBase) -> float:
+    start = perf_counter()
+    for item_id in range(CALLS):
+        client._route_handler(ROUTE, (item_id,))  # noqa: SLF001
+    return (perf_counter() - start) / CALLS
+
+
+def main() -> None:
+    httpx_client = Client(transport=MockTransport(_handler), base_url="http://test")
+    clients = {
+        "plain": FastAPIClientBase(httpx_client),
+        "tracer": FastAPIClientBase(
+            httpx_client, options=FastAPIClientOptions(tracer=FastAPIClientTracer())
+        ),
+        "metrics": FastAPIClientBase(
+            httpx_client, options=FastAPIClientOptions(metrics=FastAPIClientMetrics())
+        ),
+        "timing_hook": FastAPIClientBase(
+            httpx_client, options=FastAPIClientOptions(timing_hook=_ignore_timing)
+        ),
+    }
+    # Alternate between the clients, so that they are equally affected by any drift in
+    # the machine's speed.
+    best = dict.fromkeys(clients, float("inf"))
+    for _ in range(REPEAT):
+        for name, client in clients.items():
+            best[name] = min(best[name], _time(client))
+    print(f"Per-call time, best of {REPEAT} runs of {CALLS} calls")
+    baseline = best.pop("plain")
+    print(f"{'plain':>11}: {baseline * 1e6:6.1f} µs")
+    for name, per_call in best.items():
+        print(
+            f"{name:>11}: {per_call * 1e6:6.1f} µs "
+            f"(+{(per_call - baseline) * 1e6:.1f} µs, {per_call / baseline:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Compares collecting two numeric fields of a 1M-line JSON Lines time series into
+# `array`s by validating every line into a model (via `batched()`) to validating only
+# those fields into columns via `iter_columns()`, in rows per second and peak memory.
+#
+# Run with: uv run python benchmarks/bench_columns.py
+
+from array import array
+from collections.abc import Callable, Iterator
+from time import perf_counter
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+
+from httpx2 import Response
+from pydantic import BaseModel, TypeAdapter
+
+from fastapi_typed_client import FastAPIClientBase
+
+CHUNK_SIZE = 64 * 1024
+COLUMN_CHUNK_SIZE = 65536
+LINES = 1_000_000
+REPEAT = 3
+
+
+class Sample(BaseModel):
+    timestamp: int
+    value: float
+    sensor: str
+    unit: str
+    tags: list[str]
+
+
+LIST_ADAPTER = TypeAdapter(list[Sample])
+BODY = b"".join(
+    TypeAdapter(Sample).dump_json(
+        Sample(
+            timestamp=1_700_000_000 + i,
+            value=i / 7,
+            sensor=f"sensor-{i % 16}",
+            unit="celsius",
+            tags=["indoor", "floor-2"],
+        )
+    )
+    + b"\n"
+    for i in range(LINES)
+)
+
+
+def _iter_chunks() -> Iterator[bytes]:
+    for offset in range(0, len(BODY), CHUNK_SIZE):
+        yield BODY[offset : offset + CHUNK_SIZE]
+
+
+def from_models() -> int:
+    response = Response(200, content=_iter_chunks())
+    timestamps, values = array("q"), array("d")
+    for samples in FastAPIClientBase._iter_json_lines_batches(  # noqa: SLF001
+        response, LIST_ADAPTER.validate_json, 100, None
+    ):
+        timestamps.extend([sample.timestamp for sample in samples])
+        values.extend([sample.value for sample in samples])
+    return len(values)
+
+
+def from_columns() -> int:
+    response = Response(200, content=_iter_chunks())
+    adapter, columns = FastAPIClientBase._columns_adapter(  # noqa: SLF001
+        Sample, ("timestamp", "value")
+    )
+    timestamps, values = array("q"), array("d")
+    for chunk in FastAPIClientBase._iter_columns(  # noqa: SLF001
+        response, adapter.validate_json, columns, COLUMN_CHUNK_SIZE
+    ):
+        timestamps.extend(chunk["timestamp"])
+        values.extend(chunk["value"])
+    return len(values)
+
+
+def _time(func: Callable[[], int]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start_time = perf_counter()
+        func()
+        best = min(best, perf_counter() - start_time)
+    return best
+
+
+def _peak_memory(func: Callable[[], int]) -> float:
+    start()
+    reset_peak()
+    func()
+    _, peak = get_traced_memory()
+    stop()
+    return peak
+
+
+def main() -> None:
+    print(f"Stream: {LINES:,} lines, {len(BODY) / 1e6:.1f} MB, best of {REPEAT} runs")
+    before = _time(from_models)
+    after = _time(from_columns)
+    print(
+        f"rows per second: models {LINES / before / 1e6:5.2f}M/s, "
+        f"columns {LINES / after / 1e6:5.2f}M/s ({before / after:.2f}x)"
+    )
+    before = _peak_memory(from_models)
+    after = _peak_memory(from_columns)
+    print(
+        f"    peak memory: models {before / 1e6:5.1f} MB, columns {after / 1e6:5.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# Compares httpx's default connection pool settings to the defaults of `from_url()` for
+# waves of concurrent calls against a local uvicorn server (as e.g. sent by `batch()`),
+# and measures the latency of the first wave with and without `preconnect`.
+#
+# Run with: uv run python benchmarks/bench_connection_pool.py
+
+from collections.abc import Awaitable, Callable
+from multiprocessing import Process
+from socket import socket
+from time import perf_counter
+
+import anyio
+import uvicorn
+from fastapi import FastAPI
+from httpx2 import AsyncClient
+
+from fastapi_typed_client import FastAPIClientAsyncBase
+
+CALLS = 5_000
+CONCURRENCY = 64
+REPEAT = 3
+
+app = FastAPI()
+
+
+@app.get("/")
+async def root() -> dict[str, str]:
+    return {"hello": "world"}
+
+
+async def _wave(client: AsyncClient) -> None:
+    async def call() -> None:
+        (await client.get("/")).raise_for_status()
+
+    async with anyio.create_task_group() as task_group:
+        for _ in range(CONCURRENCY):
+            task_group.start_soon(call)
+
+
+async def _waves(client: AsyncClient) -> None:
+    for _ in range(CALLS // CONCURRENCY):
+        await _wave(client)
+
+
+async def _time(func: Callable[[], Awaitable[object]]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = perf_counter()
+        await func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def _serve(sock: socket) -> None:
+    # Serves from a separate process, so that the server doesn't compete with the
+    # client for the event loop.
+    config = uvicorn.Config(app, log_level="warning", access_log=False)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+async def _wait_until_up(url: str) -> None:
+    async with AsyncClient(base_url=url) as client:
+        while True:
+            try:
+                await client.get("/")
+            except OSError:
+                await anyio.sleep(0.01)
+            else:
+                return
+
+
+async def main() -> None:
+    sock = socket()
+    sock.bind(("127.0.0.1", 0))
+    host, port = sock.getsockname()
+    url = f"http://{host}:{port}"
+    server = Process(target=_serve, args=(sock,), daemon=True)
+    server.start()
+    try:
+        await _wait_until_up(url)
+
+        print(f"{CALLS} calls in waves of {CONCURRENCY}, best of {REPEAT} runs")
+        async with AsyncClient(base_url=url) as client:
+            before = await _time(lambda: _waves(client))
+        async with FastAPIClientAsyncBase.from_url(url) as base:
+            after = await _time(lambda: _waves(base.client))
+        print(
+            f"httpx defaults {CALLS / before:8.0f} calls/s, "
+            f"from_url() defaults {CALLS / after:8.0f} calls/s ({before / after:.2f}x)"
+        )
+
+        print(f"First wave of {CONCURRENCY} calls of a fresh client")
+        async with FastAPIClientAsyncBase.from_url(url) as base:
+            start = perf_counter()
+            await _wave(base.client)
+            before = perf_counter() - start
+        async with FastAPIClientAsyncBase.from_url(url, preconnect=CONCURRENCY) as base:
+            start = perf_counter()
+            await _wave(base.client)
+            after = perf_counter() - start
+        print(
+            f"     cold {before * 1e3:8.1f} ms, "
+            f"preconnected {after * 1e3:8.1f} ms ({before / after:.2f}x)"
+        )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,152 @@
+# Compares splitting a 1M-line JSON Lines stream via `iter_lines()` (as generated
+# clients used to do, decoding every chunk to `str` first) to splitting its raw bytes
+# at `\n` (as they do now), once with a no-op in place of validation to isolate the
+# splitting, and once validating every line against a small model. Also compares
+# validating the lines one by one to validating them in batches via `batched()`.
+#
+# Run with: uv run python benchmarks/bench_json_lines.py
+
+from collections.abc import AsyncIterator, Callable, Iterator
+from time import perf_counter
+from typing import Any
+
+import anyio
+from httpx2 import Response
+from pydantic import BaseModel, TypeAdapter
+
+from fastapi_typed_client import FastAPIClientAsyncBase, FastAPIClientBase
+
+BATCH_SIZE = 100
+CHUNK_SIZE = 64 * 1024
+LINES = 1_000_000
+REPEAT = 5
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    score: float
+
+
+ADAPTER = TypeAdapter(Item)
+LIST_ADAPTER = TypeAdapter(list[Item])
+BODY = b"".join(
+    ADAPTER.dump_json(Item(id=i, name=f"item-{i}", score=i / 7)) + b"\n"
+    for i in range(LINES)
+)
+
+
+def _iter_chunks() -> Iterator[bytes]:
+    for offset in range(0, len(BODY), CHUNK_SIZE):
+        yield BODY[offset : offset + CHUNK_SIZE]
+
+
+async def _aiter_chunks() -> AsyncIterator[bytes]:
+    for chunk in _iter_chunks():
+        yield chunk
+
+
+def _skip_validation(line: str | bytes) -> str | bytes:
+    return line
+
+
+def sync_from_text(validate_json: Callable[[str | bytes], Any]) -> None:
+    response = Response(200, content=_iter_chunks())
+    for part in response.iter_lines():
+        if part:
+            validate_json(part)
+
+
+def sync_from_bytes(validate_json: Callable[[str | bytes], Any]) -> None:
+    response = Response(200, content=_iter_chunks())
+    for _ in FastAPIClientBase._iter_json_lines(response, validate_json):  # noqa: SLF001
+        pass
+
+
+async def async_from_text(validate_json: Callable[[str | bytes], Any]) -> None:
+    response = Response(200, content=_aiter_chunks())
+    async for part in response.aiter_lines():
+        if part:
+            validate_json(part)
+
+
+async def async_from_bytes(validate_json: Callable[[str | bytes], Any]) -> None:
+    response = Response(200, content=_aiter_chunks())
+    async for _ in FastAPIClientAsyncBase._aiter_json_lines(  # noqa: SLF001
+        response, validate_json
+    ):
+        pass
+
+
+def sync_batched() -> None:
+    response = Response(200, content=_iter_chunks())
+    for _ in FastAPIClientBase._iter_json_lines_batches(  # noqa: SLF001
+        response, LIST_ADAPTER.validate_json, BATCH_SIZE, None
+    ):
+        pass
+
+
+async def async_batched() -> None:
+    response = Response(200, content=_aiter_chunks())
+    async for _ in FastAPIClientAsyncBase._aiter_json_lines_batches(  # noqa: SLF001
+        response, LIST_ADAPTER.validate_json, BATCH_SIZE, None
+    ):
+        pass
+
+
+def _time(func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(
+        f"Stream: {LINES:,} lines, {len(BODY) / 1e6:.1f} MB, records per second, "
+        f"best of {REPEAT} runs"
+    )
+    for validation, validate_json in (
+        ("split", _skip_validation),
+        ("validate", ADAPTER.validate_json),
+    ):
+        for name, baseline, optimized in (
+            (
+                "sync",
+                lambda v=validate_json: sync_from_text(v),
+                lambda v=validate_json: sync_from_bytes(v),
+            ),
+            (
+                "async",
+                lambda v=validate_json: anyio.run(async_from_text, v),
+                lambda v=validate_json: anyio.run(async_from_bytes, v),
+            ),
+        ):
+            before = _time(baseline)
+            after = _time(optimized)
+            print(
+                f"{name:>5} {validation:>8}: "
+                f"from text {LINES / before / 1e6:5.2f}M/s, "
+                f"from bytes {LINES / after / 1e6:5.2f}M/s ({before / after:.2f}x)"
+            )
+    for name, baseline, optimized in (
+        ("sync", lambda: sync_from_bytes(ADAPTER.validate_json), sync_batched),
+        (
+            "async",
+            lambda: anyio.run(async_from_bytes, ADAPTER.validate_json),
+            lambda: anyio.run(async_batched),
+        ),
+    ):
+        before = _time(baseline)
+        after = _time(optimized)
+        print(
+            f"{name:>5}  batched: per line {LINES / before / 1e6:5.2f}M/s, "
+            f"batches of {BATCH_SIZE} {LINES / after / 1e6:5.2f}M/s "
+            f"({before / after:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Compares validating a ~10 MB JSON response from its decoded text (as generated clients
+# used to do) to validating it straight from the raw bytes (as they do now).
+#
+# Run with: uv run python benchmarks/bench_response_validation.py
+
+from collections.abc import AsyncIterator, Callable, Iterator
+from time import perf_counter
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+
+import anyio
+from httpx2 import Response
+from pydantic import BaseModel, TypeAdapter
+
+CHUNK_SIZE = 64 * 1024
+REPEAT = 5
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    tags: list[str]
+    score: float
+
+
+ADAPTER = TypeAdapter(list[Item])
+BODY = ADAPTER.dump_json(
+    [
+        Item(id=i, name=f"item-{i}", tags=["foo", "bär", "baz"], score=i / 7)
+        for i in range(118_000)
+    ]
+)
+
+
+def _iter_chunks() -> Iterator[bytes]:
+    for offset in range(0, len(BODY), CHUNK_SIZE):
+        yield BODY[offset : offset + CHUNK_SIZE]
+
+
+async def _aiter_chunks() -> AsyncIterator[bytes]:
+    for chunk in _iter_chunks():
+        yield chunk
+
+
+def sync_from_text() -> None:
+    response = Response(200, content=_iter_chunks())
+    response.read()
+    ADAPTER.validate_json(response.text or "null")
+
+
+def sync_from_bytes() -> None:
+    response = Response(200, content=_iter_chunks())
+    ADAPTER.validate_json(response.read() or b"null")
+
+
+async def async_from_text() -> None:
+    response = Response(200, content=_aiter_chunks())
+    text = ""
+    async for part in response.aiter_text():
+        text += part
+    ADAPTER.validate_json(text or "null")
+
+
+async def async_from_bytes() -> None:
+    response = Response(200, content=_aiter_chunks())
+    ADAPTER.validate_json(await response.aread() or b"null")
+
+
+def _time(func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def _peak_memory(func: Callable[[], object]) -> float:
+    start()
+    reset_peak()
+    func()
+    _, peak = get_traced_memory()
+    stop()
+    return peak
+
+
+def main() -> None:
+    print(f"Response size: {len(BODY) / 1e6:.1f} MB, best of {REPEAT} runs")
+    for name, baseline, optimized in (
+        ("sync", sync_from_text, sync_from_bytes),
+        (
+            "async",
+            lambda: anyio.run(async_from_text),
+            lambda: anyio.run(async_from_bytes),
+        ),
+    ):
+        before = _time(baseline)
+        after = _time(optimized)
+        print(
+            f"{name:>5}: from text {before * 1e3:8.1f} ms, "
+            f"from bytes {after * 1e3:8.1f} ms ({before / after:.2f}x)"
+        )
+        before = _peak_memory(baseline)
+        after = _peak_memory(optimized)
+        print(
+            f"{name:>5}: from text {before / 1e6:8.1f} MB, "
+            f"from bytes {after / 1e6:8.1f} MB peak memory"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Measures how many Server-Sent Events per second generated clients decode from a
+# stream of 200k events (each with a single `data:` line, as sent by FastAPI), for each
+# of the `validation` modes, and for events that also carry an `event` and `id` field.
+#
+# Run with: uv run python benchmarks/bench_sse.py
+
+from collections.abc import Callable, Iterator
+from time import perf_counter
+from typing import Literal
+
+from httpx2 import Response
+from pydantic import BaseModel, TypeAdapter
+
+from fastapi_typed_client import FastAPIClientBase
+
+CHUNK_SIZE = 64 * 1024
+EVENTS = 200_000
+REPEAT = 5
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    score: float
+
+
+ADAPTER = TypeAdapter(Item)
+PAYLOADS = [
+    ADAPTER.dump_json(Item(id=i, name=f"item-{i}", score=i / 7)) for i in range(EVENTS)
+]
+DATA_ONLY = b"".join(b"data: %b\n\n" % payload for payload in PAYLOADS)
+WITH_FIELDS = b"".join(
+    b"event: item\nid: %d\ndata: %b\n\n" % (i, payload)
+    for i, payload in enumerate(PAYLOADS)
+)
+
+
+def _iter_chunks(body: bytes) -> Iterator[bytes]:
+    for offset in range(0, len(body), CHUNK_SIZE):
+        yield body[offset : offset + CHUNK_SIZE]
+
+
+def decode(body: bytes, validation: Literal["validate", "construct", "none"]) -> None:
+    response = Response(200, content=_iter_chunks(body))
+    validate_json = FastAPIClientBase._json_validator(  # noqa: SLF001
+        Item, ADAPTER, validation
+    )
+    for _ in FastAPIClientBase._iter_sse(  # noqa: SLF001
+        response, Item, validate_json, validation
+    ):
+        pass
+
+
+def _time(func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f"Stream: {EVENTS:,} events, best of {REPEAT} runs")
+    for name, body in (("data only", DATA_ONLY), ("with fields", WITH_FIELDS)):
+        for validation in ("validate", "construct", "none"):
+            duration = _time(
+                lambda body=body, validation=validation: decode(body, validation)
+            )
+            print(
+                f"{name:>11}, {validation:>9}: {EVENTS / duration / 1e3:6.1f}k events/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
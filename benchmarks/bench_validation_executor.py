@@ -0,0 +1,105 @@
+# Compares validating the items of a JSON Lines stream of nested models on the
+# consuming thread to validating them on a thread pool and on a process pool via the
+# `validation_executor` option, with as many workers as there are CPUs. Thread pools
+# only pay off on free-threaded Python builds, process pools on any multi-core machine.
+#
+# Run with: uv run python benchmarks/bench_validation_executor.py
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from os import cpu_count
+from sys import _is_gil_enabled
+from time import perf_counter
+
+from httpx2 import Response
+from pydantic import BaseModel, TypeAdapter
+
+from fastapi_typed_client import FastAPIClientBase
+
+CHUNK_SIZE = 64 * 1024
+LINES = 20_000
+REPEAT = 3
+WINDOW = 64
+
+
+class Leaf(BaseModel):
+    id: int
+    name: str
+    tags: list[str]
+    score: float
+
+
+class Item(BaseModel):
+    id: int
+    leaves: list[Leaf]
+    attributes: dict[str, int]
+
+
+ADAPTER = TypeAdapter(Item)
+BODY = b"".join(
+    ADAPTER.dump_json(
+        Item(
+            id=i,
+            leaves=[
+                Leaf(id=j, name=f"leaf-{j}", tags=["foo", "bar"], score=j / 7)
+                for j in range(20)
+            ],
+            attributes={f"key-{j}": j for j in range(10)},
+        )
+    )
+    + b"\n"
+    for i in range(LINES)
+)
+
+
+def _iter_chunks() -> Iterator[bytes]:
+    for offset in range(0, len(BODY), CHUNK_SIZE):
+        yield BODY[offset : offset + CHUNK_SIZE]
+
+
+def validate(executor: Executor | None) -> None:
+    response = Response(200, content=_iter_chunks())
+    for _ in FastAPIClientBase._build_streaming_data(  # noqa: SLF001
+        "json_lines",
+        response,
+        Item,
+        ADAPTER.validate_json,
+        "validate",
+        executor,
+        WINDOW,
+    ):
+        pass
+
+
+def _time(func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    workers = cpu_count() or 1
+    print(
+        f"Stream: {LINES:,} lines, {len(BODY) / 1e6:.1f} MB, {workers} CPU(s), "
+        f"GIL {'enabled' if _is_gil_enabled() else 'disabled'}, best of {REPEAT} runs"
+    )
+    inline = _time(lambda: validate(None))
+    print(f"      inline: {LINES / inline / 1e3:6.1f}k items/s")
+    for name, executor_class in (
+        ("thread pool", ThreadPoolExecutor),
+        ("process pool", ProcessPoolExecutor),
+    ):
+        with executor_class(workers) as executor:
+            # Warms up the workers, so that starting them isn't measured.
+            validate(executor)
+            pooled = _time(lambda executor=executor: validate(executor))
+        print(
+            f"{name:>12}: {LINES / pooled / 1e3:6.1f}k items/s ({inline / pooled:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
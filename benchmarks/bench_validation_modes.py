@@ -0,0 +1,70 @@
+# Compares the `validation` modes of generated clients on a ~10 MB JSON response:
+# validating the data, constructing models without validation, and returning the parsed
+# JSON as is. Pydantic's `model_construct()` runs in Python, so constructing is usually
+# slower than Pydantic's Rust validation, even for models that run Python validators.
+#
+# Run with: uv run python benchmarks/bench_validation_modes.py
+
+from collections.abc import Callable
+from time import perf_counter
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, BaseModel, TypeAdapter
+
+from fastapi_typed_client import FastAPIClientBase
+
+REPEAT = 5
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    tags: list[str]
+    score: float
+
+
+def _normalize_tags(tags: list[str]) -> list[str]:
+    return sorted({tag.casefold() for tag in tags})
+
+
+class CheckedItem(Item):
+    tags: Annotated[list[str], AfterValidator(_normalize_tags)]
+
+
+BODY = TypeAdapter(list[Item]).dump_json(
+    [
+        Item(id=i, name=f"item-{i}", tags=["foo", "bär", "baz"], score=i / 7)
+        for i in range(118_000)
+    ]
+)
+
+
+def _time(func: Callable[[bytes], Any]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = perf_counter()
+        func(BODY)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    print(f"Response size: {len(BODY) / 1e6:.1f} MB, best of {REPEAT} runs")
+    for item in (Item, CheckedItem):
+        model = list[item]
+        adapter = TypeAdapter(model)
+        baseline = None
+        for validation in ("validate", "construct", "none"):
+            validate_json = FastAPIClientBase._json_validator(  # noqa: SLF001
+                model, adapter, validation
+            )
+            elapsed = _time(validate_json)
+            baseline = baseline or elapsed
+            print(
+                f"{item.__name__:>11} {validation:>9}: {elapsed * 1e3:8.1f} ms "
+                f"({baseline / elapsed:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
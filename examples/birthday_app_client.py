@@ -1,24 +1,70 @@
+from array import array
 from base64 import b64encode
+from bisect import bisect_left
+from collections import (
+    OrderedDict,
+    deque,
+)
 from collections.abc import (
+    Callable,
+    Collection,
+    Iterable,
     Iterator,
     Mapping,
     MutableMapping,
     Sequence,
 )
-from contextlib import contextmanager
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import (
+    contextmanager,
+    suppress,
+)
+from datetime import (
+    UTC,
+    datetime,
+)
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from functools import (
+    lru_cache,
+    partial,
+)
 from http import (
     HTTPMethod,
     HTTPStatus,
 )
+from itertools import islice
+from random import uniform
+from re import split
+from secrets import token_hex
+from threading import Lock
+from time import (
+    monotonic,
+    sleep,
+    time_ns,
+)
+from types import UnionType
 from typing import (
     TYPE_CHECKING,
+    Annotated,
     Any,
     Literal,
     NamedTuple,
+    NotRequired,
     Self,
     TypedDict,
+    Union,
+    get_args,
+    get_origin,
     overload,
 )
+from uuid import uuid4
 from warnings import warn
 
 from fastapi.encoders import jsonable_encoder
@@ -26,13 +72,19 @@ from fastapi.sse import ServerSentEvent
 from httpx2 import (
     USE_CLIENT_DEFAULT,
     Client,
+    Limits,
+    NetworkError,
+    RemoteProtocolError,
+    Request,
     Response,
     Timeout,
+    TimeoutException,
 )
 from pydantic import (
     BaseModel,
     TypeAdapter,
 )
+from pydantic_core import from_json
 
 from birthday_app import (
     BirthdayData,
@@ -50,6 +102,12 @@ class BirthdayAppClientExtensions(TypedDict, total=False):
         | Timeout
         | None
     )
+    encoding: str
+    lazy_validation: bool
+    validation: Literal["validate", "construct", "none"]
+    retry_policy: BirthdayAppClientRetryPolicy | None
+    validation_executor: Executor | None
+    sse_reconnect_policy: BirthdayAppClientSSEReconnectPolicy | None
 
 
 class BirthdayAppClientResult[Status: HTTPStatus, Model](NamedTuple):
@@ -59,6 +117,148 @@ class BirthdayAppClientResult[Status: HTTPStatus, Model](NamedTuple):
     response: Response
 
 
+class BirthdayAppClientLazyResult[Status: HTTPStatus, Model](
+    BirthdayAppClientResult[Status, Model],
+):
+    # Defers validating `data` until it is first accessed, see `lazy_validation`.
+    def __new__(
+        cls,
+        status: Status,
+        validate: Callable[[], Model],
+        model: type[Model],
+        response: Response,
+    ) -> Self:
+        result = super().__new__(
+            cls,
+            status,
+            BIRTHDAY_APP_CLIENT_NOT_REQUIRED,
+            model,
+            response,
+        )
+        result.__dict__["validate"] = validate
+        return result
+
+    @property
+    def data(self) -> Model:  # type: ignore[bad-override]
+        state = self.__dict__
+        if "data" not in state:
+            validate = state.get("validate")
+            # Instances created via `_make()` / `_replace()` hold validated data.
+            state["data"] = (
+                tuple.__getitem__(self, 1) if validate is None else validate()
+            )
+            state.pop("validate", None)
+        return state["data"]
+
+    def __iter__(self) -> Iterator[Any]:
+        yield self.status
+        yield self.data
+        yield self.model
+        yield self.response
+
+    def __getitem__(self, index: Any) -> Any:  # noqa: ANN401
+        return tuple(self)[index]
+
+    # All comparisons must go through `__iter__()`, since the underlying tuple holds
+    # a placeholder instead of the data.
+    def __eq__(self, other: object) -> bool:
+        return tuple(self) == other
+
+    def __ne__(self, other: object) -> bool:
+        return tuple(self) != other
+
+    def __lt__(self, other: tuple[Any, ...]) -> bool:
+        return tuple(self) < other
+
+    def __le__(self, other: tuple[Any, ...]) -> bool:
+        return tuple(self) <= other
+
+    def __gt__(self, other: tuple[Any, ...]) -> bool:
+        return tuple(self) > other
+
+    def __ge__(self, other: tuple[Any, ...]) -> bool:
+        return tuple(self) >= other
+
+    def __contains__(self, value: object) -> bool:
+        return value in tuple(self)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(status={self.status!r}, data={self.data!r}, "
+            f"model={self.model!r}, response={self.response!r})"
+        )
+
+
+class BirthdayAppClientCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class BirthdayAppClientResponseCacheInfo(NamedTuple):
+    hits: int
+    revalidations: int
+    misses: int
+    entries: int
+    bytes: int
+
+
+class BirthdayAppClientRetryInfo(NamedTuple):
+    retries: int
+    exhausted: int
+    throttled: int
+
+
+class BirthdayAppClientSSEReconnectInfo(NamedTuple):
+    reconnects: int
+    exhausted: int
+
+
+class BirthdayAppClientRateLimitInfo(NamedTuple):
+    calls: int
+    delayed: int
+    waited: float
+
+
+class BirthdayAppClientTiming(NamedTuple):
+    name: str
+    method: HTTPMethod
+    path: str
+    status: HTTPStatus | None
+    encode: float
+    build_request: float
+    send: float
+    read: float
+    validate: float
+
+
+class BirthdayAppClientTraceContext(NamedTuple):
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+    state: str | None = None
+
+
+class BirthdayAppClientSpan(NamedTuple):
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start: int
+    end: int
+    status: HTTPStatus | None
+
+
+class BirthdayAppClientBatchResult[Result](NamedTuple):
+    index: int
+    result: Result | None
+    error: Exception | None
+
+
 class BirthdayAppClientValidationError(BaseModel):
     loc: Sequence[str | int]
     msg: str
@@ -84,6 +284,17 @@ class BirthdayAppClientNotDefaultStatusError(Exception):
         self.result = result
 
 
+class BirthdayAppClientCircuitOpenError(Exception):
+    def __init__(self, *, method: HTTPMethod, path: str, remaining: float) -> None:
+        super().__init__(
+            f"Circuit for {method} {path} is open, failing fast for another "
+            f"{remaining:.1f} seconds."
+        )
+        self.method = method
+        self.path = path
+        self.remaining = remaining
+
+
 class BirthdayAppClientSecurityParam(NamedTuple):
     kind: Literal[
         "http_bearer",
@@ -96,38 +307,1330 @@ class BirthdayAppClientSecurityParam(NamedTuple):
     value: str | tuple[str, str] | None
 
 
+class BirthdayAppClientRouteParam(NamedTuple):
+    kind: Literal[
+        "path", "query", "header", "cookie", "body", "file", "form", "security"
+    ]
+    name: str
+    encoder: Literal["identity", "str", "isoformat", "enum", "jsonable"] = "jsonable"
+    is_sequence: bool = False
+    security_kind: (
+        Literal[
+            "http_bearer",
+            "http_basic",
+            "api_key_header",
+            "api_key_cookie",
+            "api_key_query",
+        ]
+        | None
+    ) = None
+
+
+class BirthdayAppClientRoute:
+    # Everything that only depends on the route (and not on the argument values of a
+    # call) is precomputed here once, so that calls only need to bind their values.
+    __slots__ = (
+        "adapters",
+        "body_params",
+        "cookie_params",
+        "default_status",
+        "file_params",
+        "form_params",
+        "header_params",
+        "is_body_embedded",
+        "method",
+        "models",
+        "name",
+        "params",
+        "path",
+        "path_params",
+        "path_segments",
+        "query_params",
+        "security_params",
+        "streaming_kind",
+    )
+
+    _IDENTITY_TYPES = frozenset({str, int, float, bool, type(None)})
+
+    name: str
+    path: str
+    method: HTTPMethod
+    default_status: HTTPStatus
+    models: Mapping[HTTPStatus, Any]
+    params: Sequence[BirthdayAppClientRouteParam]
+    is_body_embedded: bool
+    streaming_kind: (
+        Literal["json_lines", "server_sent_events", "raw_bytes", "raw_str"] | None
+    )
+    adapters: dict[HTTPStatus, TypeAdapter[Any]]
+    path_segments: Sequence[str]
+    path_params: Sequence[tuple[int, str, Callable[[Any], Any]]]
+    query_params: Sequence[tuple[int, str, Callable[[Any], Any]]]
+    header_params: Sequence[tuple[int, str, Callable[[Any], Any]]]
+    cookie_params: Sequence[tuple[int, str, Callable[[Any], Any]]]
+    body_params: Sequence[tuple[int, str]]
+    file_params: Sequence[tuple[int, str]]
+    form_params: Sequence[tuple[int, str]]
+    security_params: Sequence[tuple[int, str, Any]]
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        path: str,
+        method: HTTPMethod,
+        default_status: HTTPStatus,
+        models: Mapping[HTTPStatus, Any],
+        params: Sequence[BirthdayAppClientRouteParam] = (),
+        is_body_embedded: bool = False,
+        streaming_kind: Literal[
+            "json_lines", "server_sent_events", "raw_bytes", "raw_str"
+        ]
+        | None = None,
+    ) -> None:
+        layout = {
+            kind: list[tuple[int, str, Callable[[Any], Any]]]()
+            for kind in ("path", "query", "header", "cookie")
+        }
+        unencoded_layout = {
+            kind: list[tuple[int, str]]() for kind in ("body", "file", "form")
+        }
+        security_params = list[tuple[int, str, Any]]()
+        for index, param in enumerate(params):
+            if param.kind == "security":
+                security_params.append((index, param.name, param.security_kind))
+            elif param.kind in unencoded_layout:
+                unencoded_layout[param.kind].append((index, param.name))
+            else:
+                encode = self._get_encoder(param.encoder, param.is_sequence)
+                layout[param.kind].append((index, param.name, encode))
+
+        # Split "/items/{item_id}/sub" into ["/items/", "/sub"] and the index of the
+        # `item_id` value, so that binding a call is a single `str.join()`.
+        path_layout = {name: (index, encode) for index, name, encode in layout["path"]}
+        parts = split(r"\{([^{}]+)\}", path)
+        path_segments = [parts[0]]
+        path_params = list[tuple[int, str, Callable[[Any], Any]]]()
+        for param_name, segment in zip(parts[1::2], parts[2::2], strict=True):
+            if param_name in path_layout:
+                index, encode = path_layout[param_name]
+                path_params.append((index, param_name, encode))
+                path_segments.append(segment)
+            else:
+                path_segments[-1] += f"{{{param_name}}}{segment}"
+
+        init = super().__setattr__
+        init("name", name)
+        init("path", path)
+        init("method", method)
+        init("default_status", default_status)
+        init("models", models)
+        init("params", tuple(params))
+        init("is_body_embedded", is_body_embedded)
+        init("streaming_kind", streaming_kind)
+        # Filled lazily on first use of each status, see `_route_handler()`.
+        init("adapters", {})
+        init("path_segments", tuple(path_segments))
+        init("path_params", tuple(path_params))
+        init("query_params", tuple(layout["query"]))
+        init("header_params", tuple(layout["header"]))
+        init("cookie_params", tuple(layout["cookie"]))
+        init("body_params", tuple(unencoded_layout["body"]))
+        init("file_params", tuple(unencoded_layout["file"]))
+        init("form_params", tuple(unencoded_layout["form"]))
+        init("security_params", tuple(security_params))
+
+    @classmethod
+    def _get_encoder(
+        cls,
+        encoder: Literal["identity", "str", "isoformat", "enum", "jsonable"],
+        is_sequence: bool,
+    ) -> Callable[[Any], Any]:
+        # The encoder is picked by the generator from the declared parameter type, so
+        # values only go through the (slow, generic) `jsonable_encoder()` if needed.
+        encode = {
+            "identity": cls._encode_identity,
+            "str": cls._encode_str,
+            "isoformat": cls._encode_isoformat,
+            "enum": cls._encode_enum,
+            "jsonable": jsonable_encoder,
+        }[encoder]
+        if is_sequence:
+            return partial(cls._encode_sequence, encode)
+        return encode
+
+    @staticmethod
+    def _encode_identity(value: Any) -> Any:  # noqa: ANN401
+        # The encoder is picked from the declared type, but subclasses of it (e.g., a
+        # `str` enum passed for a `str` parameter) may be passed at runtime, which
+        # `jsonable_encoder()` may encode differently than `str()` does.
+        if type(value) in BirthdayAppClientRoute._IDENTITY_TYPES:
+            return value
+        return jsonable_encoder(value)
+
+    @staticmethod
+    def _encode_str(value: Any) -> Any:  # noqa: ANN401
+        return None if value is None else str(value)
+
+    @staticmethod
+    def _encode_isoformat(value: Any) -> Any:  # noqa: ANN401
+        return None if value is None else value.isoformat()
+
+    @staticmethod
+    def _encode_enum(value: Any) -> Any:  # noqa: ANN401
+        return value.value if isinstance(value, Enum) else value
+
+    @staticmethod
+    def _encode_sequence(
+        encode: Callable[[Any], Any],
+        value: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        return None if value is None else [encode(item) for item in value]
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"`{type(self).__name__}` is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"`{type(self).__name__}` is immutable.")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name}: {self.method.name} {self.path})"
+
+
 class BirthdayAppClientSSE[Data](ServerSentEvent):
     data: Data | None = None
 
 
+class BirthdayAppClientResponseCache:
+    # In-memory LRU cache of the results of `GET` / `HEAD` routes, bounded by both the
+    # number of entries and their total response size. Entries are keyed on the fully
+    # encoded request (method, URL, and headers) and stay fresh as long as the
+    # response's `Cache-Control: max-age` allows. Stale entries with an `ETag` are
+    # revalidated via `If-None-Match`, reusing the already validated result on a `304`.
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Values are (result, ETag, monotonic expiry time, size in bytes).
+        self._entries = OrderedDict[
+            tuple[str, str, tuple[tuple[str, str], ...], tuple[str, bool, str | None]],
+            tuple[BirthdayAppClientResult[HTTPStatus, Any], str | None, float, int],
+        ]()
+        self._bytes = 0
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+        # Sync clients may be used from multiple threads, e.g. via `batch()`.
+        self._lock = Lock()
+
+    def info(self) -> BirthdayAppClientResponseCacheInfo:
+        with self._lock:
+            return BirthdayAppClientResponseCacheInfo(
+                self._hits,
+                self._revalidations,
+                self._misses,
+                len(self._entries),
+                self._bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @staticmethod
+    def _is_cacheable(route: BirthdayAppClientRoute) -> bool:
+        return (
+            route.method in (HTTPMethod.GET, HTTPMethod.HEAD)
+            and route.streaming_kind is None
+        )
+
+    @staticmethod
+    def _key(
+        request: Request, options: tuple[str, bool, str | None]
+    ) -> tuple[str, str, tuple[tuple[str, str], ...], tuple[str, bool, str | None]]:
+        # Results built with different `validation`, `lazy_validation`, or `encoding`
+        # options differ, even for the same request.
+        return (
+            request.method,
+            str(request.url),
+            tuple(request.headers.multi_items()),
+            options,
+        )
+
+    @staticmethod
+    def _max_age(response: Response) -> float | None:
+        # Returns `None` if the response must not be stored.
+        max_age = 0.0
+        for directive in response.headers.get("Cache-Control", "").split(","):
+            name, _, value = directive.strip().lower().partition("=")
+            if name == "no-store":
+                return None
+            if name == "no-cache":
+                return 0.0
+            if name == "max-age" and value.strip('"').isdigit():
+                max_age = float(value.strip('"'))
+        age = response.headers.get("Age", "")
+        return max(max_age - float(age), 0.0) if age.isdigit() else max_age
+
+    def _lookup(
+        self,
+        key: tuple[str, str, tuple[tuple[str, str], ...], tuple[str, bool, str | None]],
+        request: Request,
+    ) -> BirthdayAppClientResult[HTTPStatus, Any] | None:
+        # Returns the cached result if it is still fresh. Otherwise, asks the server
+        # to revalidate it via `If-None-Match` if possible.
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            result, etag, expires, _ = entry
+            if monotonic() < expires:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return result
+        if etag is not None:
+            request.headers["If-None-Match"] = etag
+        return None
+
+    def _revalidate(
+        self,
+        key: tuple[str, str, tuple[tuple[str, str], ...], tuple[str, bool, str | None]],
+        response: Response,
+    ) -> BirthdayAppClientResult[HTTPStatus, Any] | None:
+        # Returns the cached result if `response` confirmed that it is still valid.
+        if response.status_code != HTTPStatus.NOT_MODIFIED:
+            return None
+        max_age = self._max_age(response)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            result, etag, _, size = entry
+            self._entries[key] = (result, etag, monotonic() + (max_age or 0.0), size)
+            self._entries.move_to_end(key)
+            self._revalidations += 1
+            return result
+
+    def _store(
+        self,
+        key: tuple[str, str, tuple[tuple[str, str], ...], tuple[str, bool, str | None]],
+        result: BirthdayAppClientResult[HTTPStatus, Any],
+    ) -> None:
+        response = result.response
+        max_age = self._max_age(response)
+        etag = response.headers.get("ETag")
+        size = len(response.content)
+        with self._lock:
+            self._misses += 1
+            if (
+                response.status_code != HTTPStatus.OK
+                or max_age is None
+                or (not max_age and etag is None)
+                or size > self.max_bytes
+            ):
+                return
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self._bytes -= old_entry[3]
+            self._entries[key] = (result, etag, monotonic() + max_age, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (*_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+
+class BirthdayAppClientRetryPolicy:
+    # Retries calls that failed with a transient error, i.e., a connection error, a
+    # timeout, or a response with one of `statuses`. Only calls of idempotent methods
+    # are retried, as well as `POST` / `PATCH` calls if `idempotency_key` is set,
+    # which are then sent with a random `Idempotency-Key` header that stays the same
+    # across retries. Retries are delayed by exponential backoff with full jitter or
+    # the response's `Retry-After`. The retry budget is shared by all calls like in
+    # gRPC: each failed attempt uses up a token, each successful one refunds
+    # `token_ratio` tokens, and no retries are made while at most half of
+    # `max_tokens` are left, so that retries can't multiply the load of an outage.
+    _IDEMPOTENT_METHODS = frozenset(
+        {
+            HTTPMethod.GET,
+            HTTPMethod.HEAD,
+            HTTPMethod.OPTIONS,
+            HTTPMethod.TRACE,
+            HTTPMethod.PUT,
+            HTTPMethod.DELETE,
+        }
+    )
+    _ERRORS = (NetworkError, RemoteProtocolError, TimeoutException)
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        *,
+        statuses: Collection[int] = (429, 502, 503, 504),
+        backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        max_tokens: float = 10.0,
+        token_ratio: float = 0.1,
+        idempotency_key: bool = False,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.statuses = frozenset(statuses)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self.idempotency_key = idempotency_key
+        self._tokens = max_tokens
+        self._retries = 0
+        self._exhausted = 0
+        self._throttled = 0
+        # Sync clients may be used from multiple threads, e.g. via `batch()`.
+        self._lock = Lock()
+
+    def info(self) -> BirthdayAppClientRetryInfo:
+        with self._lock:
+            return BirthdayAppClientRetryInfo(
+                self._retries,
+                self._exhausted,
+                self._throttled,
+            )
+
+    def _is_retryable(self, request: Request) -> bool:
+        if request.method in self._IDEMPOTENT_METHODS:
+            return True
+        if self.idempotency_key and request.method in (
+            HTTPMethod.POST,
+            HTTPMethod.PATCH,
+        ):
+            request.headers.setdefault("Idempotency-Key", str(uuid4()))
+            return True
+        return False
+
+    def _delay(self, attempt: int, response: Response | None) -> float | None:
+        # Returns how long to wait before retrying, or `None` to not retry. `response`
+        # is `None` if the attempt failed with one of `_ERRORS`.
+        with self._lock:
+            if response is not None and response.status_code not in self.statuses:
+                self._tokens = min(self._tokens + self.token_ratio, self.max_tokens)
+                return None
+            self._tokens = max(self._tokens - 1, 0.0)
+            if attempt + 1 >= self.max_attempts:
+                self._exhausted += 1
+                return None
+            if self._tokens <= self.max_tokens / 2:
+                self._throttled += 1
+                return None
+            delay = self._retry_after(response)
+            if delay is None:
+                max_delay = min(self.backoff * 2**attempt, self.max_backoff)
+                delay = uniform(0.0, max_delay)  # noqa: S311
+            elif delay > self.max_backoff:
+                self._exhausted += 1
+                return None
+            self._retries += 1
+            return delay
+
+    @staticmethod
+    def _retry_after(response: Response | None) -> float | None:
+        value = "" if response is None else response.headers.get("Retry-After", "")
+        if value.isdigit():
+            return float(value)
+        try:
+            date = parsedate_to_datetime(value)
+        except ValueError:
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=UTC)
+        delay = date - datetime.now(UTC)
+        return max(delay.total_seconds(), 0.0)
+
+
+class BirthdayAppClientSSEReconnectPolicy:
+    # Reconnects Server-Sent Events streams whose connection broke off (or, with
+    # `reconnect_on_close`, that the server closed), so that the events of all
+    # connections are yielded by a single iterator. Reconnects are sent with a
+    # `Last-Event-ID` header holding the last `id` received, and are delayed by the
+    # last `retry` received (in milliseconds) or otherwise by `delay` seconds. The
+    # stream ends once `max_reconnects` reconnects in a row didn't receive any events,
+    # re-raising the last error if there was one, or once a reconnect is answered with
+    # a status other than the endpoint's default status (e.g., `204 No Content`).
+    _ERRORS = (NetworkError, RemoteProtocolError, TimeoutException)
+
+    def __init__(
+        self,
+        max_reconnects: int = 5,
+        *,
+        delay: float = 3.0,
+        reconnect_on_close: bool = False,
+    ) -> None:
+        self.max_reconnects = max_reconnects
+        self.delay = delay
+        self.reconnect_on_close = reconnect_on_close
+        self._reconnects = 0
+        self._exhausted = 0
+        # Sync clients may be used from multiple threads, e.g. via `batch()`.
+        self._lock = Lock()
+
+    def info(self) -> BirthdayAppClientSSEReconnectInfo:
+        with self._lock:
+            return BirthdayAppClientSSEReconnectInfo(self._reconnects, self._exhausted)
+
+    def _delay(self, attempt: int, retry: int | None) -> float | None:
+        # Returns how long to wait before the `attempt`-th reconnect in a row (counting
+        # from 0), or `None` to end the stream.
+        with self._lock:
+            if attempt >= self.max_reconnects:
+                self._exhausted += 1
+                return None
+            self._reconnects += 1
+        return self.delay if retry is None else retry / 1000
+
+
+class BirthdayAppClientCircuitBreaker:
+    # Per-route circuit breaker. Each route's circuit is closed at first and opens once
+    # at least `failure_rate` of its last `window` calls (and at least `min_calls`)
+    # failed, i.e., raised an error, responded with a `5xx` status, or took longer than
+    # `slow_call_duration` seconds. While open, calls fail fast with a
+    # `BirthdayAppClientCircuitOpenError` without being sent. After `open_duration`
+    # seconds, the circuit is half-open and lets a single probe call through, which
+    # closes the circuit if it succeeds and opens it again otherwise.
+    def __init__(
+        self,
+        *,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        slow_call_duration: float | None = None,
+        open_duration: float = 30.0,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_calls = min_calls
+        self.slow_call_duration = slow_call_duration
+        self.open_duration = open_duration
+        # Outcomes (`True` for failures) of the last calls of closed circuits, when
+        # open circuits were opened, and half-open circuits with a probe in flight.
+        self._outcomes: dict[tuple[HTTPMethod, str], deque[bool]] = {}
+        self._opened_at: dict[tuple[HTTPMethod, str], float] = {}
+        self._probing = set[tuple[HTTPMethod, str]]()
+        # Sync clients may be used from multiple threads, e.g. via `batch()`.
+        self._lock = Lock()
+
+    def state(
+        self, method: HTTPMethod, path: str
+    ) -> Literal["closed", "open", "half_open"]:
+        with self._lock:
+            opened_at = self._opened_at.get((method, path))
+            if opened_at is None:
+                return "closed"
+            if monotonic() < opened_at + self.open_duration:
+                return "open"
+            return "half_open"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._outcomes.clear()
+            self._opened_at.clear()
+            self._probing.clear()
+
+    def _before_call(self, route: BirthdayAppClientRoute) -> None:
+        key = (route.method, route.path)
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            if opened_at is None:
+                return
+            remaining = opened_at + self.open_duration - monotonic()
+            if remaining > 0 or key in self._probing:
+                raise BirthdayAppClientCircuitOpenError(
+                    method=route.method,
+                    path=route.path,
+                    remaining=max(remaining, 0.0),
+                )
+            self._probing.add(key)
+
+    def _after_call(
+        self,
+        route: BirthdayAppClientRoute,
+        duration: float,
+        failed: bool | None,
+    ) -> None:
+        # `failed` is `None` if the call was cancelled, which says nothing about the
+        # route's health.
+        key = (route.method, route.path)
+        if self.slow_call_duration is not None and duration > self.slow_call_duration:
+            failed = True
+        with self._lock:
+            if key in self._probing:
+                self._probing.discard(key)
+                if failed:
+                    self._opened_at[key] = monotonic()
+                elif failed is not None:
+                    del self._opened_at[key]
+                return
+            if failed is None or key in self._opened_at:
+                return
+            outcomes = self._outcomes.get(key)
+            if outcomes is None:
+                outcomes = self._outcomes[key] = deque(maxlen=self.window)
+            outcomes.append(failed)
+            if len(outcomes) >= self.min_calls and sum(
+                outcomes
+            ) >= self.failure_rate * len(outcomes):
+                self._opened_at[key] = monotonic()
+                del self._outcomes[key]
+
+
+class BirthdayAppClientRateLimiter:
+    # Client-side token buckets, one shared by all calls of the client (if `rate` is
+    # set) and one per route name in `routes`, each given as `(rate, burst)`. A bucket
+    # holds up to `burst` tokens, refills at `rate` tokens per second, and each call
+    # takes one token from every bucket that applies to it. Tokens are reserved ahead
+    # of time, i.e., a bucket can go into debt, and the call is delayed until that debt
+    # is paid off. This way, concurrent callers are queued fairly without having to
+    # wake up and compete for tokens.
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float | None = None,
+        *,
+        routes: Mapping[str, tuple[float, float]] | None = None,
+    ) -> None:
+        self._limits = dict[str | None, tuple[float, float]]()
+        self._limits.update(routes or {})
+        if rate is not None:
+            self._limits[None] = (rate, max(rate, 1.0) if burst is None else burst)
+        now = monotonic()
+        # Current number of tokens and time of the last update per bucket.
+        self._buckets = {key: (limit[1], now) for key, limit in self._limits.items()}
+        # Number of calls, number of delayed calls, and seconds waited per route name.
+        self._stats = dict[str, tuple[int, int, float]]()
+        # Sync clients may be used from multiple threads, e.g. via `batch()`.
+        self._lock = Lock()
+
+    def info(self, route_name: str | None = None) -> BirthdayAppClientRateLimitInfo:
+        # Statistics of calls of the given route, or of all calls if `None`.
+        with self._lock:
+            if route_name is not None:
+                return BirthdayAppClientRateLimitInfo(
+                    *self._stats.get(route_name, (0, 0, 0.0))
+                )
+            stats = list(self._stats.values())
+            return BirthdayAppClientRateLimitInfo(
+                sum(calls for calls, _, _ in stats),
+                sum(delayed for _, delayed, _ in stats),
+                sum(waited for _, _, waited in stats),
+            )
+
+    def _reserve(self, route: BirthdayAppClientRoute) -> float:
+        # Takes a token from all applicable buckets and returns how many seconds the
+        # call has to wait for them.
+        with self._lock:
+            now = monotonic()
+            delay = 0.0
+            for key in (None, route.name):
+                limit = self._limits.get(key)
+                if limit is None:
+                    continue
+                rate, burst = limit
+                tokens, updated = self._buckets[key]
+                tokens = min(tokens + (now - updated) * rate, burst) - 1.0
+                self._buckets[key] = (tokens, now)
+                if tokens < 0:
+                    delay = max(delay, -tokens / rate)
+            calls, delayed, waited = self._stats.get(route.name, (0, 0, 0.0))
+            self._stats[route.name] = (calls + 1, delayed + (delay > 0), waited + delay)
+            return delay
+
+
+class BirthdayAppClientTracer:
+    # Propagates W3C trace context (https://www.w3.org/TR/trace-context/) without
+    # depending on OpenTelemetry. Every request sent gets a new span ID and is sent
+    # with a `traceparent` header (and `tracestate`, if given) that names it as a child
+    # of the span returned by `context`, or as the root of a new trace if `context` is
+    # `None` or returns `None`. The finished spans are kept per route name, up to
+    # `max_spans` each, and passed to `on_span` to export them elsewhere.
+    def __init__(
+        self,
+        context: Callable[[], BirthdayAppClientTraceContext | None] | None = None,
+        *,
+        on_span: Callable[[BirthdayAppClientSpan], object] | None = None,
+        max_spans: int = 100,
+    ) -> None:
+        self.context = context
+        self.on_span = on_span
+        self.max_spans = max_spans
+        self._spans = dict[str, deque[BirthdayAppClientSpan]]()
+        # Sync clients may be used from multiple threads, e.g. via `batch()`.
+        self._lock = Lock()
+
+    def spans(self, route_name: str | None = None) -> list[BirthdayAppClientSpan]:
+        # Recorded spans of the given route, or of all routes if `None`, oldest first.
+        with self._lock:
+            if route_name is not None:
+                return list(self._spans.get(route_name, ()))
+            spans = [span for spans in self._spans.values() for span in spans]
+        return sorted(spans, key=lambda span: span.start)
+
+    def _start(self, request: Request) -> tuple[str, str, str | None, int]:
+        # Returns the trace ID, span ID, parent span ID, and start time of a new span.
+        context = None if self.context is None else self.context()
+        span_id = token_hex(8)
+        if context is None:
+            trace_id, parent_id, sampled = token_hex(16), None, True
+        else:
+            trace_id, parent_id, sampled = context[:3]
+            if context.state:
+                request.headers["tracestate"] = context.state
+        request.headers["traceparent"] = (
+            f"00-{trace_id}-{span_id}-{'01' if sampled else '00'}"
+        )
+        return trace_id, span_id, parent_id, time_ns()
+
+    def _end(
+        self,
+        route: BirthdayAppClientRoute,
+        started: tuple[str, str, str | None, int],
+        status: int | None,
+    ) -> None:
+        span = BirthdayAppClientSpan(
+            route.name,
+            *started,
+            time_ns(),
+            None if status is None else HTTPStatus(status),
+        )
+        with self._lock:
+            spans = self._spans.get(route.name)
+            if spans is None:
+                spans = self._spans[route.name] = deque(maxlen=self.max_spans)
+            spans.append(span)
+        if self.on_span is not None:
+            self.on_span(span)
+
+
+class BirthdayAppClientMetrics:
+    # Aggregates metrics of the requests sent by one or more clients per route, to be
+    # rendered in the Prometheus text exposition format (`render()`) or as a `dict`
+    # (`to_dict()`). Requests are counted per response status (or `"error"` if sending
+    # them raised an exception), and their latencies until the response headers arrived
+    # go into a histogram with the upper bounds `buckets`. Request and response bodies
+    # are counted by their `Content-Length` header, as the bodies of streaming requests
+    # and responses are only read later.
+    _DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(
+        self,
+        *,
+        prefix: str = "fastapi_client",
+        buckets: Sequence[float] = _DEFAULT_BUCKETS,
+    ) -> None:
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        # All keyed by route name, with `_routes` holding each route's method and path.
+        self._routes = dict[str, tuple[HTTPMethod, str]]()
+        self._requests = dict[str, dict[str, int]]()
+        self._in_flight = dict[str, int]()
+        # Non-cumulative bucket counts, the last one for latencies above all buckets.
+        self._latency_buckets = dict[str, list[int]]()
+        self._latency_sums = dict[str, float]()
+        self._bytes_sent = dict[str, int]()
+        self._bytes_received = dict[str, int]()
+        # Sync clients may be used from multiple threads, e.g. via `batch()`.
+        self._lock = Lock()
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                name: {
+                    "method": method,
+                    "path": path,
+                    "requests": dict(self._requests[name]),
+                    "in_flight": self._in_flight[name],
+                    "latency": {
+                        "buckets": dict(
+                            zip(
+                                (*self.buckets, float("inf")),
+                                self._cumulate(self._latency_buckets[name]),
+                                strict=True,
+                            )
+                        ),
+                        "sum": self._latency_sums[name],
+                        "count": sum(self._latency_buckets[name]),
+                    },
+                    "bytes_sent": self._bytes_sent[name],
+                    "bytes_received": self._bytes_received[name],
+                }
+                for name, (method, path) in self._routes.items()
+            }
+
+    def render(self) -> str:
+        prefix = self.prefix
+        routes = self.to_dict()
+        labels = {
+            name: (
+                f'route="{self._escape(name)}",method="{route["method"]}",'
+                f'path="{self._escape(route["path"])}"'
+            )
+            for name, route in routes.items()
+        }
+
+        metric = f"{prefix}_requests_total"
+        lines = [
+            f"# HELP {metric} Requests sent, by response status.",
+            f"# TYPE {metric} counter",
+        ]
+        for name, route in routes.items():
+            for status, count in route["requests"].items():
+                lines.append(f'{metric}{{{labels[name]},status="{status}"}} {count}')
+
+        metric = f"{prefix}_requests_in_flight"
+        lines += [
+            f"# HELP {metric} Requests currently waiting for their response headers.",
+            f"# TYPE {metric} gauge",
+        ]
+        for name, route in routes.items():
+            lines.append(f"{metric}{{{labels[name]}}} {route['in_flight']}")
+
+        metric = f"{prefix}_request_duration_seconds"
+        lines += [
+            f"# HELP {metric} Time from sending a request until its response headers "
+            "arrived.",
+            f"# TYPE {metric} histogram",
+        ]
+        for name, route in routes.items():
+            latency = route["latency"]
+            for bound, count in latency["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{metric}_bucket{{{labels[name]},le="{le}"}} {count}')
+            lines.append(f"{metric}_sum{{{labels[name]}}} {latency['sum']!r}")
+            lines.append(f"{metric}_count{{{labels[name]}}} {latency['count']}")
+
+        for key, metric, help_ in (
+            ("bytes_sent", f"{prefix}_request_bytes_total", "Request body bytes sent."),
+            (
+                "bytes_received",
+                f"{prefix}_response_bytes_total",
+                "Response body bytes received.",
+            ),
+        ):
+            lines += [f"# HELP {metric} {help_}", f"# TYPE {metric} counter"]
+            for name, route in routes.items():
+                lines.append(f"{metric}{{{labels[name]}}} {route[key]}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _cumulate(counts: Iterable[int]) -> list[int]:
+        total = 0
+        cumulative = list[int]()
+        for count in counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+    @staticmethod
+    def _escape(label: str) -> str:
+        return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    def _start(self, route: BirthdayAppClientRoute) -> None:
+        name = route.name
+        with self._lock:
+            if name not in self._routes:
+                self._routes[name] = (route.method, route.path)
+                self._requests[name] = {}
+                self._in_flight[name] = 0
+                self._latency_buckets[name] = [0] * (len(self.buckets) + 1)
+                self._latency_sums[name] = 0.0
+                self._bytes_sent[name] = 0
+                self._bytes_received[name] = 0
+            self._in_flight[name] += 1
+
+    def _end(
+        self,
+        route: BirthdayAppClientRoute,
+        request: Request,
+        response: Response | None,
+        latency: float,
+    ) -> None:
+        name = route.name
+        status = "error" if response is None else str(response.status_code)
+        bytes_sent = int(request.headers.get("Content-Length", 0))
+        bytes_received = (
+            0 if response is None else int(response.headers.get("Content-Length", 0))
+        )
+        with self._lock:
+            requests = self._requests[name]
+            requests[status] = requests.get(status, 0) + 1
+            self._in_flight[name] -= 1
+            self._latency_buckets[name][bisect_left(self.buckets, latency)] += 1
+            self._latency_sums[name] += latency
+            self._bytes_sent[name] += bytes_sent
+            self._bytes_received[name] += bytes_received
+
+
+class BirthdayAppClientOptions:
+    # Runtime options of a client, passed as `options` to its constructor,
+    # `from_app()`, or `from_url()`. They are plain attributes that can be changed at
+    # any time (taking effect on the next call), and a single instance may be shared
+    # by multiple clients.
+    def __init__(
+        self,
+        *,
+        lazy_validation: bool = False,
+        validation: Literal["validate", "construct", "none"] = "validate",
+        response_cache: BirthdayAppClientResponseCache | None = None,
+        retry_policy: BirthdayAppClientRetryPolicy | None = None,
+        circuit_breaker: BirthdayAppClientCircuitBreaker | None = None,
+        rate_limiter: BirthdayAppClientRateLimiter | None = None,
+        timing_hook: Callable[[BirthdayAppClientTiming], object] | None = None,
+        tracer: BirthdayAppClientTracer | None = None,
+        metrics: BirthdayAppClientMetrics | None = None,
+        validation_executor: Executor | None = None,
+        validation_window: int = 64,
+        sse_reconnect_policy: BirthdayAppClientSSEReconnectPolicy | None = None,
+    ) -> None:
+        if validation_window < 1:
+            raise ValueError("Validation window must be at least 1.")
+        self.lazy_validation = lazy_validation
+        self.validation = validation
+        self.response_cache = response_cache
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+        self.timing_hook = timing_hook
+        self.tracer = tracer
+        self.metrics = metrics
+        self.validation_executor = validation_executor
+        self.validation_window = validation_window
+        self.sse_reconnect_policy = sse_reconnect_policy
+
+
 BIRTHDAY_APP_CLIENT_NOT_REQUIRED: Any = ...
 
 
+_REGISTER_BIRTHDAY_ROUTE = BirthdayAppClientRoute(
+    name="register_birthday",
+    path="/birthday",
+    method=HTTPMethod.POST,
+    default_status=HTTPStatus.CREATED,
+    models={
+        HTTPStatus.CREATED: bool,
+        HTTPStatus.UNPROCESSABLE_CONTENT: BirthdayAppClientHTTPValidationError,
+    },
+    params=(BirthdayAppClientRouteParam("body", "data"),),
+)
+
+_GET_BIRTHDAY_ROUTE = BirthdayAppClientRoute(
+    name="get_birthday",
+    path="/birthday/{name}",
+    method=HTTPMethod.GET,
+    default_status=HTTPStatus.OK,
+    models={
+        HTTPStatus.OK: BirthdayData,
+        HTTPStatus.NOT_FOUND: GetBirthdayError,
+        HTTPStatus.UNPROCESSABLE_CONTENT: BirthdayAppClientHTTPValidationError,
+    },
+    params=(BirthdayAppClientRouteParam("path", "name", "identity"),),
+)
+
+
 class BirthdayAppClient:
-    def __init__(self, client: Client) -> None:
+    # Key of the `httpx2.Request` extension that `_send_request()` appends the time
+    # the response headers arrived to, see `_timed_result()`.
+    _HEADERS_RECEIVED = "fastapi_typed_client.headers_received"
+    # Key of the `httpx2.Response` extension that `_build_result()` records the
+    # streaming kind of the route in, see `batched()` and `iter_columns()`.
+    _STREAMING_KIND = "fastapi_typed_client.streaming_kind"
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        options: BirthdayAppClientOptions | None = None,
+    ) -> None:
         self.client = client
+        self._options = BirthdayAppClientOptions() if options is None else options
+        # Scuffed isinstance() check because we don't want to import
+        # starlette.testclient.Testclient for users that don't need it.
+        self._is_starlette_test_client = (
+            client.__class__.__name__ == "TestClient"
+            and client.__class__.__module__ == "starlette.testclient"
+        )
 
     @classmethod
     @contextmanager
     def from_app(
-        cls, app: FastAPI, base_url: str = "http://testserver"
+        cls,
+        app: FastAPI,
+        base_url: str = "http://testserver",
+        *,
+        options: BirthdayAppClientOptions | None = None,
     ) -> Iterator[Self]:
         from fastapi.testclient import TestClient
 
         with TestClient(app, base_url=base_url) as client:
-            yield cls(client)
+            yield cls(client, options=options)
+
+    @classmethod
+    @contextmanager
+    def from_url(
+        cls,
+        base_url: str,
+        *,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 100,
+        keepalive_expiry: float | None = 4.0,
+        http2: bool = False,
+        timeout: float | None = 10.0,
+        connect_timeout: float | None = 2.0,
+        preconnect: int = 0,
+        options: BirthdayAppClientOptions | None = None,
+    ) -> Iterator[Self]:
+        # Unlike httpx's defaults (which keep only 20 of 100 connections alive), keep
+        # all pooled connections alive, so that concurrent calls don't keep opening and
+        # closing connections. Idle connections are dropped just before uvicorn's
+        # default keep-alive timeout of 5 seconds, to not reuse connections the server
+        # is about to close.
+        with Client(
+            base_url=base_url,
+            limits=Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
+            timeout=Timeout(timeout, connect=connect_timeout),
+        ) as client:
+            # Opens `preconnect` keep-alive connections in advance by sending
+            # concurrent `HEAD` requests, so that the first calls don't pay for
+            # connection setup. The responses' status codes are irrelevant.
+            if preconnect > 0:
+                with ThreadPoolExecutor(preconnect) as executor:
+                    for _ in executor.map(client.head, ["/"] * preconnect):
+                        pass
+            yield cls(client, options=options)
+
+    @classmethod
+    def type_adapter_cache_info(cls) -> BirthdayAppClientCacheInfo:
+        hits, misses, maxsize, currsize = cls._cached_type_adapter.cache_info()
+        return BirthdayAppClientCacheInfo(hits, misses, maxsize or 0, currsize)
+
+    def batch[Result](
+        self,
+        method: Callable[..., Result],
+        kwargs_iterable: Iterable[Mapping[str, Any]],
+        *,
+        max_workers: int = 16,
+        ordered: bool = False,
+    ) -> Iterator[BirthdayAppClientBatchResult[Result]]:
+        # Calls `method(**kwargs)` for each item of `kwargs_iterable` in a thread pool,
+        # whose threads share the connection pool of `self.client`. Inputs are consumed
+        # lazily and at most `max_workers` calls are in flight at any time, so neither
+        # the inputs nor the results are ever fully materialized.
+        if max_workers < 1:
+            raise ValueError("Batch max_workers must be at least 1.")
+        executor = ThreadPoolExecutor(max_workers)
+        submit = partial(executor.submit, self._batch_call, method)
+        calls = enumerate(kwargs_iterable)
+        pending = deque(submit(*call) for call in islice(calls, max_workers))
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    done = [future for future in pending if future in finished]
+                    pending = deque(
+                        future for future in pending if future not in finished
+                    )
+                # Refill the window before yielding so the workers stay busy while
+                # the caller handles the results.
+                pending.extend(submit(*call) for call in islice(calls, len(done)))
+                for future in done:
+                    yield future.result()
+        finally:
+            # Drops calls not yet started if the results weren't fully consumed.
+            executor.shutdown(cancel_futures=True)
 
     @staticmethod
-    def _filter_and_encode_params(
-        params: Mapping[str, Any] | None,
-    ) -> dict[str, Any] | None:
-        if params is None:
+    def _batch_call[Result](
+        method: Callable[..., Result],
+        index: int,
+        kwargs: Mapping[str, Any],
+    ) -> BirthdayAppClientBatchResult[Result]:
+        try:
+            return BirthdayAppClientBatchResult(index, method(**kwargs), None)
+        except Exception as error:  # noqa: BLE001
+            return BirthdayAppClientBatchResult(index, None, error)
+
+    def batched[Model](
+        self,
+        result: BirthdayAppClientResult[Any, Iterator[Model]],
+        size: int = 100,
+        *,
+        window: float | None = None,
+        validation: Literal["validate", "construct", "none"] | None = None,
+    ) -> Iterator[list[Model]]:
+        # Yields the items of a JSON Lines `result` in lists of `size` items, instead
+        # of one by one. The lines of each batch are joined into a JSON array and
+        # validated in a single call against a `list` of the item model. With a
+        # `window`, the items received so far are also yielded every `window` seconds
+        # (checked whenever a chunk of the stream arrives), so that slow streams still
+        # make progress. `result.data` must not have been iterated.
+        if size < 1:
+            raise ValueError("Batched size must be at least 1.")
+        if result.response.extensions.get(self._STREAMING_KIND) != "json_lines":
+            raise TypeError("Only the results of JSON Lines endpoints can be batched.")
+        model = list[result.model]
+        validate_json = self._json_validator(
+            model,
+            self._type_adapter(model),
+            self._options.validation if validation is None else validation,
+        )
+        return self._close_response_after(
+            result.response,
+            self._iter_json_lines_batches(result.response, validate_json, size, window),
+        )
+
+    def iter_columns(
+        self,
+        result: BirthdayAppClientResult[Any, Iterator[Any]],
+        fields: Sequence[str],
+        *,
+        chunk_size: int = 65536,
+    ) -> Iterator[dict[str, array[Any] | list[Any]]]:
+        # Yields the `fields` of the items of a JSON Lines `result` as columns, one
+        # `dict` of columns per `chunk_size` items, without building the item models.
+        # Only the selected fields are validated, against their annotations and
+        # constraints (but not the model's validators). `int`, `float`, and `bool`
+        # fields are collected in an `array`, which NumPy can wrap without copying,
+        # all others in a `list`. `result.data` must not have been iterated.
+        if chunk_size < 1:
+            raise ValueError("Columns chunk_size must be at least 1.")
+        if result.response.extensions.get(self._STREAMING_KIND) != "json_lines":
+            raise TypeError("Only the results of JSON Lines endpoints have columns.")
+        adapter, columns = self._columns_adapter(result.model, tuple(fields))
+        return self._close_response_after(
+            result.response,
+            self._iter_columns(
+                result.response, adapter.validate_json, columns, chunk_size
+            ),
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _columns_adapter(
+        model: Any,  # noqa: ANN401
+        fields: tuple[str, ...],
+    ) -> tuple[TypeAdapter[Any], tuple[tuple[str, str, str | None, Any], ...]]:
+        # Builds a `TypedDict` of only the selected fields, keyed like the JSON, to
+        # validate the rows against. Each column is described by its field name, JSON
+        # key, `array` type code (or `None` for a `list`), and default value for rows
+        # without the key.
+        if not (isinstance(model, type) and issubclass(model, BaseModel)):
+            raise TypeError("Columns can only be read from streams of Pydantic models.")
+        typecodes: dict[Any, str] = {int: "q", float: "d", bool: "b"}
+        keys = dict[str, Any]()
+        columns = list[tuple[str, str, str | None, Any]]()
+        for name in fields:
+            field = model.model_fields.get(name)
+            if field is None:
+                raise ValueError(f"{model.__name__} has no field {name!r}.")
+            key = field.alias or name
+            if isinstance(field.validation_alias, str):
+                key = field.validation_alias
+            annotation = field.annotation
+            if field.metadata:
+                annotation = Annotated[annotation, *field.metadata]
+            if field.is_required():
+                keys[key] = annotation
+                default = None
+            else:
+                keys[key] = NotRequired[annotation]  # type: ignore[invalid-annotation]
+                default = field.get_default(call_default_factory=True)
+            columns.append((name, key, typecodes.get(field.annotation), default))
+        row = TypedDict(f"{model.__name__}Columns", keys)  # type: ignore[invalid-argument]
+        return TypeAdapter(list[row]), tuple(columns)
+
+    @classmethod
+    def _type_adapter(cls, model: Any) -> TypeAdapter[Any]:  # noqa: ANN401
+        try:
+            hash(model)
+        except TypeError:
+            # E.g. `Annotated` with unhashable metadata, can't be cached.
+            return TypeAdapter(model)
+        return cls._cached_type_adapter(model)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _cached_type_adapter(model: Any) -> TypeAdapter[Any]:  # noqa: ANN401
+        # Building a `TypeAdapter` compiles the model's core schema, which is far
+        # more expensive than the validation itself for small responses.
+        return TypeAdapter(model)
+
+    @classmethod
+    def _json_validator(
+        cls,
+        model: Any,  # noqa: ANN401
+        adapter: TypeAdapter[Any],
+        validation: Literal["validate", "construct", "none"],
+    ) -> Callable[[str | bytes], Any]:
+        if validation == "validate":
+            return adapter.validate_json
+        if validation == "none":
+            return from_json
+        return partial(cls._construct_json, cls._constructor(model))
+
+    @staticmethod
+    def _construct_json(
+        construct: Callable[[Any], Any] | None, content: str | bytes
+    ) -> Any:  # noqa: ANN401
+        data = from_json(content)
+        return data if construct is None else construct(data)
+
+    @classmethod
+    def _constructor(cls, model: Any) -> Callable[[Any], Any] | None:  # noqa: ANN401
+        try:
+            hash(model)
+        except TypeError:
             return None
+        return cls._cached_constructor(model)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _cached_constructor(model: Any) -> Callable[[Any], Any] | None:  # noqa: ANN401
+        # Mirrors `model` to build the Pydantic models in parsed JSON via
+        # `model_construct()`, i.e. without any validation. Values of all other types
+        # are left as parsed. Returns `None` if there is nothing to construct.
+        origin, args = get_origin(model), get_args(model)
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            return partial(BirthdayAppClient._construct_model, model, [])
+        if origin is Annotated:
+            return BirthdayAppClient._constructor(args[0])
+        if origin is Union or origin is UnionType:
+            # Without validating, we can only tell which member to construct if
+            # there is a single one apart from `None`.
+            args = tuple(arg for arg in args if arg is not type(None))
+            return BirthdayAppClient._constructor(args[0]) if len(args) == 1 else None
+        if isinstance(origin, type) and issubclass(origin, Mapping) and args:
+            construct = BirthdayAppClient._constructor(args[-1])
+            if construct is not None:
+                return partial(BirthdayAppClient._construct_mapping, construct)
+        elif origin is tuple and args and args[-1] is not Ellipsis:
+            # Fixed-length tuples are constructed position by position.
+            constructs = tuple(BirthdayAppClient._constructor(arg) for arg in args)
+            if any(construct is not None for construct in constructs):
+                return partial(BirthdayAppClient._construct_tuple, constructs)
+        elif isinstance(origin, type) and issubclass(origin, Sequence) and args:
+            construct = BirthdayAppClient._constructor(args[0])
+            if construct is not None:
+                return partial(BirthdayAppClient._construct_sequence, construct)
+        return None
+
+    @staticmethod
+    def _construct_model(
+        model: type[BaseModel],
+        resolved: list[tuple[tuple[str, Callable[[Any], Any]], ...]],
+        data: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        if not isinstance(data, dict):
+            return data
+        if not resolved:
+            # Resolved on first use, so that self-referencing models don't recurse.
+            resolved.append(
+                tuple(
+                    (field.alias or name, construct)
+                    for name, field in model.__pydantic_fields__.items()
+                    if (construct := BirthdayAppClient._constructor(field.annotation))
+                )
+            )
+        for key, construct in resolved[0]:
+            if key in data:
+                data[key] = construct(data[key])
+        return model.model_construct(**data)
+
+    @staticmethod
+    def _construct_mapping(
+        construct: Callable[[Any], Any],
+        data: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        if not isinstance(data, dict):
+            return data
+        return {key: construct(value) for key, value in data.items()}
+
+    @staticmethod
+    def _construct_sequence(
+        construct: Callable[[Any], Any],
+        data: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        if not isinstance(data, list):
+            return data
+        return [construct(item) for item in data]
+
+    @staticmethod
+    def _construct_tuple(
+        constructs: tuple[Callable[[Any], Any] | None, ...],
+        data: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        if not isinstance(data, list) or len(data) != len(constructs):
+            return data
+        return [
+            item if construct is None else construct(item)
+            for construct, item in zip(constructs, data, strict=True)
+        ]
+
+    @staticmethod
+    def _encode_params(
+        params: Sequence[tuple[int, str, Callable[[Any], Any]]],
+        values: Sequence[Any],
+    ) -> dict[str, Any]:
         return {
-            param: jsonable_encoder(value)
-            for param, value in params.items()
-            if value is not BIRTHDAY_APP_CLIENT_NOT_REQUIRED
-        } or None
+            name: encode(values[index])
+            for index, name, encode in params
+            if values[index] is not BIRTHDAY_APP_CLIENT_NOT_REQUIRED
+        }
+
+    @classmethod
+    def _encode_body(
+        cls, route: BirthdayAppClientRoute, values: Sequence[Any]
+    ) -> bytes | None:
+        body = {
+            name: values[index]
+            for index, name in route.body_params
+            if values[index] is not BIRTHDAY_APP_CLIENT_NOT_REQUIRED
+        }
+        if not body:
+            return None
+        if route.is_body_embedded:
+            return cls._type_adapter(Any).dump_json(body, by_alias=True)
+        value = next(iter(body.values()))
+        if value is None:
+            return None
+        # Pydantic serializes models (and everything inside them) straight to JSON
+        # bytes, instead of `jsonable_encoder()` building an intermediate dict that
+        # httpx2 then has to `json.dumps()` again.
+        return cls._type_adapter(Any).dump_json(value, by_alias=True)
+
+    @staticmethod
+    def _build_url(route: BirthdayAppClientRoute, values: Sequence[Any]) -> str:
+        segments = route.path_segments
+        if len(segments) == 1:
+            return segments[0]
+        parts = [segments[0]]
+        for (index, name, encode), segment in zip(
+            route.path_params, segments[1:], strict=True
+        ):
+            value = values[index]
+            if value is BIRTHDAY_APP_CLIENT_NOT_REQUIRED:
+                parts.append(f"{{{name}}}")
+            else:
+                value = encode(value)
+                parts.append(
+                    f"{value:0.20f}".rstrip("0").rstrip(".")
+                    if isinstance(value, float)
+                    else str(value)
+                )
+            parts.append(segment)
+        return "".join(parts)
 
     @staticmethod
     def _build_file_params(
@@ -206,43 +1709,255 @@ class BirthdayAppClient:
 
     def _route_handler(
         self,
+        route: BirthdayAppClientRoute,
+        values: Sequence[Any],
         *,
-        path: str,
-        method: HTTPMethod,
-        default_status: HTTPStatus,
-        models: Mapping[HTTPStatus, Any],
-        path_params: Mapping[str, Any] | None = None,
-        query_params: Mapping[str, Any] | None = None,
-        header_params: Mapping[str, Any] | None = None,
-        cookie_params: Mapping[str, Any] | None = None,
-        body_params: Mapping[str, Any] | None = None,
-        file_params: Mapping[str, Any] | None = None,
-        form_params: Mapping[str, Any] | None = None,
-        security_params: Sequence[BirthdayAppClientSecurityParam] | None = None,
-        is_body_embedded: bool = False,
-        streaming_kind: Literal[
-            "json_lines", "server_sent_events", "raw_bytes", "raw_str"
-        ]
-        | None = None,
         raise_if_not_default_status: bool = False,
         client_exts: BirthdayAppClientExtensions | None = None,
     ) -> BirthdayAppClientResult[HTTPStatus, Any]:
         if not client_exts:
             client_exts = {}
 
-        url = path
-        for param, value in (self._filter_and_encode_params(path_params) or {}).items():
-            value_str = (
-                f"{value:0.20f}".rstrip("0").rstrip(".")
-                if isinstance(value, float)
-                else str(value)
+        if self._options.timing_hook is not None:
+            result = self._timed_result(
+                self._options.timing_hook, route, values, client_exts
             )
-            url = url.replace(f"{{{param}}}", value_str)
+        else:
+            request = self._build_request(route, values, client_exts)
+            cache = self._options.response_cache
+            if cache is not None and cache._is_cacheable(route):  # noqa: SLF001
+                result = self._cached_result(cache, route, request, client_exts)
+            else:
+                response = self._send(
+                    route,
+                    request,
+                    client_exts,
+                    stream=route.streaming_kind is not None,
+                )
+                result = self._build_result(route, response, client_exts)
+        if result.status != route.default_status and raise_if_not_default_status:
+            raise BirthdayAppClientNotDefaultStatusError(
+                default_status=route.default_status, result=result
+            )
+        return result
+
+    def _timed_result(
+        self,
+        hook: Callable[[BirthdayAppClientTiming], object],
+        route: BirthdayAppClientRoute,
+        values: Sequence[Any],
+        client_exts: BirthdayAppClientExtensions,
+    ) -> BirthdayAppClientResult[HTTPStatus, Any]:
+        # Same as the untimed path of `_route_handler()`, except that `_send_request()`
+        # records when the response headers arrived, so that waiting for them and
+        # downloading the body can be told apart.
+        marks = [monotonic()]
+        try:
+            request = self._build_request(route, values, client_exts, marks)
+            marks.append(monotonic())
+            cache = self._options.response_cache
+            if cache is not None and cache._is_cacheable(route):  # noqa: SLF001
+                # Whether the cache sends a request is up to it, so all of its time
+                # counts as sending.
+                result = self._cached_result(cache, route, request, client_exts)
+            else:
+                received = list[float]()
+                request.extensions[self._HEADERS_RECEIVED] = received
+                response = self._send(
+                    route,
+                    request,
+                    client_exts,
+                    stream=route.streaming_kind is not None,
+                )
+                marks.append(received[-1] if received else monotonic())
+                # Streaming responses are read while iterating over their data.
+                marks.append(monotonic() if route.streaming_kind is None else marks[-1])
+                result = self._build_result(route, response, client_exts)
+        except BaseException:
+            # An error of the hook must not replace the one of the call.
+            with suppress(Exception):
+                hook(self._timing(route, None, marks))
+            raise
+        hook(self._timing(route, result.status, marks))
+        return result
+
+    @staticmethod
+    def _timing(
+        route: BirthdayAppClientRoute, status: HTTPStatus | None, marks: list[float]
+    ) -> BirthdayAppClientTiming:
+        # The phase that raised an error (if any) lasted until now, and all later ones
+        # were skipped.
+        marks += [monotonic()] * (6 - len(marks))
+        return BirthdayAppClientTiming(
+            route.name,
+            route.method,
+            route.path,
+            status,
+            marks[1] - marks[0],
+            marks[2] - marks[1],
+            marks[3] - marks[2],
+            marks[4] - marks[3],
+            marks[5] - marks[4],
+        )
 
-        headers = self._filter_and_encode_params(header_params) or {}
-        cookies = self._filter_and_encode_params(cookie_params) or {}
-        queries = self._filter_and_encode_params(query_params) or {}
-        self._apply_security_params(security_params, headers, cookies, queries)
+    def _result_options(
+        self, client_exts: BirthdayAppClientExtensions
+    ) -> tuple[str, bool, str | None]:
+        # The options `_build_result()` depends on, so results are only shared between
+        # calls agreeing on them.
+        return (
+            client_exts.get("validation", self._options.validation),
+            client_exts.get("lazy_validation", self._options.lazy_validation),
+            client_exts.get("encoding"),
+        )
+
+    def _cached_result(
+        self,
+        cache: BirthdayAppClientResponseCache,
+        route: BirthdayAppClientRoute,
+        request: Request,
+        client_exts: BirthdayAppClientExtensions,
+    ) -> BirthdayAppClientResult[HTTPStatus, Any]:
+        key = cache._key(request, self._result_options(client_exts))  # noqa: SLF001
+        result = cache._lookup(key, request)  # noqa: SLF001
+        if result is not None:
+            return result
+        response = self._send(route, request, client_exts)
+        result = cache._revalidate(key, response)  # noqa: SLF001
+        if result is not None:
+            return result
+        result = self._build_result(route, response, client_exts)
+        cache._store(key, result)  # noqa: SLF001
+        return result
+
+    def _send(
+        self,
+        route: BirthdayAppClientRoute,
+        request: Request,
+        client_exts: BirthdayAppClientExtensions,
+        *,
+        stream: bool = False,
+    ) -> Response:
+        policy = client_exts.get("retry_policy", self._options.retry_policy)
+        if policy is None or not policy._is_retryable(request):  # noqa: SLF001
+            return self._send_attempt(route, request, stream=stream)
+        attempt = 0
+        while True:
+            try:
+                response = self._send_attempt(route, request, stream=stream)
+            except policy._ERRORS:  # noqa: SLF001
+                delay = policy._delay(attempt, None)  # noqa: SLF001
+                if delay is None:
+                    raise
+            else:
+                delay = policy._delay(attempt, response)  # noqa: SLF001
+                if delay is None:
+                    return response
+                response.close()
+            sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _wait_for_rate_limit(
+        limiter: BirthdayAppClientRateLimiter, route: BirthdayAppClientRoute
+    ) -> None:
+        delay = limiter._reserve(route)  # noqa: SLF001
+        if delay > 0:
+            sleep(delay)
+
+    def _send_attempt(
+        self,
+        route: BirthdayAppClientRoute,
+        request: Request,
+        *,
+        stream: bool,
+    ) -> Response:
+        options = self._options
+        if options.rate_limiter is not None:
+            self._wait_for_rate_limit(options.rate_limiter, route)
+        breaker = options.circuit_breaker
+        tracer = options.tracer
+        metrics = options.metrics
+        if breaker is None and tracer is None and metrics is None:
+            return self._send_request(request, stream=stream)
+        if breaker is not None:
+            breaker._before_call(route)  # noqa: SLF001
+        span = None if tracer is None else tracer._start(request)  # noqa: SLF001
+        if metrics is not None:
+            metrics._start(route)  # noqa: SLF001
+        start = monotonic()
+        response = None
+        failed = None
+        try:
+            response = self._send_request(request, stream=stream)
+            failed = response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._after_send(
+                route, request, response, monotonic() - start, failed, span
+            )
+        return response
+
+    def _send_request(self, request: Request, *, stream: bool) -> Response:
+        # For timed calls, the body is read separately (just like `Client.send()`
+        # does without `stream`), so that the time the response headers arrived can be
+        # appended to the list in the request's extensions. With retries, the last
+        # attempt's time counts.
+        received = request.extensions.get(self._HEADERS_RECEIVED)
+        if received is None:
+            return self.client.send(request, stream=stream)
+        response = self.client.send(request, stream=True)
+        received.append(monotonic())
+        if not stream:
+            try:
+                response.read()
+            except BaseException:
+                response.close()
+                raise
+        return response
+
+    def _after_send(
+        self,
+        route: BirthdayAppClientRoute,
+        request: Request,
+        response: Response | None,
+        duration: float,
+        failed: bool | None,
+        span: tuple[str, str, str | None, int] | None,
+    ) -> None:
+        options = self._options
+        if options.circuit_breaker is not None:
+            options.circuit_breaker._after_call(route, duration, failed)  # noqa: SLF001
+        if options.tracer is not None and span is not None:
+            status = None if response is None else response.status_code
+            options.tracer._end(route, span, status)  # noqa: SLF001
+        if options.metrics is not None:
+            options.metrics._end(route, request, response, duration)  # noqa: SLF001
+
+    def _build_request(
+        self,
+        route: BirthdayAppClientRoute,
+        values: Sequence[Any],
+        client_exts: BirthdayAppClientExtensions,
+        marks: list[float] | None = None,
+    ) -> Request:
+        # If given, the time when encoding is done is appended to `marks`.
+        url = self._build_url(route, values)
+        headers = self._encode_params(route.header_params, values)
+        cookies = self._encode_params(route.cookie_params, values)
+        queries = self._encode_params(route.query_params, values)
+        if route.security_params:
+            self._apply_security_params(
+                [
+                    BirthdayAppClientSecurityParam(kind, name, values[index])
+                    for index, name, kind in route.security_params
+                ],
+                headers,
+                cookies,
+                queries,
+            )
         if cookies:
             # Mirror httpx2's per-request-cookies DeprecationWarning ourselves
             # (we bypass `Client.request()` via `build_request` + `send`).
@@ -251,83 +1966,178 @@ class BirthdayAppClient:
                 "persistence behaviour is ambiguous. Set cookies on the client"
                 "instead.",
                 DeprecationWarning,
-                stacklevel=3,
+                stacklevel=4,
             )
 
         timeout = client_exts.get("timeout", USE_CLIENT_DEFAULT)
-        # Scuffed isinstance() check because we don't want to import
-        # starlette.testclient.Testclient for users that don't need it.
-        if (
-            self.client.__class__.__name__ == "TestClient"
-            and self.client.__class__.__module__ == "starlette.testclient"
-            and timeout is not USE_CLIENT_DEFAULT
-        ):
+        if timeout is not USE_CLIENT_DEFAULT and self._is_starlette_test_client:
             warn(
                 "Starlette's TestClient (which you probably use via "
                 f"{self.__class__.__name__}.from_app()) does not support timeouts. See "
                 "https://github.com/Kludex/starlette/issues/1108 for more information.",
                 DeprecationWarning,
-                stacklevel=3,
+                stacklevel=4,
             )
             timeout = USE_CLIENT_DEFAULT  # Hide the warning generated by Starlette.
 
-        files = self._build_file_params(file_params)
-        form = self._build_form_params(form_params)
-        if files is not None or form is not None:
-            request = self.client.build_request(
-                method.name,
-                url,
-                params=queries or None,
-                headers=headers or None,
-                cookies=cookies or None,
-                data=form,
-                files=files,
-                timeout=timeout,
+        if route.file_params or route.form_params:
+            content = None
+            data = self._build_form_params(
+                {name: values[index] for index, name in route.form_params}
             )
-        else:
-            body = self._filter_and_encode_params(body_params)
-            if body and not is_body_embedded:
-                body = next(iter(body.values()))
-            request = self.client.build_request(
-                method.name,
-                url,
-                params=queries or None,
-                headers=headers or None,
-                cookies=cookies or None,
-                json=body,
-                timeout=timeout,
+            files = self._build_file_params(
+                {name: values[index] for index, name in route.file_params}
             )
+        else:
+            content = self._encode_body(route, values)
+            data = files = None
+            if content is not None:
+                headers.setdefault("Content-Type", "application/json")
+        if marks is not None:
+            marks.append(monotonic())
+        return self.client.build_request(
+            route.method.name,
+            url,
+            params=queries or None,
+            headers=headers or None,
+            cookies=cookies or None,
+            content=content,
+            data=data,
+            files=files,
+            timeout=timeout,
+        )
 
-        response = self.client.send(request, stream=streaming_kind is not None)
+    def _build_result(
+        self,
+        route: BirthdayAppClientRoute,
+        response: Response,
+        client_exts: BirthdayAppClientExtensions,
+    ) -> BirthdayAppClientResult[HTTPStatus, Any]:
+        streaming_kind = route.streaming_kind
         status = HTTPStatus(response.status_code)
+        if "encoding" in client_exts:
+            response.encoding = client_exts["encoding"]
 
-        model = models[status]
-        if streaming_kind is not None and status == default_status:
-            data = self._build_streaming_data(streaming_kind, response, model)
+        model = route.models[status]
+        adapter = route.adapters.get(status)
+        if adapter is None:
+            adapter = route.adapters[status] = self._type_adapter(model)
+        validation = client_exts.get("validation", self._options.validation)
+        validate_json = self._json_validator(model, adapter, validation)
+        if streaming_kind is not None and status == route.default_status:
+            response.extensions[self._STREAMING_KIND] = streaming_kind
+            build_data = partial(
+                self._build_streaming_data,
+                streaming_kind,
+                model=model,
+                validate_json=validate_json,
+                validation=validation,
+                executor=client_exts.get(
+                    "validation_executor", self._options.validation_executor
+                ),
+                window=self._options.validation_window,
+            )
+            policy = client_exts.get(
+                "sse_reconnect_policy", self._options.sse_reconnect_policy
+            )
+            if policy is not None and streaming_kind == "server_sent_events":
+                data = self._reconnect_sse(
+                    route, response, client_exts, policy, build_data
+                )
+            else:
+                data = build_data(response)
         elif streaming_kind is not None:
             # Streaming endpoint returned a non-default status (typically a JSON
             # error body). Drain it, then release the stream-mode response.
             try:
-                text = "".join(response.iter_text())
+                content = response.read()
             finally:
                 response.close()
-            data = TypeAdapter(model).validate_json(text or "null")
+            data = validate_json(content or b"null")
         else:
+            # Validate from the raw bytes, Pydantic doesn't need them decoded to `str`.
             # An empty body (e.g. 204 NO_CONTENT) is treated as JSON `null` so the
-            # declared model still validatess.
-            data = TypeAdapter(model).validate_json(response.text or "null")
+            # declared model still validates.
+            content = response.content or b"null"
+            if client_exts.get("lazy_validation", self._options.lazy_validation):
+                return BirthdayAppClientLazyResult(
+                    status=status,
+                    validate=partial(validate_json, content),
+                    model=model,
+                    response=response,
+                )
+            data = validate_json(content)
 
-        result = BirthdayAppClientResult(
+        return BirthdayAppClientResult(
             status=status,
             data=data,
             model=model,
             response=response,
         )
-        if status != default_status and raise_if_not_default_status:
-            raise BirthdayAppClientNotDefaultStatusError(
-                default_status=default_status, result=result
-            )
-        return result
+
+    def _reconnect_sse(
+        self,
+        route: BirthdayAppClientRoute,
+        response: Response,
+        client_exts: BirthdayAppClientExtensions,
+        policy: BirthdayAppClientSSEReconnectPolicy,
+        build_events: Callable[[Response], Iterator[Any]],
+    ) -> Iterator[Any]:
+        # Yields the events of `response` and then of the reconnects that `policy`
+        # allows, which resend its request. `current` is `None` while the last
+        # reconnect failed to be sent.
+        request = response.request
+        current: Response | None = response
+        last_id: str | None = None
+        retry: int | None = None
+        error: Exception | None = None
+        attempt = 0
+        while True:
+            if current is not None:
+                error = None
+                try:
+                    for event in build_events(current):
+                        attempt = 0
+                        last_id, retry = self._track_sse_event(event, last_id, retry)
+                        yield event
+                except policy._ERRORS as exc:  # noqa: SLF001
+                    error = exc
+                finally:
+                    current.close()
+                if error is None and not policy.reconnect_on_close:
+                    return
+            delay = policy._delay(attempt, retry)  # noqa: SLF001
+            if delay is None:
+                if error is not None:
+                    raise error
+                return
+            sleep(delay)
+            attempt += 1
+            self._set_last_event_id(request, last_id)
+            try:
+                current = self._send(route, request, client_exts, stream=True)
+            except policy._ERRORS as exc:  # noqa: SLF001
+                current, error = None, exc
+                continue
+            if current.status_code != route.default_status:
+                current.close()
+                return
+
+    @staticmethod
+    def _track_sse_event(
+        event: BirthdayAppClientSSE[Any], last_id: str | None, retry: int | None
+    ) -> tuple[str | None, int | None]:
+        return (
+            last_id if event.id is None else event.id,
+            retry if event.retry is None else event.retry,
+        )
+
+    @staticmethod
+    def _set_last_event_id(request: Request, last_id: str | None) -> None:
+        # Per the spec, an empty `id` resets the last event ID.
+        request.headers.pop("Last-Event-ID", None)
+        if last_id:
+            request.headers["Last-Event-ID"] = last_id
 
     @classmethod
     def _build_streaming_data(
@@ -337,16 +2147,123 @@ class BirthdayAppClient:
         ],
         response: Response,
         model: Any,  # noqa: ANN401
+        validate_json: Callable[[str | bytes], Any],
+        validation: Literal["validate", "construct", "none"],
+        executor: Executor | None = None,
+        window: int = 1,
     ) -> Iterator[Any]:
         if streaming_kind == "raw_bytes":
             return cls._close_response_after(response, response.iter_bytes())
         if streaming_kind == "raw_str":
             return cls._close_response_after(response, response.iter_text())
+        if executor is not None:
+            return cls._close_response_after(
+                response,
+                cls._validate_in_executor(
+                    streaming_kind, response, model, validation, executor, window
+                ),
+            )
         if streaming_kind == "json_lines":
             return cls._close_response_after(
-                response, cls._iter_json_lines(response, model)
+                response, cls._iter_json_lines(response, validate_json)
+            )
+        return cls._close_response_after(
+            response, cls._iter_sse(response, model, validate_json, validation)
+        )
+
+    @classmethod
+    def _validate_in_executor(
+        cls,
+        streaming_kind: Literal["json_lines", "server_sent_events"],
+        response: Response,
+        model: Any,  # noqa: ANN401
+        validation: Literal["validate", "construct", "none"],
+        executor: Executor,
+        window: int,
+    ) -> Iterator[Any]:
+        # Submits the validation of each line of a JSON Lines stream (or of the data of
+        # each Server-Sent Event) to `executor` as soon as it was read. The workers
+        # look up the validator themselves, so that only the raw item and a reference
+        # to the model have to be pickled for process pools. Events are built after
+        # the fact, since instances of the parametrized `BirthdayAppClientSSE` can't be
+        # pickled.
+        if streaming_kind == "json_lines":
+            submit = partial(
+                executor.submit, cls._validate_json_line, model, validation
             )
-        return cls._close_response_after(response, cls._iter_sse(response, model))
+            batches = cls._submit_per_chunk(streaming_kind, response, submit)
+            return cls._resolve_in_order(batches, window)
+        submit = partial(executor.submit, cls._validate_sse_data, model, validation)
+        batches = cls._submit_per_chunk(streaming_kind, response, submit)
+        build_event = cls._sse_event_builder(model, validation)
+        return map(build_event, cls._resolve_in_order(batches, window))
+
+    @classmethod
+    def _submit_per_chunk(
+        cls,
+        streaming_kind: Literal["json_lines", "server_sent_events"],
+        response: Response,
+        submit: Callable[[Any], Future[Any]],
+    ) -> Iterator[Iterator[Future[Any]]]:
+        # Yields the items of each chunk of the stream as soon as it was read, each
+        # submitted only once it is taken from its batch.
+        carry = bytearray()
+        for chunk in response.iter_bytes():
+            if streaming_kind == "json_lines":
+                yield map(submit, cls._split_json_lines(carry, chunk))
+            else:
+                yield map(submit, cls._sse_event_fields(carry, chunk))
+        if streaming_kind == "json_lines":
+            if carry.strip():
+                yield map(submit, [bytes(carry)])
+        else:
+            fields = cls._parse_sse_event(bytes(carry.removesuffix(b"\r")))
+            if fields:
+                yield map(submit, [fields])
+
+    @staticmethod
+    def _validate_json_line(
+        model: Any,  # noqa: ANN401
+        validation: Literal["validate", "construct", "none"],
+        line: str | bytes,
+    ) -> Any:  # noqa: ANN401
+        adapter = BirthdayAppClient._type_adapter(model)
+        return BirthdayAppClient._json_validator(model, adapter, validation)(line)
+
+    @staticmethod
+    def _validate_sse_data(
+        model: Any,  # noqa: ANN401
+        validation: Literal["validate", "construct", "none"],
+        fields: dict[str, Any],
+    ) -> dict[str, Any]:
+        if "data" in fields:
+            fields["data"] = BirthdayAppClient._validate_json_line(
+                model, validation, fields["data"]
+            )
+        return fields
+
+    @staticmethod
+    def _resolve_in_order(
+        batches: Iterator[Iterator[Future[Any]]], window: int
+    ) -> Iterator[Any]:
+        # Yields the results in submission order, as soon as they are done. Only once
+        # `window` items are in flight, the oldest one is waited for, so that a slow
+        # consumer doesn't make the whole stream pile up. Each batch holds the items
+        # of one chunk of the stream, and all of them are yielded before the next
+        # chunk is read, since that can take as long as the server takes to send
+        # more. Otherwise, sparse streams would only make progress with later items.
+        pending = deque[Future[Any]]()
+        try:
+            for batch in batches:
+                for future in batch:
+                    pending.append(future)
+                    while pending and (len(pending) >= window or pending[0].done()):
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
 
     @staticmethod
     def _close_response_after(
@@ -357,73 +2274,213 @@ class BirthdayAppClient:
         finally:
             response.close()
 
-    @staticmethod
+    @classmethod
     def _iter_json_lines(
+        cls,
         response: Response,
-        model: Any,  # noqa: ANN401
+        validate_json: Callable[[str | bytes], Any],
+    ) -> Iterator[Any]:
+        carry = bytearray()
+        for chunk in response.iter_bytes():
+            for line in cls._split_json_lines(carry, chunk):
+                yield validate_json(line)
+        if carry.strip():
+            yield validate_json(bytes(carry))
+
+    @staticmethod
+    def _split_json_lines(carry: bytearray, chunk: bytes) -> list[bytes]:
+        # Splits the raw bytes of a JSON Lines stream at `\n`, instead of decoding
+        # them to `str` and splitting at any line ending like `iter_lines()`, so that
+        # Pydantic can validate the lines from `bytes`. A trailing `\r` of a line is
+        # left for the JSON parser to skip as whitespace, and empty lines are dropped.
+        # `carry` holds the incomplete last line of the previous chunks and is updated
+        # in place. Chunks without a line break are only appended to it, so that a
+        # line spanning many chunks is copied once, when it is complete.
+        if chunk.find(b"\n") < 0:
+            carry += chunk
+            return []
+        lines = chunk.split(b"\n")
+        if carry:
+            carry += lines[0]
+            lines[0] = bytes(carry)
+        carry[:] = lines.pop()
+        if b"" in lines or b"\r" in lines:
+            return [line for line in lines if line and line != b"\r"]
+        return lines
+
+    @classmethod
+    def _iter_json_lines_batches(
+        cls,
+        response: Response,
+        validate_json: Callable[[str | bytes], Any],
+        size: int,
+        window: float | None,
     ) -> Iterator[Any]:
-        adapter = TypeAdapter(model)
-        for part in response.iter_lines():
-            if part:
-                yield adapter.validate_json(part)
+        carry = bytearray()
+        lines = list[bytes]()
+        deadline = 0.0 if window is None else monotonic() + window
+        for chunk in response.iter_bytes():
+            lines += cls._split_json_lines(carry, chunk)
+            while len(lines) >= size:
+                yield validate_json(b"[%b]" % b",".join(lines[:size]))
+                del lines[:size]
+            if window is not None and monotonic() >= deadline:
+                if lines:
+                    yield validate_json(b"[%b]" % b",".join(lines))
+                    lines.clear()
+                deadline = monotonic() + window
+        if carry.strip():
+            lines.append(bytes(carry))
+        if lines:
+            yield validate_json(b"[%b]" % b",".join(lines))
+
+    @classmethod
+    def _iter_columns(
+        cls,
+        response: Response,
+        validate_json: Callable[[str | bytes], Any],
+        columns: tuple[tuple[str, str, str | None, Any], ...],
+        chunk_size: int,
+    ) -> Iterator[dict[str, array[Any] | list[Any]]]:
+        # Lines are validated in batches of at most 1024, so that memory is bounded by
+        # the columns of one chunk rather than by the validated rows of one chunk.
+        chunk, size = cls._empty_columns(columns), 0
+        for rows in cls._iter_json_lines_batches(
+            response, validate_json, min(chunk_size, 1024), None
+        ):
+            while rows:
+                taken, rows = rows[: chunk_size - size], rows[chunk_size - size :]
+                for (_, key, _, default), column in zip(
+                    columns, chunk.values(), strict=True
+                ):
+                    column.extend([row.get(key, default) for row in taken])
+                size += len(taken)
+                if size == chunk_size:
+                    yield chunk
+                    chunk, size = cls._empty_columns(columns), 0
+        if size:
+            yield chunk
+
+    @staticmethod
+    def _empty_columns(
+        columns: tuple[tuple[str, str, str | None, Any], ...],
+    ) -> dict[str, array[Any] | list[Any]]:
+        return {
+            name: [] if typecode is None else array(typecode)
+            for name, _, typecode, _ in columns
+        }
 
     @classmethod
     def _iter_sse(
         cls,
         response: Response,
         model: Any,  # noqa: ANN401
+        validate_json: Callable[[str | bytes], Any],
+        validation: Literal["validate", "construct", "none"],
     ) -> Iterator[Any]:
-        adapter = TypeAdapter(model)
-        for fields in cls._iter_sse_event_fields(response.iter_lines()):
+        build_event = cls._sse_event_builder(model, validation)
+        for fields in cls._iter_sse_event_fields(response.iter_bytes()):
             if "data" in fields:
-                fields = {**fields, "data": adapter.validate_json(fields["data"])}
-            yield BirthdayAppClientSSE[model].model_validate(fields)
+                fields["data"] = validate_json(fields["data"])
+            yield build_event(fields)
+
+    @staticmethod
+    def _sse_event_builder(
+        model: Any,  # noqa: ANN401
+        validation: Literal["validate", "construct", "none"],
+    ) -> Callable[[Mapping[str, Any]], BirthdayAppClientSSE[Any]]:
+        # The envelope is parametrized once per stream. Without validation, events
+        # are shallow copies of an empty instance of it, which is several times faster
+        # than `model_construct()`.
+        sse_model = BirthdayAppClientSSE[model]
+        if validation == "validate":
+            return sse_model.model_validate
+        return partial(BirthdayAppClient._copy_sse_event, sse_model.model_construct())
+
+    @staticmethod
+    def _copy_sse_event(
+        template: BirthdayAppClientSSE[Any], fields: Mapping[str, Any]
+    ) -> BirthdayAppClientSSE[Any]:
+        return template.model_copy(update=fields)
 
     @classmethod
     def _iter_sse_event_fields(
-        cls, lines: Iterator[str]
-    ) -> Iterator[Mapping[str, Any]]:
-        fields: dict[str, Any] = {}
-        data_lines: list[str] = []
-        comment_lines: list[str] = []
-        for line in lines:
-            if line:
-                cls._accumulate_sse_line(line, fields, data_lines, comment_lines)
+        cls, chunks: Iterator[bytes]
+    ) -> Iterator[dict[str, Any]]:
+        carry = bytearray()
+        for chunk in chunks:
+            yield from cls._sse_event_fields(carry, chunk)
+        fields = cls._parse_sse_event(bytes(carry.removesuffix(b"\r")))
+        if fields:
+            yield fields
+
+    @classmethod
+    def _sse_event_fields(cls, carry: bytearray, chunk: bytes) -> list[dict[str, Any]]:
+        # Returns the fields of the events completed by `chunk`, see
+        # `_split_sse_events()`.
+        events = list[dict[str, Any]]()
+        for block in cls._split_sse_events(carry, chunk):
+            # Fast path for events with a single `data:` line, as FastAPI sends them.
+            if block.startswith(b"data: ") and b"\n" not in block:
+                events.append({"data": block[6:]})
                 continue
-            event = cls._finalize_sse_event(fields, data_lines, comment_lines)
-            if event is not None:
-                yield event
             # Spec deviation: `lastEventId` doesn't persist across events. Each
-            # yielded event reflects only what was on the wire for it; events
-            # without an `id:` line surface as `id=None`.
-            fields, data_lines, comment_lines = {}, [], []
-        event = cls._finalize_sse_event(fields, data_lines, comment_lines)
-        if event is not None:
-            yield event
+            # yielded event reflects only what was on the wire for it; events without
+            # an `id:` line surface as `id=None`.
+            fields = cls._parse_sse_event(block)
+            if fields:
+                events.append(fields)
+        return events
 
     @staticmethod
-    def _accumulate_sse_line(
-        line: str,
-        fields: dict[str, Any],
-        data_lines: list[str],
-        comment_lines: list[str],
-    ) -> None:
-        if line.startswith(":"):
-            comment_lines.append(line[1:].removeprefix(" "))
-            return
-        field, _, value = line.partition(":")
-        value = value.removeprefix(" ")
-        if field == "data":
-            data_lines.append(value)
-        elif field in ("event", "id"):
-            fields[field] = value
-        elif field == "retry" and value.isascii() and value.isdigit():
-            fields[field] = int(value)
-
-    @staticmethod
-    def _finalize_sse_event(
-        fields: dict[str, Any], data_lines: list[str], comment_lines: list[str]
-    ) -> dict[str, Any] | None:
+    def _split_sse_events(carry: bytearray, chunk: bytes) -> list[bytes]:
+        # Splits the raw bytes of a Server-Sent Events stream at the blank lines that
+        # end each event, instead of decoding them to `str` and splitting them into
+        # lines first. `\r\n` and `\r` line endings are normalized to `\n`, holding
+        # back a trailing `\r` in case the next chunk starts with `\n`. `carry` holds
+        # the incomplete last event of the previous chunks and is updated in place.
+        if carry.endswith(b"\r"):
+            del carry[-1]
+            chunk = b"\r" + chunk
+        held = b""
+        if b"\r" in chunk:
+            if chunk.endswith(b"\r"):
+                chunk, held = chunk[:-1], b"\r"
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        events = list[bytes]()
+        if carry.endswith(b"\n") and chunk.startswith(b"\n"):
+            events.append(bytes(carry[:-1]))
+            carry.clear()
+            chunk = chunk[1:]
+        parts = chunk.split(b"\n\n")
+        if len(parts) == 1:
+            carry += chunk
+        else:
+            if carry:
+                carry += parts[0]
+                parts[0] = bytes(carry)
+            carry[:] = parts.pop()
+            events += parts
+        carry += held
+        return events
+
+    @staticmethod
+    def _parse_sse_event(block: bytes) -> dict[str, Any]:
+        fields: dict[str, Any] = {}
+        data_lines: list[str] = []
+        comment_lines: list[str] = []
+        for line in block.decode(errors="replace").split("\n"):
+            field, _, value = line.partition(":")
+            value = value.removeprefix(" ")
+            if field == "data":
+                data_lines.append(value)
+            # Per the spec, ids containing NUL are ignored.
+            elif field == "event" or (field == "id" and "\0" not in value):
+                fields[field] = value
+            elif field == "retry" and value.isascii() and value.isdigit():
+                fields[field] = int(value)
+            elif not field and line:
+                comment_lines.append(value)
         if data_lines:
             fields["data"] = "\n".join(data_lines)
         if comment_lines:
@@ -431,7 +2488,7 @@ class BirthdayAppClient:
         # Spec deviation: comment- or metadata-only events (no `data:` lines)
         # are still dispatched. The spec says to drop them, but we surface them
         # so `BirthdayAppClientSSE.comment` is reachable from the client.
-        return fields or None
+        return fields
 
     @overload
     def register_birthday(
@@ -460,16 +2517,8 @@ class BirthdayAppClient:
         client_exts: BirthdayAppClientExtensions | None = None,
     ) -> BirthdayAppClientResult[HTTPStatus, Any]:
         return self._route_handler(  # type: ignore
-            path="/birthday",
-            method=HTTPMethod.POST,
-            default_status=HTTPStatus.CREATED,
-            models={
-                HTTPStatus.CREATED: bool,
-                HTTPStatus.UNPROCESSABLE_CONTENT: BirthdayAppClientHTTPValidationError,
-            },
-            body_params={
-                "data": data,
-            },
+            _REGISTER_BIRTHDAY_ROUTE,
+            (data,),
             raise_if_not_default_status=raise_if_not_default_status,
             client_exts=client_exts,
         )
@@ -502,17 +2551,8 @@ class BirthdayAppClient:
         client_exts: BirthdayAppClientExtensions | None = None,
     ) -> BirthdayAppClientResult[HTTPStatus, Any]:
         return self._route_handler(  # type: ignore
-            path="/birthday/{name}",
-            method=HTTPMethod.GET,
-            default_status=HTTPStatus.OK,
-            models={
-                HTTPStatus.OK: BirthdayData,
-                HTTPStatus.NOT_FOUND: GetBirthdayError,
-                HTTPStatus.UNPROCESSABLE_CONTENT: BirthdayAppClientHTTPValidationError,
-            },
-            path_params={
-                "name": name,
-            },
+            _GET_BIRTHDAY_ROUTE,
+            (name,),
             raise_if_not_default_status=raise_if_not_default_status,
             client_exts=client_exts,
         )
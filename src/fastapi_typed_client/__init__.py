@@ -4,28 +4,76 @@ from ._core import generate_fastapi_typed_client
 from .client import (
     FASTAPI_CLIENT_NOT_REQUIRED,
     FastAPIClientAsyncBase,
+    FastAPIClientAsyncOptions,
     FastAPIClientBase,
+    FastAPIClientBatchResult,
+    FastAPIClientCacheInfo,
+    FastAPIClientCircuitBreaker,
+    FastAPIClientCircuitOpenError,
+    FastAPIClientConcurrencyInfo,
+    FastAPIClientConcurrencyLimiter,
     FastAPIClientExtensions,
     FastAPIClientFile,
     FastAPIClientHTTPValidationError,
+    FastAPIClientLazyResult,
+    FastAPIClientMetrics,
     FastAPIClientNotDefaultStatusError,
+    FastAPIClientOptions,
+    FastAPIClientRateLimiter,
+    FastAPIClientRateLimitInfo,
+    FastAPIClientResponseCache,
+    FastAPIClientResponseCacheInfo,
     FastAPIClientResult,
+    FastAPIClientRetryInfo,
+    FastAPIClientRetryPolicy,
+    FastAPIClientRoute,
+    FastAPIClientRouteParam,
     FastAPIClientSecurityParam,
+    FastAPIClientSpan,
     FastAPIClientSSE,
+    FastAPIClientSSEReconnectInfo,
+    FastAPIClientSSEReconnectPolicy,
+    FastAPIClientTiming,
+    FastAPIClientTraceContext,
+    FastAPIClientTracer,
     FastAPIClientValidationError,
 )
 
 __all__ = [
     "FASTAPI_CLIENT_NOT_REQUIRED",
     "FastAPIClientAsyncBase",
+    "FastAPIClientAsyncOptions",
     "FastAPIClientBase",
+    "FastAPIClientBatchResult",
+    "FastAPIClientCacheInfo",
+    "FastAPIClientCircuitBreaker",
+    "FastAPIClientCircuitOpenError",
+    "FastAPIClientConcurrencyInfo",
+    "FastAPIClientConcurrencyLimiter",
     "FastAPIClientExtensions",
     "FastAPIClientFile",
     "FastAPIClientHTTPValidationError",
+    "FastAPIClientLazyResult",
+    "FastAPIClientMetrics",
     "FastAPIClientNotDefaultStatusError",
+    "FastAPIClientOptions",
+    "FastAPIClientRateLimitInfo",
+    "FastAPIClientRateLimiter",
+    "FastAPIClientResponseCache",
+    "FastAPIClientResponseCacheInfo",
     "FastAPIClientResult",
+    "FastAPIClientRetryInfo",
+    "FastAPIClientRetryPolicy",
+    "FastAPIClientRoute",
+    "FastAPIClientRouteParam",
     "FastAPIClientSSE",
+    "FastAPIClientSSEReconnectInfo",
+    "FastAPIClientSSEReconnectPolicy",
     "FastAPIClientSecurityParam",
+    "FastAPIClientSpan",
+    "FastAPIClientTiming",
+    "FastAPIClientTraceContext",
+    "FastAPIClientTracer",
     "FastAPIClientValidationError",
     "__version__",
     "cli",
@@ -9,14 +9,38 @@ from ._parser import parse_routes
 from ._utils import load_import, to_snake_case, to_upper_camel_case
 from .client import (
     FastAPIClientAsyncBase,
+    FastAPIClientAsyncOptions,
     FastAPIClientBase,
+    FastAPIClientBatchResult,
+    FastAPIClientCacheInfo,
+    FastAPIClientCircuitBreaker,
+    FastAPIClientCircuitOpenError,
+    FastAPIClientConcurrencyInfo,
+    FastAPIClientConcurrencyLimiter,
     FastAPIClientExtensions,
     FastAPIClientFile,
     FastAPIClientHTTPValidationError,
+    FastAPIClientLazyResult,
+    FastAPIClientMetrics,
     FastAPIClientNotDefaultStatusError,
+    FastAPIClientOptions,
+    FastAPIClientRateLimiter,
+    FastAPIClientRateLimitInfo,
+    FastAPIClientResponseCache,
+    FastAPIClientResponseCacheInfo,
     FastAPIClientResult,
+    FastAPIClientRetryInfo,
+    FastAPIClientRetryPolicy,
+    FastAPIClientRoute,
+    FastAPIClientRouteParam,
     FastAPIClientSecurityParam,
+    FastAPIClientSpan,
     FastAPIClientSSE,
+    FastAPIClientSSEReconnectInfo,
+    FastAPIClientSSEReconnectPolicy,
+    FastAPIClientTiming,
+    FastAPIClientTraceContext,
+    FastAPIClientTracer,
     FastAPIClientValidationError,
 )
 
@@ -24,11 +48,35 @@ from .client import (
 _RESERVED_TITLES = (
     FastAPIClientExtensions.__name__,
     FastAPIClientResult.__name__,
+    FastAPIClientLazyResult.__name__,
+    FastAPIClientCacheInfo.__name__,
+    FastAPIClientResponseCacheInfo.__name__,
+    FastAPIClientRetryInfo.__name__,
+    FastAPIClientSSEReconnectInfo.__name__,
+    FastAPIClientRateLimitInfo.__name__,
+    FastAPIClientConcurrencyInfo.__name__,
+    FastAPIClientTiming.__name__,
+    FastAPIClientTraceContext.__name__,
+    FastAPIClientSpan.__name__,
+    FastAPIClientBatchResult.__name__,
     FastAPIClientValidationError.__name__,
     FastAPIClientHTTPValidationError.__name__,
     FastAPIClientNotDefaultStatusError.__name__,
+    FastAPIClientCircuitOpenError.__name__,
     FastAPIClientSecurityParam.__name__,
+    FastAPIClientRoute.__name__,
+    FastAPIClientRouteParam.__name__,
     FastAPIClientSSE.__name__,
+    FastAPIClientResponseCache.__name__,
+    FastAPIClientRetryPolicy.__name__,
+    FastAPIClientSSEReconnectPolicy.__name__,
+    FastAPIClientCircuitBreaker.__name__,
+    FastAPIClientRateLimiter.__name__,
+    FastAPIClientTracer.__name__,
+    FastAPIClientMetrics.__name__,
+    FastAPIClientConcurrencyLimiter.__name__,
+    FastAPIClientOptions.__name__,
+    FastAPIClientAsyncOptions.__name__,
     FastAPIClientFile.__name__,
     FastAPIClientBase.__name__,
     FastAPIClientAsyncBase.__name__,
@@ -1,19 +1,25 @@
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import AsyncIterator, Collection, Iterable, Iterator, Sequence
 from collections.abc import Set as AbstractSet
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
 from enum import Enum, auto
 from functools import cache
 from http import HTTPMethod, HTTPStatus
 from importlib.util import find_spec
 from inspect import getsource
 from sys import stdlib_module_names
+from threading import Lock
 from types import NoneType
 from typing import Any, Literal, NamedTuple, get_args, get_origin, overload
 from warnings import warn
 
+from pydantic_core import from_json
+
 from ._parser import (
     Route,
     RouteParam,
+    RouteParamEncoder,
     RouteParamKind,
     RouteResponse,
     RouteStreamingKind,
@@ -26,14 +32,38 @@ from .client import (
     _IMPORTS_TYPE_CHECKING,
     _IMPORTS_VALIDATION_ERROR,
     FastAPIClientAsyncBase,
+    FastAPIClientAsyncOptions,
     FastAPIClientBase,
+    FastAPIClientBatchResult,
+    FastAPIClientCacheInfo,
+    FastAPIClientCircuitBreaker,
+    FastAPIClientCircuitOpenError,
+    FastAPIClientConcurrencyInfo,
+    FastAPIClientConcurrencyLimiter,
     FastAPIClientExtensions,
     FastAPIClientFile,
     FastAPIClientHTTPValidationError,
+    FastAPIClientLazyResult,
+    FastAPIClientMetrics,
     FastAPIClientNotDefaultStatusError,
+    FastAPIClientOptions,
+    FastAPIClientRateLimiter,
+    FastAPIClientRateLimitInfo,
+    FastAPIClientResponseCache,
+    FastAPIClientResponseCacheInfo,
     FastAPIClientResult,
+    FastAPIClientRetryInfo,
+    FastAPIClientRetryPolicy,
+    FastAPIClientRoute,
+    FastAPIClientRouteParam,
     FastAPIClientSecurityParam,
+    FastAPIClientSpan,
     FastAPIClientSSE,
+    FastAPIClientSSEReconnectInfo,
+    FastAPIClientSSEReconnectPolicy,
+    FastAPIClientTiming,
+    FastAPIClientTraceContext,
+    FastAPIClientTracer,
     FastAPIClientValidationError,
 )
 
@@ -41,11 +71,35 @@ from .client import (
 class _Identifiers(NamedTuple):
     client_extensions: str
     result: str
+    lazy_result: str
+    cache_info: str
+    response_cache_info: str
+    retry_info: str
+    sse_reconnect_info: str
+    rate_limit_info: str
+    concurrency_info: str
+    timing: str
+    trace_context: str
+    span: str
+    batch_result: str
     validation_error: str
     http_validation_error: str
     not_default_status_error: str
+    circuit_open_error: str
     security_param: str
+    route: str
+    route_param: str
     sse: str
+    response_cache: str
+    retry_policy: str
+    sse_reconnect_policy: str
+    circuit_breaker: str
+    rate_limiter: str
+    tracer: str
+    metrics: str
+    concurrency_limiter: str
+    options: str
+    async_options: str
     file: str
     not_required: str
     base_class: str
@@ -55,11 +109,36 @@ class _Identifiers(NamedTuple):
         replacements = {
             FastAPIClientExtensions.__name__: self.client_extensions,
             FastAPIClientResult.__name__: self.result,
+            FastAPIClientLazyResult.__name__: self.lazy_result,
+            FastAPIClientCacheInfo.__name__: self.cache_info,
+            FastAPIClientResponseCacheInfo.__name__: self.response_cache_info,
+            FastAPIClientRetryInfo.__name__: self.retry_info,
+            FastAPIClientSSEReconnectInfo.__name__: self.sse_reconnect_info,
+            FastAPIClientRateLimitInfo.__name__: self.rate_limit_info,
+            FastAPIClientConcurrencyInfo.__name__: self.concurrency_info,
+            FastAPIClientTiming.__name__: self.timing,
+            FastAPIClientTraceContext.__name__: self.trace_context,
+            FastAPIClientSpan.__name__: self.span,
+            FastAPIClientBatchResult.__name__: self.batch_result,
             FastAPIClientValidationError.__name__: self.validation_error,
             FastAPIClientHTTPValidationError.__name__: self.http_validation_error,
             FastAPIClientNotDefaultStatusError.__name__: self.not_default_status_error,
+            FastAPIClientCircuitOpenError.__name__: self.circuit_open_error,
             FastAPIClientSecurityParam.__name__: self.security_param,
+            # Longer names go before names that are prefixes of them.
+            FastAPIClientRouteParam.__name__: self.route_param,
+            FastAPIClientRoute.__name__: self.route,
+            FastAPIClientSSEReconnectPolicy.__name__: self.sse_reconnect_policy,
             FastAPIClientSSE.__name__: self.sse,
+            FastAPIClientResponseCache.__name__: self.response_cache,
+            FastAPIClientRetryPolicy.__name__: self.retry_policy,
+            FastAPIClientCircuitBreaker.__name__: self.circuit_breaker,
+            FastAPIClientRateLimiter.__name__: self.rate_limiter,
+            FastAPIClientTracer.__name__: self.tracer,
+            FastAPIClientMetrics.__name__: self.metrics,
+            FastAPIClientConcurrencyLimiter.__name__: self.concurrency_limiter,
+            FastAPIClientOptions.__name__: self.options,
+            FastAPIClientAsyncOptions.__name__: self.async_options,
             FastAPIClientFile.__name__: self.file,
             "FASTAPI_CLIENT_NOT_REQUIRED": self.not_required,
             FastAPIClientBase.__name__: self.base_class,
@@ -102,11 +181,35 @@ class ClientCodeGenerator:
             return _Identifiers(
                 client_extensions=FastAPIClientExtensions.__name__,
                 result=FastAPIClientResult.__name__,
+                lazy_result=FastAPIClientLazyResult.__name__,
+                cache_info=FastAPIClientCacheInfo.__name__,
+                response_cache_info=FastAPIClientResponseCacheInfo.__name__,
+                retry_info=FastAPIClientRetryInfo.__name__,
+                sse_reconnect_info=FastAPIClientSSEReconnectInfo.__name__,
+                rate_limit_info=FastAPIClientRateLimitInfo.__name__,
+                concurrency_info=FastAPIClientConcurrencyInfo.__name__,
+                timing=FastAPIClientTiming.__name__,
+                trace_context=FastAPIClientTraceContext.__name__,
+                span=FastAPIClientSpan.__name__,
+                batch_result=FastAPIClientBatchResult.__name__,
                 validation_error=FastAPIClientValidationError.__name__,
                 http_validation_error=FastAPIClientHTTPValidationError.__name__,
                 not_default_status_error=FastAPIClientNotDefaultStatusError.__name__,
+                circuit_open_error=FastAPIClientCircuitOpenError.__name__,
                 security_param=FastAPIClientSecurityParam.__name__,
+                route=FastAPIClientRoute.__name__,
+                route_param=FastAPIClientRouteParam.__name__,
                 sse=FastAPIClientSSE.__name__,
+                response_cache=FastAPIClientResponseCache.__name__,
+                retry_policy=FastAPIClientRetryPolicy.__name__,
+                sse_reconnect_policy=FastAPIClientSSEReconnectPolicy.__name__,
+                circuit_breaker=FastAPIClientCircuitBreaker.__name__,
+                rate_limiter=FastAPIClientRateLimiter.__name__,
+                tracer=FastAPIClientTracer.__name__,
+                metrics=FastAPIClientMetrics.__name__,
+                concurrency_limiter=FastAPIClientConcurrencyLimiter.__name__,
+                options=FastAPIClientOptions.__name__,
+                async_options=FastAPIClientAsyncOptions.__name__,
                 file=FastAPIClientFile.__name__,
                 not_required="FASTAPI_CLIENT_NOT_REQUIRED",
                 base_class=self._base_class.__name__,
@@ -115,11 +218,35 @@ class ClientCodeGenerator:
         return _Identifiers(
             client_extensions=f"{self._title}Extensions",
             result=f"{self._title}Result",
+            lazy_result=f"{self._title}LazyResult",
+            cache_info=f"{self._title}CacheInfo",
+            response_cache_info=f"{self._title}ResponseCacheInfo",
+            retry_info=f"{self._title}RetryInfo",
+            sse_reconnect_info=f"{self._title}SSEReconnectInfo",
+            rate_limit_info=f"{self._title}RateLimitInfo",
+            concurrency_info=f"{self._title}ConcurrencyInfo",
+            timing=f"{self._title}Timing",
+            trace_context=f"{self._title}TraceContext",
+            span=f"{self._title}Span",
+            batch_result=f"{self._title}BatchResult",
             validation_error=f"{self._title}ValidationError",
             http_validation_error=f"{self._title}HTTPValidationError",
             not_default_status_error=f"{self._title}NotDefaultStatusError",
+            circuit_open_error=f"{self._title}CircuitOpenError",
             security_param=f"{self._title}SecurityParam",
+            route=f"{self._title}Route",
+            route_param=f"{self._title}RouteParam",
             sse=f"{self._title}SSE",
+            response_cache=f"{self._title}ResponseCache",
+            retry_policy=f"{self._title}RetryPolicy",
+            sse_reconnect_policy=f"{self._title}SSEReconnectPolicy",
+            circuit_breaker=f"{self._title}CircuitBreaker",
+            rate_limiter=f"{self._title}RateLimiter",
+            tracer=f"{self._title}Tracer",
+            metrics=f"{self._title}Metrics",
+            concurrency_limiter=f"{self._title}ConcurrencyLimiter",
+            options=f"{self._title}Options",
+            async_options=f"{self._title}AsyncOptions",
             file=f"{self._title}File",
             not_required=(
                 to_constant_case(self._title).replace("FAST_API", "FASTAPI")
@@ -134,34 +261,79 @@ class ClientCodeGenerator:
             for param in route.params:
                 self._impr.add_reserved_ident(param.name)
 
-        codes = ["", "", self._get_boilerplate_code(routes)]
-        codes.extend(indent(self._get_route_code(route)) for route in routes)
+        spec_names = self._get_route_spec_names(routes)
+        route_specs_code = "\n".join(
+            self._get_route_spec_code(route, spec_name)
+            for route, spec_name in zip(routes, spec_names, strict=True)
+        )
+
+        codes = ["", self._get_boilerplate_code(routes, route_specs_code)]
+        if not self._import_client_base:
+            # Imports are followed by the boilerplate classes instead of the route
+            # specs, which need to be separated by two blank lines.
+            codes.insert(1, "")
+        codes.extend(
+            indent(self._get_route_code(route, spec_name))
+            for route, spec_name in zip(routes, spec_names, strict=True)
+        )
         # This relies on the side effects to self._impr of the previous code generating
         # functions, so we can only call it at the end.
         codes[0] = _ImportCodeGenerator(self._impr).generate()
 
         return "\n".join(codes)
 
-    def _get_boilerplate_code(self, routes: Sequence[Route]) -> str:
+    def _get_boilerplate_code(
+        self, routes: Sequence[Route], route_specs_code: str
+    ) -> str:
         return _BoilerplateCodeGenerator(
             self._impr, self._base_class, self._idents, self._add_test_markers
-        ).generate(routes, self._import_client_base)
-
-    def _get_route_code(self, route: Route) -> str:
+        ).generate(routes, route_specs_code, self._import_client_base)
+
+    def _get_route_code(self, route: Route, spec_name: str) -> str:
+        if len(route.params) == 1:
+            # See `_get_params_code()` on single-element tuples.
+            values_code = f"    ({route.params[0].name},),\n"
+        else:
+            values_code = "".join(f"    {param.name},\n" for param in route.params)
+            values_code = indent(f"(\n{values_code}),") if values_code else "    (),\n"
         return self._get_route_signature_code(route) + indent(
             f"return {'await ' if self._async else ''}self._route_handler(  # type: ignore\n"
+            f"    {spec_name},\n"
+            + values_code
+            + "    raise_if_not_default_status=raise_if_not_default_status,\n"
+            "    client_exts=client_exts,\n"
+            ")\n"
+        )
+
+    def _get_route_spec_code(self, route: Route, spec_name: str) -> str:
+        return (
+            f"{spec_name} = {self._idents.route}(\n"
+            f"    name={dq_str_repr(route.name)},\n"
             f"    path={dq_str_repr(route.path)},\n"
             f"    method={self._impr(HTTPMethod)}.{route.method.name},\n"
             f"    default_status={self._impr(HTTPStatus)}.{route.default_status.name},\n"
             + indent(self._get_models_dict_code(route.responses.values()))
-            + indent(self._get_params_dicts_code(route.params))
-            + indent(self._get_security_params_code(route.params))
+            + indent(self._get_params_code(route.params))
             + indent(self._get_optional_params_code(route))
-            + "    raise_if_not_default_status=raise_if_not_default_status,\n"
-            "    client_exts=client_exts,\n"
-            ")\n"
+            + ")\n"
         )
 
+    def _get_route_spec_names(self, routes: Sequence[Route]) -> Sequence[str]:
+        # Route names are unique, but their constant-cased versions need not be (and
+        # must not shadow any parameter name used within the route methods).
+        taken = {param.name for route in routes for param in route.params}
+        names = list[str]()
+        for route in routes:
+            base_name = f"_{to_constant_case(route.name)}_ROUTE"
+            name, i = base_name, 1
+            while name in taken:
+                i += 1
+                name = f"{base_name}_{i}"
+            taken.add(name)
+            self._impr.add_reserved_ident(name)
+            names.append(name)
+        return names
+
     def _get_route_signature_code(self, route: Route) -> str:
         if len(route.responses) == 1:
             return f"{self._get_route_overload_signature_code(route, route.responses.values(), None)}:\n"
@@ -292,39 +464,30 @@ class ClientCodeGenerator:
             lines.append(f"{status_str}: {type_str},\n")
         return f"models={{\n{indent(''.join(lines))}}},"
 
-    @staticmethod
-    def _get_params_dicts_code(params: Sequence[RouteParam]) -> str:
-        code = ""
-        for param_kind in RouteParamKind:
-            if param_kind is RouteParamKind.SECURITY:
-                continue
-            kind_params = [param for param in params if param.kind is param_kind]
-            if not kind_params:
-                continue
-            code += f"{param_kind.name.lower()}_params={{\n"
-            for param in kind_params:
-                code += f"    {dq_str_repr(param.alias or param.name)}: {param.name},\n"
-            code += "},\n"
-        return code
-
-    def _get_security_params_code(self, params: Sequence[RouteParam]) -> str:
-        security_params = [
-            param for param in params if param.kind is RouteParamKind.SECURITY
-        ]
-        if not security_params:
+    def _get_params_code(self, params: Sequence[RouteParam]) -> str:
+        if not params:
             return ""
-        code = "security_params=(\n"
-        for param in security_params:
+        params_code = list[str]()
+        for param in params:
+            # Parameters are passed positionally in this order by the route methods.
+            args = [dq_str_repr(param.kind.name.lower())]
             if param.security is None:
-                continue
-            code += (
-                f"    {self._idents.security_param}("
-                f"kind={dq_str_repr(param.security.kind.name.lower())}, "
-                f"name={dq_str_repr(param.security.target_name)}, "
-                f"value={param.name}),\n"
-            )
-        code += "),\n"
-        return code
+                args.append(dq_str_repr(param.alias or param.name))
+                if param.encoder is not RouteParamEncoder.JSONABLE:
+                    args.append(dq_str_repr(param.encoder.name.lower()))
+                if param.is_sequence:
+                    args.append("is_sequence=True")
+            else:
+                args.append(dq_str_repr(param.security.target_name))
+                args.append(
+                    f"security_kind={dq_str_repr(param.security.kind.name.lower())}"
+                )
+            params_code.append(f"{self._idents.route_param}({', '.join(args)}),")
+        if len(params_code) == 1:
+            # The trailing comma of a single-element tuple isn't a magic trailing comma
+            # for the formatter, so the tuple has to be kept on a single line.
+            return f"params=({params_code[0]}),\n"
+        return "params=(\n" + "".join(f"    {code}\n" for code in params_code) + "),\n"
 
     @staticmethod
     def _get_optional_params_code(route: Route) -> str:
@@ -351,7 +514,10 @@ class _BoilerplateCodeGenerator:
         self._idents = idents
         self._add_test_markers = add_test_markers
 
-    def generate(self, routes: Sequence[Route], import_client_base: bool) -> str:
+    def generate(
+        self, routes: Sequence[Route], route_specs_code: str, import_client_base: bool
+    ) -> str:
+        has_params = any(route.params for route in routes)
         has_not_required_params = any(
             not param.required for route in routes for param in route.params
         )
@@ -360,11 +526,6 @@ class _BoilerplateCodeGenerator:
             for route in routes
             for response in route.responses.values()
         )
-        has_security_params = any(
-            param.kind is RouteParamKind.SECURITY
-            for route in routes
-            for param in route.params
-        )
         has_sse = any(
             route.streaming_kind is RouteStreamingKind.SERVER_SENT_EVENTS
             for route in routes
@@ -376,21 +537,23 @@ class _BoilerplateCodeGenerator:
         )
         if import_client_base:
             return self._generate_with_import_client_base(
+                route_specs_code,
+                has_params,
                 has_not_required_params,
                 has_validation_errors,
-                has_security_params,
                 has_sse,
                 has_file_params,
             )
         return self._generate_without_import_client_base(
-            has_validation_errors, has_file_params
+            route_specs_code, has_validation_errors, has_file_params
         )
 
     def _generate_with_import_client_base(
         self,
+        route_specs_code: str,
+        has_params: bool,
         has_not_required_params: bool,
         has_validation_errors: bool,
-        has_security_params: bool,
         has_sse: bool,
         has_file_params: bool,
     ) -> str:
@@ -400,8 +563,9 @@ class _BoilerplateCodeGenerator:
             self._base_class.__name__,
             self._idents.client_extensions,
             self._idents.result,
+            self._idents.route,
+            self._idents.route_param if has_params else None,
             self._idents.http_validation_error if has_validation_errors else None,
-            self._idents.security_param if has_security_params else None,
             self._idents.sse if has_sse else None,
             self._idents.file if has_file_params else None,
             self._idents.not_required if has_not_required_params else None,
@@ -410,10 +574,13 @@ class _BoilerplateCodeGenerator:
                 self._impr.add_import(
                     Import(module=self._base_class.__module__, name=import_name)
                 )
-        return f"class {self._idents.client_class}({self._impr(self._base_class)}):"
+        return (
+            f"{route_specs_code}\n\n"
+            f"class {self._idents.client_class}({self._impr(self._base_class)}):"
+        )
 
     def _generate_without_import_client_base(
-        self, has_validation_errors: bool, has_file_params: bool
+        self, route_specs_code: str, has_validation_errors: bool, has_file_params: bool
     ) -> str:
         # Adding Self to one of the *_IMPORTS constant makes type checking fail.
         self._impr.add_import(Import(module="typing", name="Self"))
@@ -422,9 +589,44 @@ class _BoilerplateCodeGenerator:
         # hard-code those here.
         self._impr.add_import(Import(module="httpx2", name="USE_CLIENT_DEFAULT"))
 
-        # Manually specify where warn is imported from, because otherwise it resolves to
-        # `from _warnings import warn`.
+        # Manually specify where warn, Lock, and bisect_left are imported from, because
+        # otherwise they resolve to `from _warnings import warn`, `from _thread import
+        # lock`, and `from _bisect import bisect_left`.
         self._impr.add_import_for_type(Import(module="warnings", name="warn"), warn)
+        self._impr.add_import_for_type(Import(module="threading", name="Lock"), Lock)
+        self._impr.add_import_for_type(
+            Import(module="bisect", name="bisect_left"), bisect_left
+        )
+
+        # `UTC` is a constant, so its import location can't be looked up either.
+        self._impr.add_import(Import(module="datetime", name="UTC"))
+
+        # Same for `from_json`, which otherwise resolves to
+        # `from pydantic_core._pydantic_core import from_json`.
+        self._impr.add_import_for_type(
+            Import(module="pydantic_core", name="from_json"), from_json
+        )
+
+        # Same for the `concurrent.futures` names used by `validation_executor`, which
+        # are defined in a private submodule.
+        for name, type_ in (("Executor", Executor), ("Future", Future)):
+            self._impr.add_import_for_type(
+                Import(module="concurrent.futures", name=name), type_
+            )
+
+        if self._base_class is FastAPIClientBase:
+            # Same for the `concurrent.futures` names used by `batch()`, which are defined
+            # in private submodules, and its `FIRST_COMPLETED` constant.
+            for name, type_ in (
+                ("ThreadPoolExecutor", ThreadPoolExecutor),
+                ("wait", wait),
+            ):
+                self._impr.add_import_for_type(
+                    Import(module="concurrent.futures", name=name), type_
+                )
+            self._impr.add_import(
+                Import(module="concurrent.futures", name="FIRST_COMPLETED")
+            )
 
         if has_file_params:
             # Imports for the inlined `FastAPIClientFile` alias. `FileTypes` is a
@@ -468,6 +670,21 @@ class _BoilerplateCodeGenerator:
             ),
             getsource(FastAPIClientExtensions),
             getsource(FastAPIClientResult),
+            getsource(FastAPIClientLazyResult),
+            getsource(FastAPIClientCacheInfo),
+            getsource(FastAPIClientResponseCacheInfo),
+            getsource(FastAPIClientRetryInfo),
+            getsource(FastAPIClientSSEReconnectInfo),
+            getsource(FastAPIClientRateLimitInfo),
+            (
+                getsource(FastAPIClientConcurrencyInfo)
+                if self._base_class is FastAPIClientAsyncBase
+                else None
+            ),
+            getsource(FastAPIClientTiming),
+            getsource(FastAPIClientTraceContext),
+            getsource(FastAPIClientSpan),
+            getsource(FastAPIClientBatchResult),
             getsource(FastAPIClientValidationError) if has_validation_errors else None,
             (
                 getsource(FastAPIClientHTTPValidationError)
@@ -475,10 +692,32 @@ class _BoilerplateCodeGenerator:
                 else None
             ),
             getsource(FastAPIClientNotDefaultStatusError),
+            getsource(FastAPIClientCircuitOpenError),
             getsource(FastAPIClientSecurityParam),
+            getsource(FastAPIClientRouteParam),
+            getsource(FastAPIClientRoute),
             getsource(FastAPIClientSSE),
+            getsource(FastAPIClientResponseCache),
+            getsource(FastAPIClientRetryPolicy),
+            getsource(FastAPIClientSSEReconnectPolicy),
+            getsource(FastAPIClientCircuitBreaker),
+            getsource(FastAPIClientRateLimiter),
+            getsource(FastAPIClientTracer),
+            getsource(FastAPIClientMetrics),
+            (
+                getsource(FastAPIClientConcurrencyLimiter)
+                if self._base_class is FastAPIClientAsyncBase
+                else None
+            ),
+            getsource(FastAPIClientOptions),
+            (
+                getsource(FastAPIClientAsyncOptions)
+                if self._base_class is FastAPIClientAsyncBase
+                else None
+            ),
             "FASTAPI_CLIENT_NOT_REQUIRED: Any = ...\n",
             "# TEST_MARKER_AFTER_BOILERPLATE\n" if self._add_test_markers else None,
+            route_specs_code,
             base_class_source_with_test_markers(),
         ]
         return "\n\n".join(self._idents.replace_in_code(s) for s in sources if s)
@@ -4,10 +4,24 @@ from collections.abc import (
     Mapping,
     Sequence,
 )
+from datetime import date, time
 from enum import Enum, auto
 from http import HTTPMethod, HTTPStatus
 from inspect import signature
-from typing import Any, NamedTuple, cast, get_args, get_origin
+from pathlib import PurePath
+from types import NoneType, UnionType
+from typing import (
+    Annotated,
+    Any,
+    Literal,
+    NamedTuple,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+)
+from uuid import UUID
+from warnings import warn
 
 from fastapi._compat import ModelField
 from fastapi.datastructures import DefaultPlaceholder
@@ -34,7 +48,11 @@ from fastapi.security.base import SecurityBase
 from fastapi.sse import EventSourceResponse
 
 from ._utils import to_snake_case
-from .client import FastAPIClientHTTPValidationError
+from .client import (
+    FastAPIClientAsyncBase,
+    FastAPIClientBase,
+    FastAPIClientHTTPValidationError,
+)
 
 _DISALLOWED_PARAM_NAMES = {
     "self",
@@ -44,6 +62,20 @@ _DISALLOWED_PARAM_NAMES = {
     "HTTPStatus",
 }
 
+# Route methods are added to subclasses of the client base classes, so they must not
+# shadow any of their attributes, including the instance attributes set in `__init__`.
+# Clashing route names get trailing underscores instead.
+_RESERVED_ROUTE_NAMES = frozenset(
+    {
+        *dir(FastAPIClientBase),
+        *dir(FastAPIClientAsyncBase),
+        "client",
+        "_options",
+        "_is_starlette_test_client",
+        "_flights",
+    }
+)
+
 
 class RouteParamKind(Enum):
     PATH = auto()
@@ -56,6 +88,14 @@ class RouteParamKind(Enum):
     SECURITY = auto()
 
 
+class RouteParamEncoder(Enum):
+    IDENTITY = auto()
+    STR = auto()
+    ISOFORMAT = auto()
+    ENUM = auto()
+    JSONABLE = auto()
+
+
 class RouteSecurityKind(Enum):
     HTTP_BEARER = auto()
     HTTP_BASIC = auto()
@@ -83,6 +123,8 @@ class RouteParam(NamedTuple):
     type_: Any
     required: bool = False
     security: RouteSecurity | None = None
+    encoder: RouteParamEncoder = RouteParamEncoder.JSONABLE
+    is_sequence: bool = False
 
 
 class RouteResponse(NamedTuple):
@@ -109,7 +151,7 @@ def parse_routes(routes: Sequence[BaseRoute]) -> Sequence[Route]:
     if not result:
         raise RuntimeError("Does not have any routes.")
     _check_duplicate_names(result)
-    return result
+    return _rename_reserved_names(result)
 
 
 def _parse_route(route: _APIRouteLike) -> Route:
@@ -305,18 +347,88 @@ def _fields_to_route_params(
         if not _is_field_group_compatible(group):
             incompatible_names.add(primary.name)
             continue
+        type_ = primary.field_info.annotation or type(Any)
+        encoder, is_sequence = RouteParamEncoder.JSONABLE, False
+        if kind in _ENCODED_PARAM_KINDS:
+            encoder, is_sequence = _detect_param_encoder(type_)
         result.append(
             RouteParam(
                 name=primary.name,
                 alias=primary.field_info.alias,
                 kind=kind,
-                type_=primary.field_info.annotation or type(Any),
+                type_=type_,
                 required=any(p.field_info.is_required() for p in group),
+                encoder=encoder,
+                is_sequence=is_sequence,
             )
         )
     return result
 
 
+# Body params are serialized as a whole by Pydantic, and form params are flattened by
+# `jsonable_encoder()`, so only these kinds get per-param encoders.
+_ENCODED_PARAM_KINDS = {
+    RouteParamKind.PATH,
+    RouteParamKind.QUERY,
+    RouteParamKind.HEADER,
+    RouteParamKind.COOKIE,
+}
+_IDENTITY_ENCODED_TYPES = (str, int, float, bool)
+
+
+def _detect_param_encoder(
+    type_: Any,  # noqa: ANN401
+) -> tuple[RouteParamEncoder, bool]:
+    # Pick the cheapest encoder that produces the same output as `jsonable_encoder()`
+    # for all values of the declared type. Anything we aren't sure about falls back to
+    # `jsonable_encoder()` itself.
+    origin = get_origin(type_)
+    if origin is not None:
+        return _detect_generic_param_encoder(type_, origin)
+    if isinstance(type_, type):
+        return _detect_class_param_encoder(type_), False
+    return RouteParamEncoder.JSONABLE, False
+
+
+def _detect_generic_param_encoder(
+    type_: Any,  # noqa: ANN401
+    origin: Any,  # noqa: ANN401
+) -> tuple[RouteParamEncoder, bool]:
+    args = get_args(type_)
+    if origin is Annotated:
+        return _detect_param_encoder(args[0])
+    if origin is Union or origin is UnionType:
+        # All encoders pass `None` through, so `T | None` is encoded like `T`.
+        results = {_detect_param_encoder(arg) for arg in args if arg is not NoneType}
+        if len(results) == 1:
+            return results.pop()
+    elif origin is Literal:
+        if all(type(value) in _IDENTITY_ENCODED_TYPES for value in args):
+            return RouteParamEncoder.IDENTITY, False
+    elif origin in (list, set, frozenset, Sequence) or (
+        origin is tuple and len(args) == 2 and args[1] is ...
+    ):
+        encoder, is_sequence = _detect_param_encoder(args[0])
+        if not is_sequence and encoder is not RouteParamEncoder.JSONABLE:
+            return encoder, True
+    return RouteParamEncoder.JSONABLE, False
+
+
+def _detect_class_param_encoder(type_: type) -> RouteParamEncoder:
+    if issubclass(type_, Enum):
+        # `jsonable_encoder()` doesn't recurse into enum values.
+        if all(type(member.value) in _IDENTITY_ENCODED_TYPES for member in type_):
+            return RouteParamEncoder.ENUM
+        return RouteParamEncoder.JSONABLE
+    if issubclass(type_, _IDENTITY_ENCODED_TYPES):
+        return RouteParamEncoder.IDENTITY
+    if issubclass(type_, date | time):
+        return RouteParamEncoder.ISOFORMAT
+    if issubclass(type_, UUID | PurePath):
+        return RouteParamEncoder.STR
+    return RouteParamEncoder.JSONABLE
+
+
 def _group_fields_by_alias(
     fields: Sequence[ModelField],
 ) -> Iterable[list[ModelField]]:
@@ -474,6 +586,26 @@ def _resolve_default_type(
     return type(Any)
 
 
+def _rename_reserved_names(routes: Sequence[Route]) -> Sequence[Route]:
+    taken_names = {route.name for route in routes}
+    result = list[Route]()
+    for route in routes:
+        if route.name in _RESERVED_ROUTE_NAMES:
+            name = route.name
+            while name in _RESERVED_ROUTE_NAMES or name in taken_names:
+                name += "_"
+            taken_names.add(name)
+            warn(
+                f"Route name `{route.name}` clashes with an attribute of the client, "
+                f"generating it as `{name}` instead.",
+                UserWarning,
+                stacklevel=1,
+            )
+            route = route._replace(name=name)
+        result.append(route)
+    return result
+
+
 def _check_duplicate_names(routes: Iterable[Route]) -> None:
     seen_names = set()
     duplicate_names = set()
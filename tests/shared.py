@@ -2,9 +2,10 @@
 # and async_client_tester fixtures, so that these types can be used by the FastAPI test
 # apps we write in our tests.
 
-from enum import IntEnum
+from datetime import date
+from enum import Enum, IntEnum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class FooBarEnum(IntEnum):
@@ -12,16 +13,31 @@ class FooBarEnum(IntEnum):
     BAR = 456
 
 
+class ColorEnum(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
 class TextAndNum(BaseModel):
     text: str
     num: int
 
 
+class TextAndNumAliased(BaseModel):
+    text: str = Field(alias="Text")
+    num: int = Field(alias="Num")
+
+
 class TextAndNumDefault(TextAndNum):
     text: str = "foobarbaz"
     num: int = 4
 
 
+class DatedTextAndNums(BaseModel):
+    day: date
+    items: list[TextAndNum]
+
+
 TEXT_AND_NUM_DATA = [
     TextAndNum(text="foo", num=1),
     TextAndNum(text="bar", num=23),
@@ -0,0 +1,128 @@
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from ..client_tester import AsyncClientTester, ClientTester
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/foo")
+    async def foo(num: int) -> int:
+        import anyio
+
+        # Later calls finish first, so completion order differs from input order.
+        await anyio.sleep((10 - num) / 1000)
+        return num
+
+    @app.get("/invalid", response_model=int)
+    def invalid(num: int) -> JSONResponse:
+        return JSONResponse("bar" if num % 2 else num)
+
+    return app
+
+
+def test_map(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from collections.abc import Iterator
+
+        from pydantic import ValidationError
+
+        consumed = []
+
+        def kwargs_iterable() -> Iterator[dict[str, int]]:
+            for num in range(10):
+                consumed.append(num)
+                yield {"num": num}
+
+        results = client.batch(
+            client.foo, kwargs_iterable(), max_workers=3, ordered=True
+        )
+        assert not consumed
+        assert next(results).index == 0
+        # Inputs are only consumed as the window of pending calls allows.
+        assert len(consumed) <= 6
+        items = list(results)
+        assert [item.index for item in items] == list(range(1, 10))
+        assert [item.result.data for item in items] == list(range(1, 10))
+        assert all(item.error is None for item in items)
+
+        items = list(client.batch(client.foo, kwargs_iterable()))
+        assert sorted(item.index for item in items) == list(range(10))
+        assert all(item.result.data == item.index for item in items)
+
+        # Per-call errors are collected instead of aborting the batch.
+        for item in client.batch(client.invalid, kwargs_iterable(), max_workers=2):
+            if item.index % 2:
+                assert item.result is None
+                assert isinstance(item.error, ValidationError)
+            else:
+                assert item.result.data == item.index
+                assert item.error is None
+
+        try:
+            next(client.batch(client.foo, [], max_workers=0))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError
+
+    client_tester(app, client_test, assert_format_of_generated_code=False)
+
+
+async def test_batch(app: FastAPI, async_client_tester: AsyncClientTester) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from collections.abc import Iterator
+
+        from pydantic import ValidationError
+
+        def kwargs_iterable() -> Iterator[dict[str, int]]:
+            yield from ({"num": num} for num in range(10))
+
+        async with client.batch(
+            client.foo, kwargs_iterable(), concurrency=3, ordered=True
+        ) as results:
+            items = [item async for item in results]
+        assert [item.index for item in items] == list(range(10))
+        assert [item.result.data for item in items] == list(range(10))
+        assert all(item.error is None for item in items)
+
+        async with client.batch(client.foo, kwargs_iterable()) as results:
+            items = [item async for item in results]
+        assert sorted(item.index for item in items) == list(range(10))
+        assert all(item.result.data == item.index for item in items)
+
+        # Per-call errors are collected instead of aborting the batch.
+        async with client.batch(
+            client.invalid, kwargs_iterable(), concurrency=2, ordered=True
+        ) as results:
+            items = [item async for item in results]
+        for item in items:
+            if item.index % 2:
+                assert item.result is None
+                assert isinstance(item.error, ValidationError)
+            else:
+                assert item.result.data == item.index
+                assert item.error is None
+
+        # Leaving early cancels the remaining calls.
+        async with client.batch(
+            client.foo, kwargs_iterable(), concurrency=1, ordered=True
+        ) as results:
+            async for item in results:
+                assert item.index == 0
+                break
+
+        try:
+            async with client.batch(client.foo, [], concurrency=0):
+                pass
+        except ValueError:
+            pass
+        else:
+            raise AssertionError
+
+    await async_client_tester(app, client_test, assert_format_of_generated_code=False)
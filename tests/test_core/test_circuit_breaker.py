@@ -0,0 +1,127 @@
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from ..client_tester import AsyncClientTester, ClientTester
+
+_UNAVAILABLE: dict[int | str, dict[str, Any]] = {503: {"model": str}}
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+    calls: list[bool] = []
+
+    @app.get("/status", response_model=int, responses=_UNAVAILABLE)
+    def status(ok: bool) -> JSONResponse:
+        calls.append(ok)
+        if not ok:
+            return JSONResponse("unavailable", status_code=503)
+        return JSONResponse(len(calls))
+
+    @app.get("/other")
+    def other() -> int:
+        return len(calls)
+
+    return app
+
+
+# `import_client_base=True` is used so we can import `FastAPIClientCircuitBreaker`
+# from `fastapi_typed_client`.
+
+
+def test_circuit_breaker(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from http import HTTPMethod, HTTPStatus
+
+        import pytest
+
+        from fastapi_typed_client import (
+            FastAPIClientCircuitBreaker,
+            FastAPIClientCircuitOpenError,
+            FastAPIClientRetryPolicy,
+        )
+
+        options = client._options  # noqa: SLF001
+        breaker = options.circuit_breaker = FastAPIClientCircuitBreaker(
+            window=4, min_calls=4, open_duration=3600.0
+        )
+        assert client.status(ok=True).data == 1
+        for _ in range(2):
+            result = client.status(ok=False)
+            assert result.status == HTTPStatus.SERVICE_UNAVAILABLE
+        assert breaker.state(HTTPMethod.GET, "/status") == "closed"
+        assert client.status(ok=False).status == HTTPStatus.SERVICE_UNAVAILABLE
+        assert breaker.state(HTTPMethod.GET, "/status") == "open"
+
+        # Open circuits fail fast without sending requests or being retried, while
+        # other routes are unaffected.
+        options.retry_policy = FastAPIClientRetryPolicy(backoff=0.0)
+        with pytest.raises(FastAPIClientCircuitOpenError) as exc_info:
+            client.status(ok=True)
+        assert exc_info.value.path == "/status"
+        assert exc_info.value.remaining > 0
+        assert client.other().data == 4
+        options.retry_policy = None
+
+        # Once `open_duration` has passed, a failed probe opens the circuit again and a
+        # successful one closes it.
+        breaker.open_duration = 0.0
+        assert breaker.state(HTTPMethod.GET, "/status") == "half_open"
+        assert client.status(ok=False).status == HTTPStatus.SERVICE_UNAVAILABLE
+        assert breaker.state(HTTPMethod.GET, "/status") == "half_open"
+        assert client.status(ok=True).data == 6
+        assert breaker.state(HTTPMethod.GET, "/status") == "closed"
+
+        # Slow calls count as failures.
+        breaker.slow_call_duration = 0.0
+        for _ in range(4):
+            client.status(ok=True)
+        assert breaker.state(HTTPMethod.GET, "/status") == "half_open"
+        breaker.reset()
+        assert breaker.state(HTTPMethod.GET, "/status") == "closed"
+
+    client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
+
+
+async def test_circuit_breaker_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from http import HTTPMethod
+
+        import pytest
+
+        from fastapi_typed_client import (
+            FastAPIClientCircuitBreaker,
+            FastAPIClientCircuitOpenError,
+        )
+
+        options = client._options  # noqa: SLF001
+        breaker = options.circuit_breaker = FastAPIClientCircuitBreaker(
+            window=2, min_calls=2, open_duration=3600.0
+        )
+        await client.status(ok=False)
+        await client.status(ok=False)
+        assert breaker.state(HTTPMethod.GET, "/status") == "open"
+        with pytest.raises(FastAPIClientCircuitOpenError):
+            await client.status(ok=True)
+        breaker.open_duration = 0.0
+        assert (await client.status(ok=True)).data == 3
+        assert breaker.state(HTTPMethod.GET, "/status") == "closed"
+
+    await async_client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
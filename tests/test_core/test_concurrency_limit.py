@@ -0,0 +1,76 @@
+from typing import Any
+
+import pytest
+from anyio import sleep
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from ..client_tester import AsyncClientTester
+
+_UNAVAILABLE: dict[int | str, dict[str, Any]] = {503: {"model": str}}
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+    in_flight = [0]
+    max_in_flight = [0]
+
+    @app.get("/work", response_model=int, responses=_UNAVAILABLE)
+    async def work(duration: float = 0.0, fail: bool = False) -> JSONResponse:
+        in_flight[0] += 1
+        max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        await sleep(duration)
+        in_flight[0] -= 1
+        if fail:
+            return JSONResponse("unavailable", status_code=503)
+        return JSONResponse(max_in_flight[0])
+
+    return app
+
+
+# `import_client_base=True` is used so we can import
+# `FastAPIClientConcurrencyLimiter` from `fastapi_typed_client`.
+
+
+async def test_concurrency_limit(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from anyio import create_task_group
+
+        from fastapi_typed_client import FastAPIClientConcurrencyLimiter
+
+        # Calls over the limit wait, while successful calls that use the limit raise
+        # it.
+        options = client._options  # noqa: SLF001
+        limiter = options.concurrency_limiter = FastAPIClientConcurrencyLimiter(2)
+        async with create_task_group() as task_group:
+            for _ in range(8):
+                task_group.start_soon(client.work, 0.01)
+        max_in_flight = (await client.work()).data
+        info = limiter.info()
+        assert 2 < info.limit < 8
+        assert max_in_flight <= info.limit
+        assert (info.in_flight, info.waiting, info.decreases) == (0, 0, 0)
+
+        # Failed and slow calls decrease the limit.
+        limiter = options.concurrency_limiter = FastAPIClientConcurrencyLimiter(
+            10, backoff_ratio=0.5
+        )
+        await client.work(fail=True)
+        assert limiter.info()[::3] == (5, 1)
+        await client.work(duration=0.0)
+        await client.work(duration=0.1)
+        assert limiter.info()[::3] == (2, 2)
+        for _ in range(3):
+            await client.work(fail=True)
+        assert limiter.info()[::3] == (1, 5)
+
+    await async_client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
@@ -0,0 +1,93 @@
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import pytest
+from anyio.from_thread import start_blocking_portal
+from fastapi import FastAPI
+from httpx2 import AsyncClient, Client
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import TEXT_AND_NUM_DATA, TextAndNum
+from .test_stream_incremental import _serve_uvicorn
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/foo")
+    def foo() -> TextAndNum:
+        return TEXT_AND_NUM_DATA[0]
+
+    return app
+
+
+# The clients passed to the client testers are only used to look up the server's URL.
+
+
+@pytest.fixture
+def app_client(app: FastAPI) -> Iterator[Client]:
+    with (
+        start_blocking_portal() as portal,
+        portal.wrap_async_context_manager(_serve_uvicorn(app)) as url,
+        Client(base_url=url) as client,
+    ):
+        yield client
+
+
+@pytest.fixture
+async def async_app_client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    async with _serve_uvicorn(app) as url, AsyncClient(base_url=url) as client:
+        yield client
+
+
+def test_from_url(
+    app: FastAPI, app_client: Client, client_tester: ClientTester
+) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from httpx2 import Timeout
+
+        from ..shared import TEXT_AND_NUM_DATA
+
+        options = type(client._options)(validation="none")  # noqa: SLF001
+        with type(client).from_url(
+            str(client.client.base_url),
+            max_connections=4,
+            keepalive_expiry=1.0,
+            timeout=3.0,
+            connect_timeout=1.0,
+            preconnect=3,
+            options=options,
+        ) as url_client:
+            assert url_client._options is options  # noqa: SLF001
+            assert url_client.client.timeout == Timeout(3.0, connect=1.0)
+            pool = url_client.client._transport._pool  # noqa: SLF001
+            assert pool._max_connections == 4  # noqa: SLF001
+            assert pool._max_keepalive_connections == 4  # noqa: SLF001
+            assert pool._keepalive_expiry == 1.0  # noqa: SLF001
+
+            assert len(pool.connections) == 3
+            assert url_client.foo().data == TEXT_AND_NUM_DATA[0].model_dump()
+            assert len(pool.connections) == 3
+
+    client_tester(app, client_test, httpx_client=app_client)
+
+
+async def test_from_url_async(
+    app: FastAPI, async_app_client: AsyncClient, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from ..shared import TEXT_AND_NUM_DATA
+
+        async with type(client).from_url(
+            str(client.client.base_url), max_connections=4, preconnect=3
+        ) as url_client:
+            pool = url_client.client._transport._pool  # noqa: SLF001
+            assert pool._max_connections == 4  # noqa: SLF001
+            assert pool._keepalive_expiry == 4.0  # noqa: SLF001
+
+            assert len(pool.connections) == 3
+            assert (await url_client.foo()).data == TEXT_AND_NUM_DATA[0]
+            assert len(pool.connections) == 3
+
+    await async_client_tester(app, client_test, httpx_client=async_app_client)
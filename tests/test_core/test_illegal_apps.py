@@ -1,4 +1,6 @@
+from pathlib import Path
 from typing import Annotated
+from warnings import catch_warnings, simplefilter
 
 import pytest
 from fastapi import Body, Depends, FastAPI, Form, Header, Query, UploadFile
@@ -35,6 +37,42 @@ def test_route_without_methods() -> None:
         generate_fastapi_typed_client(app)
 
 
+@pytest.mark.parametrize(
+    "name", ["batch", "batched", "client", "from_app", "_options", "_route_handler"]
+)
+def test_route_with_reserved_name(name: str) -> None:
+    app = FastAPI()
+
+    @app.get("/", name=name)
+    def endpoint() -> None:
+        pass
+
+    @app.get("/other", name=f"{name}_")
+    def other_endpoint() -> None:
+        pass
+
+    with pytest.warns(UserWarning, match=f"generating it as `{name}__`"):
+        generate_fastapi_typed_client(app, output_path="client.py")
+    code = Path("client.py").read_text(encoding="utf-8")
+    assert f"def {name}__(" in code
+    assert f"def {name}_(" in code
+
+
+@pytest.mark.parametrize("name", ["map", "metrics", "options", "preconnect"])
+def test_route_with_unreserved_name(name: str) -> None:
+    app = FastAPI()
+
+    @app.get("/", name=name)
+    def endpoint() -> None:
+        pass
+
+    with catch_warnings():
+        simplefilter("error")
+        generate_fastapi_typed_client(app, output_path="client.py")
+    code = Path("client.py").read_text(encoding="utf-8")
+    assert f"def {name}(" in code
+
+
 def test_route_with_empty_path() -> None:
     app = FastAPI()
 
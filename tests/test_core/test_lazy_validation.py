@@ -0,0 +1,112 @@
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import TEXT_AND_NUM_DATA, TextAndNum
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/foo")
+    def foo() -> list[TextAndNum]:
+        return TEXT_AND_NUM_DATA
+
+    # Returns a body that doesn't match the declared response model.
+    @app.get("/invalid", response_model=TextAndNum)
+    def invalid() -> JSONResponse:
+        return JSONResponse({"text": "foo"})
+
+    return app
+
+
+def test_lazy_validation(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from http import HTTPStatus
+
+        from pydantic import ValidationError
+
+        from ..shared import TEXT_AND_NUM_DATA
+
+        eager = client.foo()
+        lazy = client.foo(client_exts={"lazy_validation": True})
+        assert type(lazy) is not type(eager)
+        assert isinstance(lazy, type(eager))
+        assert lazy.status == HTTPStatus.OK
+        assert lazy.data == TEXT_AND_NUM_DATA
+        assert lazy.data is lazy.data
+        assert lazy[:2] == eager[:2]
+        expected = (HTTPStatus.OK, TEXT_AND_NUM_DATA, lazy.model, lazy.response)
+        assert lazy == expected
+        assert not lazy != expected  # noqa: SIM202
+        assert lazy <= expected
+        assert lazy >= expected
+        assert not lazy < expected
+        assert not expected > lazy
+        assert TEXT_AND_NUM_DATA in lazy
+        assert lazy[1] == TEXT_AND_NUM_DATA
+        status, data, _, _ = lazy
+        assert (status, data) == (HTTPStatus.OK, TEXT_AND_NUM_DATA)
+        assert lazy._replace(status=HTTPStatus.CREATED).data == TEXT_AND_NUM_DATA
+        assert repr(lazy).endswith(repr(eager).removeprefix(type(eager).__name__))
+
+        try:
+            client.invalid()
+        except ValidationError:
+            pass
+        else:
+            raise AssertionError
+
+        # Only accessing the data validates it, and does so every time it fails.
+        result = client.invalid(client_exts={"lazy_validation": True})
+        assert result.status == HTTPStatus.OK
+        for _ in range(2):
+            try:
+                _ = result.data
+            except ValidationError:
+                pass
+            else:
+                raise AssertionError
+
+        options = client._options  # noqa: SLF001
+        options.lazy_validation = True
+        result = client.invalid()
+        assert result.response.json() == {"text": "foo"}
+        result = client.foo(client_exts={"lazy_validation": False})
+        assert type(result) is type(eager)
+
+    client_tester(app, client_test)
+
+
+async def test_lazy_validation_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from http import HTTPStatus
+
+        from pydantic import ValidationError
+
+        from ..shared import TEXT_AND_NUM_DATA
+
+        eager = await client.foo()
+        lazy = await client.foo(client_exts={"lazy_validation": True})
+        assert type(lazy) is not type(eager)
+        assert lazy.data == TEXT_AND_NUM_DATA
+        assert lazy[:2] == eager[:2]
+
+        options = client._options  # noqa: SLF001
+        options.lazy_validation = True
+        result = await client.invalid()
+        assert result.status == HTTPStatus.OK
+        try:
+            _ = result.data
+        except ValidationError:
+            pass
+        else:
+            raise AssertionError
+
+    await async_client_tester(app, client_test)
@@ -0,0 +1,95 @@
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import TextAndNum
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/echo")
+    def echo(item: TextAndNum) -> TextAndNum:
+        return item
+
+    @app.get("/broken")
+    def broken() -> int:
+        raise RuntimeError
+
+    return app
+
+
+# `import_client_base=True` is used so we can import `FastAPIClientMetrics` from
+# `fastapi_typed_client`.
+
+
+def test_metrics(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        import pytest
+
+        from fastapi_typed_client import FastAPIClientMetrics
+
+        options = client._options  # noqa: SLF001
+        metrics = options.metrics = FastAPIClientMetrics(buckets=(60.0, 0.0))
+        for _ in range(2):
+            client.echo(item={"text": "a", "num": 1})
+        with pytest.raises(RuntimeError):
+            client.broken()
+
+        echo = metrics.to_dict()["echo"]
+        assert (echo["method"], echo["path"]) == ("POST", "/echo")
+        assert echo["requests"] == {"200": 2}
+        assert echo["in_flight"] == 0
+        assert echo["latency"]["buckets"] == {0.0: 0, 60.0: 2, float("inf"): 2}
+        assert echo["latency"]["count"] == 2
+        assert echo["latency"]["sum"] > 0
+        assert echo["bytes_sent"] == echo["bytes_received"] == 2 * 20
+        assert metrics.to_dict()["broken"]["requests"] == {"error": 1}
+
+        rendered = metrics.render()
+        assert "# TYPE fastapi_client_requests_total counter\n" in rendered
+        labels = 'route="echo",method="POST",path="/echo"'
+        for line in (
+            f'fastapi_client_requests_total{{{labels},status="200"}} 2',
+            f"fastapi_client_requests_in_flight{{{labels}}} 0",
+            f'fastapi_client_request_duration_seconds_bucket{{{labels},le="60.0"}} 2',
+            f'fastapi_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2',
+            f"fastapi_client_request_duration_seconds_count{{{labels}}} 2",
+            f"fastapi_client_request_bytes_total{{{labels}}} 40",
+            f"fastapi_client_response_bytes_total{{{labels}}} 40",
+            'fastapi_client_requests_total{route="broken",method="GET",'
+            'path="/broken",status="error"} 1',
+        ):
+            assert f"\n{line}\n" in rendered
+
+    client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
+
+
+async def test_metrics_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from fastapi_typed_client import FastAPIClientMetrics
+
+        options = client._options  # noqa: SLF001
+        metrics = options.metrics = FastAPIClientMetrics(prefix="api")
+        await client.echo(item={"text": "a", "num": 1})
+        assert metrics.to_dict()["echo"]["requests"] == {"200": 1}
+        assert "\napi_requests_total{" in metrics.render()
+
+    await async_client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
@@ -0,0 +1,79 @@
+from datetime import date
+from typing import Annotated, Any
+
+import pytest
+from fastapi import Body, FastAPI, Request
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import TextAndNum, TextAndNumAliased
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/bulk")
+    def bulk(items: list[TextAndNumAliased], request: Request) -> str:
+        return (
+            f"{request.headers['content-type']}|{len(items)}|"
+            f"{''.join(item.text for item in items)}|{sum(item.num for item in items)}"
+        )
+
+    @app.post("/embedded")
+    def embedded(
+        items: Annotated[list[TextAndNum], Body(embed=True)],
+        day: Annotated[date, Body(embed=True)],
+    ) -> str:
+        return f"{day}|{','.join(f'{item.text}-{item.num}' for item in items)}"
+
+    @app.post("/optional")
+    def optional(
+        request: Request, item: Annotated[TextAndNum | None, Body()] = None
+    ) -> str:
+        return f"{request.headers.get('content-type')}|{item}"
+
+    return app
+
+
+def test_body_json(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from datetime import date
+
+        from ..shared import TextAndNum, TextAndNumAliased
+
+        items = [TextAndNumAliased(Text="ä", Num=i) for i in range(1000)]
+        assert client.bulk(items).data == f"application/json|1000|{'ä' * 1000}|499500"
+
+        items = [TextAndNum(text="foo", num=1), TextAndNum(text="bar", num=2)]
+        result = client.embedded(items=items, day=date(2000, 1, 2))
+        assert result.data == "2000-01-02|foo-1,bar-2"
+
+        assert client.optional().data == "None|None"
+        assert client.optional(None).data == "None|None"
+        result = client.optional(TextAndNum(text="foo", num=1))
+        assert result.data == "application/json|text='foo' num=1"
+
+    client_tester(app, client_test, assert_format_of_generated_code=False)
+
+
+async def test_body_json_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from datetime import date
+
+        from ..shared import TextAndNum, TextAndNumAliased
+
+        items = [TextAndNumAliased(Text="ä", Num=i) for i in range(1000)]
+        result = await client.bulk(items)
+        assert result.data == f"application/json|1000|{'ä' * 1000}|499500"
+
+        items = [TextAndNum(text="foo", num=1), TextAndNum(text="bar", num=2)]
+        result = await client.embedded(items=items, day=date(2000, 1, 2))
+        assert result.data == "2000-01-02|foo-1,bar-2"
+
+        assert (await client.optional()).data == "None|None"
+        result = await client.optional(TextAndNum(text="foo", num=1))
+        assert result.data == "application/json|text='foo' num=1"
+
+    await async_client_tester(app, client_test, assert_format_of_generated_code=False)
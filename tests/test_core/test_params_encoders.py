@@ -0,0 +1,145 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from pathlib import PurePosixPath
+from typing import Annotated, Any
+from uuid import UUID
+
+import pytest
+from fastapi import Body, FastAPI, Header, Query
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import ColorEnum, FooBarEnum
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/scalars/{day}/{uid}")
+    def scalars(
+        day: date,
+        uid: UUID,
+        at: datetime,
+        moment: time,
+        color: ColorEnum,
+        foo_bar: FooBarEnum,
+        path: PurePosixPath,
+        amount: Decimal,
+        flag: bool = False,
+        maybe_day: date | None = None,
+    ) -> str:
+        return (
+            f"{day}|{uid}|{at.isoformat()}|{moment}|{color.value}|{foo_bar.value}|"
+            f"{path}|{amount}|{flag}|{maybe_day}"
+        )
+
+    @app.get("/sequences")
+    def sequences(
+        colors: Annotated[list[ColorEnum], Query()],
+        days: Annotated[list[date], Query()],
+        foo_bars: Annotated[list[FooBarEnum] | None, Query()] = None,
+    ) -> str:
+        return (
+            f"{','.join(c.value for c in colors)}|{','.join(map(str, days))}|"
+            f"{','.join(str(foo_bar.value) for foo_bar in foo_bars or [])}"
+        )
+
+    @app.get("/text/{text}")
+    def text(text: str, tags: Annotated[list[str], Query()]) -> str:
+        return f"{text}|{','.join(tags)}"
+
+    @app.get("/header")
+    def header(x_day: Annotated[date, Header()]) -> str:
+        return str(x_day)
+
+    @app.post("/body")
+    def body(
+        day: Annotated[date, Body()], colors: Annotated[list[ColorEnum], Body()]
+    ) -> str:
+        return f"{day}|{','.join(c.value for c in colors)}"
+
+    return app
+
+
+def test_params_encoders(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from datetime import date, datetime, time
+        from decimal import Decimal
+        from enum import Enum
+        from pathlib import PurePosixPath
+        from uuid import UUID
+
+        from ..shared import ColorEnum, FooBarEnum
+
+        uid = UUID(int=42)
+        result = client.scalars(
+            day=date(2000, 1, 2),
+            uid=uid,
+            at=datetime(2000, 1, 2, 3, 4, 5),  # noqa: DTZ001
+            moment=time(6, 7),
+            color=ColorEnum.GREEN,
+            foo_bar=FooBarEnum.BAR,
+            path=PurePosixPath("a/b"),
+            amount=Decimal("1.5"),
+            flag=True,
+            maybe_day=date(2001, 1, 1),
+        )
+        assert result.data == (
+            f"2000-01-02|{uid}|2000-01-02T03:04:05|06:07:00|green|456|a/b|1.5|True|"
+            "2001-01-01"
+        )
+
+        result = client.sequences(
+            colors=[ColorEnum.RED, ColorEnum.GREEN],
+            days=[date(2000, 1, 2), date(2000, 1, 3)],
+            foo_bars=[FooBarEnum.FOO, FooBarEnum.BAR],
+        )
+        assert result.data == "red,green|2000-01-02,2000-01-03|123,456"
+
+        # Subclasses of the declared type aren't passed through as is.
+        class Shade(str, Enum):  # noqa: UP042
+            DARK = "dark"
+
+        assert (
+            client.text(text=Shade.DARK, tags=[Shade.DARK, "x"]).data == "dark|dark,x"
+        )
+
+        assert client.header(x_day=date(2000, 1, 2)).data == "2000-01-02"
+        result = client.body(day=date(2000, 1, 2), colors=[ColorEnum.RED])
+        assert result.data == "2000-01-02|red"
+
+    client_tester(app, client_test, assert_format_of_generated_code=False)
+
+
+async def test_params_encoders_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from datetime import date, datetime, time
+        from decimal import Decimal
+        from pathlib import PurePosixPath
+        from uuid import UUID
+
+        from ..shared import ColorEnum, FooBarEnum
+
+        uid = UUID(int=42)
+        result = await client.scalars(
+            day=date(2000, 1, 2),
+            uid=uid,
+            at=datetime(2000, 1, 2),  # noqa: DTZ001
+            moment=time(6, 7),
+            color=ColorEnum.RED,
+            foo_bar=FooBarEnum.FOO,
+            path=PurePosixPath("c"),
+            amount=Decimal(2),
+        )
+        assert result.data == (
+            f"2000-01-02|{uid}|2000-01-02T00:00:00|06:07:00|red|123|c|2|False|None"
+        )
+
+        result = await client.sequences(
+            colors=[ColorEnum.GREEN], days=[date(2000, 1, 2)]
+        )
+        assert result.data == "green|2000-01-02|"
+
+    await async_client_tester(app, client_test, assert_format_of_generated_code=False)
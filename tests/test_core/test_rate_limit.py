@@ -0,0 +1,100 @@
+from typing import Any
+from unittest.mock import call
+
+import pytest
+from fastapi import FastAPI
+from pytest_mock import MockerFixture
+
+from ..client_tester import AsyncClientTester, ClientTester
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/limited")
+    def limited() -> str:
+        return "limited"
+
+    @app.get("/unlimited")
+    def unlimited() -> str:
+        return "unlimited"
+
+    return app
+
+
+# `import_client_base=True` is used so we can import `FastAPIClientRateLimiter` from
+# `fastapi_typed_client`.
+
+
+def test_rate_limit(
+    app: FastAPI, client_tester: ClientTester, mocker: MockerFixture
+) -> None:
+    # A fake clock that only advances while sleeping, so delays are exact.
+    clock = [0.0]
+    mocker.patch("fastapi_typed_client.client.monotonic", side_effect=lambda: clock[0])
+    sleep = mocker.patch(
+        "fastapi_typed_client.client.sleep",
+        side_effect=lambda delay: clock.__setitem__(0, clock[0] + delay),
+    )
+
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from fastapi_typed_client import FastAPIClientRateLimiter
+
+        # The first `burst` calls are sent immediately, later ones are spaced out.
+        options = client._options  # noqa: SLF001
+        limiter = options.rate_limiter = FastAPIClientRateLimiter(
+            routes={"limited": (4.0, 2.0)}
+        )
+        for _ in range(4):
+            assert client.limited().data == "limited"
+            assert client.unlimited().data == "unlimited"
+        limited = limiter.info("limited")
+        assert (limited.calls, limited.delayed, limited.waited) == (4, 2, 0.5)
+        assert limiter.info("unlimited") == (4, 0, 0.0)
+        assert limiter.info().calls == 8
+        assert limiter.info("other") == (0, 0, 0.0)
+
+        # The client-wide bucket applies to all routes.
+        limiter = options.rate_limiter = FastAPIClientRateLimiter(4.0, 1.0)
+        client.limited()
+        client.unlimited()
+        assert limiter.info() == (2, 1, 0.25)
+
+    client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+    )
+    assert sleep.call_args_list == [call(0.25)] * 3
+
+
+async def test_rate_limit_async(
+    app: FastAPI, async_client_tester: AsyncClientTester, mocker: MockerFixture
+) -> None:
+    # A frozen clock, as if all calls reserved their tokens at the same time.
+    mocker.patch("fastapi_typed_client.client.monotonic", return_value=0.0)
+    mocker.patch("fastapi_typed_client.client.current_time", return_value=0.0)
+    sleep_until = mocker.patch("fastapi_typed_client.client.sleep_until")
+
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from anyio import create_task_group
+
+        from fastapi_typed_client import FastAPIClientRateLimiter
+
+        # Concurrent calls are queued behind each other.
+        options = client._options  # noqa: SLF001
+        limiter = options.rate_limiter = FastAPIClientRateLimiter(4.0, 1.0)
+        async with create_task_group() as task_group:
+            for _ in range(3):
+                task_group.start_soon(client.limited)
+        assert limiter.info() == (3, 2, 0.75)
+
+    await async_client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+    )
+    assert sorted(sleep_until.await_args_list) == [call(0.25), call(0.5)]
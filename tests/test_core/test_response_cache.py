@@ -0,0 +1,147 @@
+from typing import Annotated, Any
+
+import pytest
+from fastapi import FastAPI, Header, Response
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import TEXT_AND_NUM_DATA, TextAndNum
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/fresh")
+    def fresh(num: int, response: Response) -> TextAndNum:
+        response.headers["Cache-Control"] = "max-age=60"
+        return TextAndNum(text="fresh", num=num)
+
+    @app.get("/revalidated", response_model=list[TextAndNum])
+    def revalidated(
+        response: Response, if_none_match: Annotated[str | None, Header()] = None
+    ) -> Any:  # noqa: ANN401
+        if if_none_match == '"v1"':
+            return Response(status_code=304, headers={"ETag": '"v1"'})
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["ETag"] = '"v1"'
+        return TEXT_AND_NUM_DATA
+
+    @app.get("/no-store")
+    def no_store(response: Response) -> TextAndNum:
+        response.headers["Cache-Control"] = "no-store, max-age=60"
+        return TEXT_AND_NUM_DATA[0]
+
+    @app.post("/post")
+    def post(response: Response) -> TextAndNum:
+        response.headers["Cache-Control"] = "max-age=60"
+        return TEXT_AND_NUM_DATA[0]
+
+    return app
+
+
+# `import_client_base=True` is used so we can import `FastAPIClientResponseCache`
+# from `fastapi_typed_client`.
+
+
+def test_response_cache(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from fastapi_typed_client import FastAPIClientResponseCache
+
+        from ..shared import TEXT_AND_NUM_DATA, TextAndNum
+
+        options = client._options  # noqa: SLF001
+        assert options.response_cache is None
+        assert client.fresh(num=1) is not client.fresh(num=1)
+
+        cache = options.response_cache = FastAPIClientResponseCache()
+        result = client.fresh(num=1)
+        assert client.fresh(num=1) is result
+        assert client.fresh(num=2) is not result
+        info = cache.info()
+        assert (info.hits, info.revalidations, info.misses, info.entries) == (
+            1,
+            0,
+            2,
+            2,
+        )
+        assert info.bytes == 2 * len(result.response.content)
+
+        # Revalidated via `If-None-Match`, the server answers `304 Not Modified`.
+        result = client.revalidated()
+        assert result.data == TEXT_AND_NUM_DATA
+        assert client.revalidated() is result
+        assert cache.info().revalidations == 1
+
+        assert client.no_store() is not client.no_store()
+        assert client.post() is not client.post()
+        assert cache.info().entries == 3
+
+        # Results built with different per-call options aren't shared.
+        raw = client.fresh(num=1, client_exts={"validation": "none"})
+        assert raw.data == {"text": "fresh", "num": 1}
+        assert client.fresh(num=1, client_exts={"validation": "none"}) is raw
+        assert client.fresh(num=1).data == TextAndNum(text="fresh", num=1)
+        lazy = client.fresh(num=1, client_exts={"lazy_validation": True})
+        assert lazy is not client.fresh(num=1)
+        assert client.fresh(num=1, client_exts={"encoding": "latin-1"}) is not lazy
+        assert cache.info().entries == 6
+
+        cache.clear()
+        assert cache.info().entries == 0
+        assert cache.info().bytes == 0
+
+        # Evicts the least recently used entries beyond `max_entries` / `max_bytes`.
+        cache = options.response_cache = FastAPIClientResponseCache(max_entries=2)
+        first = client.fresh(num=1)
+        client.fresh(num=2)
+        assert client.fresh(num=1) is first
+        client.fresh(num=3)
+        assert cache.info().entries == 2
+        assert client.fresh(num=1) is first
+        assert client.fresh(num=2) is not first
+        assert cache.info().entries == 2
+
+        size = len(first.response.content)
+        cache = options.response_cache = FastAPIClientResponseCache(max_bytes=size)
+        client.fresh(num=1)
+        client.fresh(num=2)
+        assert cache.info().entries == 1
+        assert cache.info().bytes == size
+
+    client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
+
+
+async def test_response_cache_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from fastapi_typed_client import (
+            FastAPIClientAsyncOptions,
+            FastAPIClientResponseCache,
+        )
+
+        cache = FastAPIClientResponseCache()
+        async with type(client).from_app(
+            client.client._transport.app,  # noqa: SLF001
+            options=FastAPIClientAsyncOptions(response_cache=cache),
+        ) as cached_client:
+            result = await cached_client.fresh(num=1)
+            assert await cached_client.fresh(num=1) is result
+            result = await cached_client.revalidated()
+            assert await cached_client.revalidated() is result
+            assert cache.info().hits == 1
+            assert cache.info().revalidations == 1
+
+    await async_client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
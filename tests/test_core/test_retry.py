@@ -0,0 +1,118 @@
+from typing import Annotated, Any
+
+import pytest
+from fastapi import FastAPI, Header
+from fastapi.responses import JSONResponse
+
+from ..client_tester import AsyncClientTester, ClientTester
+
+_UNAVAILABLE: dict[int | str, dict[str, Any]] = {503: {"model": str}}
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+    calls: dict[str, list[str | None]] = {}
+
+    @app.get("/flaky", response_model=int, responses=_UNAVAILABLE)
+    def flaky(key: str, fails: int, retry_after: str | None = None) -> JSONResponse:
+        attempts = calls.setdefault(key, [])
+        attempts.append(None)
+        if len(attempts) <= fails:
+            headers = {"Retry-After": retry_after} if retry_after else None
+            return JSONResponse("unavailable", status_code=503, headers=headers)
+        return JSONResponse(len(attempts))
+
+    @app.post("/create", response_model=int, responses=_UNAVAILABLE)
+    def create(
+        key: str, idempotency_key: Annotated[str | None, Header()] = None
+    ) -> JSONResponse:
+        attempts = calls.setdefault(key, [])
+        attempts.append(idempotency_key)
+        if len(attempts) == 1:
+            return JSONResponse("unavailable", status_code=503)
+        return JSONResponse(len(attempts))
+
+    @app.get("/idempotency-keys")
+    def idempotency_keys(key: str) -> list[str | None]:
+        return calls[key]
+
+    return app
+
+
+# `import_client_base=True` is used so we can import `FastAPIClientRetryPolicy`
+# from `fastapi_typed_client`.
+
+
+def test_retry(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from http import HTTPStatus
+
+        from fastapi_typed_client import FastAPIClientRetryPolicy
+
+        assert client.flaky(key="a", fails=1).status == HTTPStatus.SERVICE_UNAVAILABLE
+
+        options = client._options  # noqa: SLF001
+        policy = options.retry_policy = FastAPIClientRetryPolicy(backoff=0.0)
+        assert client.flaky(key="b", fails=2).data == 3
+        assert policy.info() == (2, 0, 0)
+
+        result = client.flaky(key="c", fails=3)
+        assert result.status == HTTPStatus.SERVICE_UNAVAILABLE
+        assert policy.info() == (4, 1, 0)
+
+        # Waits for `Retry-After`, unless it is longer than `max_backoff`.
+        options.retry_policy = FastAPIClientRetryPolicy(backoff=0.0)
+        assert client.flaky(key="d", fails=1, retry_after="0").data == 2
+        result = client.flaky(key="e", fails=1, retry_after="3600")
+        assert result.status == HTTPStatus.SERVICE_UNAVAILABLE
+
+        # Per-call overrides.
+        result = client.flaky(key="f", fails=1, client_exts={"retry_policy": None})
+        assert result.status == HTTPStatus.SERVICE_UNAVAILABLE
+
+        # `POST` is only retried with an idempotency key, which stays the same.
+        result = client.create(key="g")
+        assert result.status == HTTPStatus.SERVICE_UNAVAILABLE
+        policy = FastAPIClientRetryPolicy(backoff=0.0, idempotency_key=True)
+        assert client.create(key="h", client_exts={"retry_policy": policy}).data == 2
+        first, second = client.idempotency_keys(key="h").data
+        assert first is not None
+        assert first == second
+
+        # Failed attempts use up the shared retry budget.
+        policy = options.retry_policy = FastAPIClientRetryPolicy(
+            backoff=0.0, max_tokens=4.0
+        )
+        result = client.flaky(key="i", fails=3)
+        assert result.status == HTTPStatus.SERVICE_UNAVAILABLE
+        assert policy.info() == (1, 0, 1)
+
+    client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
+
+
+async def test_retry_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from fastapi_typed_client import FastAPIClientRetryPolicy
+
+        options = client._options  # noqa: SLF001
+        policy = options.retry_policy = FastAPIClientRetryPolicy(backoff=0.0)
+        assert (await client.flaky(key="a", fails=2)).data == 3
+        assert (await client.flaky(key="b", fails=1, retry_after="0")).data == 2
+        assert policy.info().retries == 3
+
+    await async_client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
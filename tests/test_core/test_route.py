@@ -0,0 +1,67 @@
+from datetime import date
+from enum import Enum
+from http import HTTPMethod, HTTPStatus
+from uuid import UUID
+
+import pytest
+
+from fastapi_typed_client import FastAPIClientRoute, FastAPIClientRouteParam
+
+
+@pytest.fixture
+def route() -> FastAPIClientRoute:
+    return FastAPIClientRoute(
+        name="foo",
+        path="/foo/{foo_id}/bar/{bar-id}{unknown}",
+        method=HTTPMethod.GET,
+        default_status=HTTPStatus.OK,
+        models={HTTPStatus.OK: str},
+        params=(
+            FastAPIClientRouteParam("query", "q", "enum", is_sequence=True),
+            FastAPIClientRouteParam("path", "bar-id", "identity"),
+            FastAPIClientRouteParam(
+                "security", "Authorization", security_kind="http_bearer"
+            ),
+            FastAPIClientRouteParam("path", "foo_id", "str"),
+            FastAPIClientRouteParam("header", "x-h"),
+        ),
+    )
+
+
+def test_route_layout(route: FastAPIClientRoute) -> None:
+    assert route.path_segments == ("/foo/", "/bar/", "{unknown}")
+    assert [param[:2] for param in route.path_params] == [(3, "foo_id"), (1, "bar-id")]
+    assert [param[:2] for param in route.query_params] == [(0, "q")]
+    assert [param[:2] for param in route.header_params] == [(4, "x-h")]
+    assert route.security_params == ((2, "Authorization", "http_bearer"),)
+    assert route.cookie_params == route.body_params == route.file_params == ()
+    assert route.form_params == ()
+
+
+def test_route_encoders(route: FastAPIClientRoute) -> None:
+    class Color(Enum):
+        RED = "red"
+
+    encode_foo_id = route.path_params[0][2]
+    encode_bar_id = route.path_params[1][2]
+    encode_q = route.query_params[0][2]
+    encode_h = route.header_params[0][2]
+    uuid = UUID(int=1)
+    assert encode_foo_id(uuid) == str(uuid)
+    assert encode_bar_id(3.5) == 3.5
+    assert encode_q([Color.RED, "blue"]) == ["red", "blue"]
+    assert encode_q(None) is None
+    assert encode_h(date(2000, 1, 2)) == "2000-01-02"
+
+
+def test_route_is_immutable(route: FastAPIClientRoute) -> None:
+    with pytest.raises(AttributeError):
+        route.path = "/bar"
+    with pytest.raises(AttributeError):
+        del route.path
+    with pytest.raises(AttributeError):
+        route.something_else = True  # type: ignore[attr-defined]
+    assert (
+        repr(route)
+        == "FastAPIClientRoute(foo: GET /foo/{foo_id}/bar/{bar-id}{unknown})"
+    )
@@ -0,0 +1,115 @@
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from ..client_tester import AsyncClientTester
+from ..shared import TextAndNum
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+    calls = {"foo": 0, "bar": 0, "invalid": 0}
+
+    @app.get("/foo")
+    async def foo(num: int) -> TextAndNum:
+        import anyio
+
+        calls["foo"] += 1
+        await anyio.sleep(0.05)
+        return TextAndNum(text="foo", num=num)
+
+    @app.post("/bar")
+    async def bar() -> TextAndNum:
+        import anyio
+
+        calls["bar"] += 1
+        await anyio.sleep(0.05)
+        return TextAndNum(text="bar", num=0)
+
+    @app.get("/invalid", response_model=TextAndNum)
+    async def invalid() -> JSONResponse:
+        import anyio
+
+        calls["invalid"] += 1
+        await anyio.sleep(0.05)
+        return JSONResponse({"text": "invalid"})
+
+    @app.get("/calls")
+    def get_calls() -> dict[str, int]:
+        return calls
+
+    return app
+
+
+async def test_single_flight(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from collections.abc import Awaitable, Callable
+
+        from anyio import create_task_group
+        from pydantic import ValidationError
+
+        results = []
+        errors = []
+
+        async def call(
+            method: Callable[..., Awaitable[object]], **kwargs: object
+        ) -> None:
+            try:
+                results.append(await method(**kwargs))
+            except ValidationError as error:
+                errors.append(error)
+
+        async def burst(
+            method: Callable[..., Awaitable[object]], **kwargs: int
+        ) -> None:
+            results.clear()
+            async with create_task_group() as task_group:
+                for _ in range(5):
+                    task_group.start_soon(lambda: call(method, **kwargs))
+
+        await burst(client.foo, num=1)
+        assert len({id(result) for result in results}) == 5
+        assert (await client.get_calls()).data["foo"] == 5
+
+        options = client._options  # noqa: SLF001
+        options.single_flight = True
+        await burst(client.foo, num=1)
+        assert len({id(result) for result in results}) == 1
+        assert results[0].data.num == 1
+        assert (await client.get_calls()).data["foo"] == 6
+
+        # Only identical requests are coalesced.
+        async with create_task_group() as task_group:
+            task_group.start_soon(lambda: call(client.foo, num=2))
+            task_group.start_soon(lambda: call(client.foo, num=3))
+        assert (await client.get_calls()).data["foo"] == 8
+
+        # Calls with different per-call result options aren't coalesced either.
+        results.clear()
+        async with create_task_group() as task_group:
+            task_group.start_soon(lambda: call(client.foo, num=4))
+            task_group.start_soon(
+                lambda: call(client.foo, num=4, client_exts={"validation": "none"})
+            )
+        assert (await client.get_calls()).data["foo"] == 10
+        assert sorted(type(result.data).__name__ for result in results) == [
+            "TextAndNum",
+            "dict",
+        ]
+
+        # Non-idempotent methods are never coalesced.
+        await burst(client.bar)
+        assert len({id(result) for result in results}) == 5
+        assert (await client.get_calls()).data["bar"] == 5
+
+        # Errors are shared by all coalesced calls.
+        await burst(client.invalid)
+        assert len(errors) == 5
+        assert (await client.get_calls()).data["invalid"] == 1
+
+    await async_client_tester(app, client_test, assert_format_of_generated_code=False)
@@ -0,0 +1,131 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.sse import EventSourceResponse
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import TEXT_AND_NUM_DATA, TextAndNum
+
+
+async def _events(start: int) -> AsyncIterator[str]:
+    # Sends a single event per connection, so that each one has to be resumed.
+    for i in range(start, min(start + 1, len(TEXT_AND_NUM_DATA))):
+        item = TEXT_AND_NUM_DATA[i]
+        yield f"retry: 0\nid: {i}\ndata: {item.model_dump_json()}\n\n"
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/events", response_model=TextAndNum)
+    def events(request: Request) -> EventSourceResponse:
+        last_event_id = request.headers.get("Last-Event-ID")
+        start = 0 if last_event_id is None else int(last_event_id) + 1
+        if start == len(TEXT_AND_NUM_DATA):
+            return EventSourceResponse(_events(start), status_code=204)
+        return EventSourceResponse(_events(start))
+
+    return app
+
+
+# `import_client_base=True` is used so we can import `FastAPIClientSSEReconnectPolicy`
+# from `fastapi_typed_client`.
+
+
+def test_sse_reconnect(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from collections.abc import Iterator
+
+        import pytest
+        from httpx2 import Client, MockTransport, RemoteProtocolError, Response
+        from httpx2 import Request as HTTPXRequest
+
+        from fastapi_typed_client import (
+            FastAPIClientOptions,
+            FastAPIClientSSEReconnectPolicy,
+        )
+
+        from ..shared import TEXT_AND_NUM_DATA
+
+        # Streams the server closed aren't reconnected by default.
+        options = client._options  # noqa: SLF001
+        policy = options.sse_reconnect_policy = FastAPIClientSSEReconnectPolicy()
+        assert [event.data for event in client.events().data] == TEXT_AND_NUM_DATA[:1]
+        assert policy.info() == (0, 0)
+
+        # Reconnects resume after the last event ID, until the server answers `204`.
+        policy = options.sse_reconnect_policy = FastAPIClientSSEReconnectPolicy(
+            reconnect_on_close=True
+        )
+        events = list(client.events().data)
+        assert [event.data for event in events] == TEXT_AND_NUM_DATA
+        assert [event.id for event in events] == ["0", "1", "2"]
+        assert policy.info() == (3, 0)
+
+        # Per-call overrides.
+        result = client.events(client_exts={"sse_reconnect_policy": None})
+        assert [event.data for event in result.data] == TEXT_AND_NUM_DATA[:1]
+
+        # Connections that broke off are reconnected until `max_reconnects` in a row
+        # didn't receive any events, then the last error is re-raised.
+        last_event_ids: list[str | None] = []
+
+        def broken_stream(i: int) -> Iterator[bytes]:
+            if i < len(TEXT_AND_NUM_DATA):
+                data = TEXT_AND_NUM_DATA[i].model_dump_json().encode()
+                yield b"retry: 0\nid: %d\ndata: %b\n\n" % (i, data)
+            raise RemoteProtocolError("Peer closed connection.")
+
+        def handle(request: HTTPXRequest) -> Response:
+            last_event_ids.append(request.headers.get("Last-Event-ID"))
+            return Response(200, content=broken_stream(len(last_event_ids) - 1))
+
+        policy = FastAPIClientSSEReconnectPolicy(2)
+        broken_client = type(client)(
+            Client(transport=MockTransport(handle), base_url="http://testserver"),
+            options=FastAPIClientOptions(sse_reconnect_policy=policy),
+        )
+        received = []
+        with pytest.raises(RemoteProtocolError):
+            received.extend(event.data for event in broken_client.events().data)
+        assert received == TEXT_AND_NUM_DATA
+        assert last_event_ids == [None, "0", "1", "2", "2"]
+        assert policy.info() == (4, 1)
+
+    client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
+
+
+async def test_sse_reconnect_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from fastapi_typed_client import FastAPIClientSSEReconnectPolicy
+
+        from ..shared import TEXT_AND_NUM_DATA
+
+        options = client._options  # noqa: SLF001
+        policy = options.sse_reconnect_policy = FastAPIClientSSEReconnectPolicy(
+            reconnect_on_close=True
+        )
+        result = await client.events()
+        events = [event async for event in result.data]
+        assert [event.data for event in events] == TEXT_AND_NUM_DATA
+        assert [event.id for event in events] == ["0", "1", "2"]
+        assert policy.info() == (3, 0)
+
+    await async_client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
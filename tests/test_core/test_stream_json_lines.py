@@ -3,6 +3,13 @@ from typing import Any
 
 import pytest
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.sse import EventSourceResponse
+from httpx2 import Response
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import from_json
+
+from fastapi_typed_client import FastAPIClientAsyncBase, FastAPIClientBase
 
 from ..client_tester import AsyncClientTester, ClientTester
 from ..shared import TEXT_AND_NUM_DATA, TextAndNum
@@ -21,6 +28,18 @@ def app() -> FastAPI:
         for item in TEXT_AND_NUM_DATA:
             yield item
 
+    @app.get("/events", response_class=EventSourceResponse)
+    def events() -> Iterable[TextAndNum]:
+        yield from TEXT_AND_NUM_DATA
+
+    @app.get("/raw", response_class=StreamingResponse)
+    def raw() -> Iterable[bytes]:
+        yield b"raw"
+
+    @app.get("/single")
+    def single() -> TextAndNum:
+        return TEXT_AND_NUM_DATA[0]
+
     return app
 
 
@@ -78,3 +97,165 @@ async def test_stream_json_lines_async(
         assert next(expected_iter, None) is None
 
     await async_client_tester(app, client_test)
+
+
+def test_batched(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from collections.abc import Iterator
+        from typing import assert_type
+
+        import pytest
+
+        from ..shared import TEXT_AND_NUM_DATA, TextAndNum
+
+        batches = client.batched(client.foo_sync(), 2)
+        assert_type(batches, Iterator[list[TextAndNum]])  # type: ignore[client_tester_only]
+        assert list(batches) == [TEXT_AND_NUM_DATA[:2], TEXT_AND_NUM_DATA[2:]]
+
+        batches = client.batched(client.foo_async(), 1000, window=60.0)
+        assert list(batches) == [TEXT_AND_NUM_DATA]
+
+        batches = client.batched(client.foo_sync(), 2, validation="none")
+        assert list(batches) == [
+            [item.model_dump() for item in TEXT_AND_NUM_DATA[:2]],
+            [item.model_dump() for item in TEXT_AND_NUM_DATA[2:]],
+        ]
+
+        with pytest.raises(ValueError, match="at least 1"):
+            client.batched(client.foo_sync(), 0)
+        for result in (client.events(), client.raw(), client.single()):
+            with pytest.raises(TypeError, match="JSON Lines"):
+                client.batched(result)
+
+    client_tester(app, client_test)
+
+
+async def test_batched_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from collections.abc import AsyncIterator
+        from typing import assert_type
+
+        import pytest
+
+        from ..shared import TEXT_AND_NUM_DATA, TextAndNum
+
+        batches = client.batched(await client.foo_sync(), 2)
+        assert_type(batches, AsyncIterator[list[TextAndNum]])  # type: ignore[client_tester_only]
+        assert [batch async for batch in batches] == [
+            TEXT_AND_NUM_DATA[:2],
+            TEXT_AND_NUM_DATA[2:],
+        ]
+
+        batches = client.batched(await client.foo_async(), 1000, window=60.0)
+        assert [batch async for batch in batches] == [TEXT_AND_NUM_DATA]
+
+        for result in (await client.events(), await client.raw()):
+            with pytest.raises(TypeError, match="JSON Lines"):
+                client.batched(result)
+
+    await async_client_tester(app, client_test)
+
+
+def test_iter_columns(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from array import array
+
+        import pytest
+
+        chunks = list(
+            client.iter_columns(client.foo_sync(), ["num", "text"], chunk_size=2)
+        )
+        assert chunks == [
+            {"num": array("q", [1, 23]), "text": ["foo", "bar"]},
+            {"num": array("q", [456]), "text": ["baz"]},
+        ]
+        assert memoryview(chunks[0]["num"]).format == "q"
+
+        with pytest.raises(ValueError, match="has no field 'missing'"):
+            client.iter_columns(client.foo_sync(), ["missing"])
+        with pytest.raises(ValueError, match="at least 1"):
+            client.iter_columns(client.foo_sync(), ["num"], chunk_size=0)
+        for result in (client.events(), client.raw(), client.single()):
+            with pytest.raises(TypeError, match="JSON Lines"):
+                client.iter_columns(result, ["num"])
+
+    client_tester(app, client_test)
+
+
+async def test_iter_columns_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from array import array
+
+        import pytest
+
+        chunks = client.iter_columns(await client.foo_async(), ["num"])
+        assert [chunk async for chunk in chunks] == [{"num": array("q", [1, 23, 456])}]
+
+        for result in (await client.events(), await client.raw()):
+            with pytest.raises(TypeError, match="JSON Lines"):
+                client.iter_columns(result, ["num"])
+
+    await async_client_tester(app, client_test)
+
+
+class _Sample(BaseModel):
+    count: int = Field(gt=0)
+    ratio: float = 0.5
+    flag: bool = Field(alias="isFlag")
+
+
+def test_columns_adapter() -> None:
+    adapter, columns = FastAPIClientBase._columns_adapter(  # noqa: SLF001
+        _Sample, ("count", "ratio", "flag")
+    )
+    assert columns == (
+        ("count", "count", "q", None),
+        ("ratio", "ratio", "d", 0.5),
+        ("flag", "isFlag", "b", None),
+    )
+    rows = adapter.validate_json(b'[{"count": 1, "isFlag": true, "extra": []}]')
+    assert rows == [{"count": 1, "isFlag": True}]
+    with pytest.raises(ValidationError):
+        adapter.validate_json(b'[{"count": 0, "isFlag": true}]')
+    with pytest.raises(TypeError, match="Pydantic models"):
+        FastAPIClientBase._columns_adapter(int, ("real",))  # noqa: SLF001
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1000])
+def test_split_json_lines(chunk_size: int) -> None:
+    stream = b'{"a": 1}\n\n{"b": [2,\n3]}\r\n\r\n4\n"five"'
+    expected = [b'{"a": 1}', b'{"b": [2,', b"3]}\r", b"4"]
+    for split_json_lines in (
+        FastAPIClientBase._split_json_lines,  # noqa: SLF001
+        FastAPIClientAsyncBase._split_json_lines,  # noqa: SLF001
+    ):
+        carry = bytearray()
+        lines = [
+            line
+            for start in range(0, len(stream), chunk_size)
+            for line in split_json_lines(carry, stream[start : start + chunk_size])
+        ]
+        assert lines == expected
+        assert carry == b'"five"'
+
+
+@pytest.mark.parametrize(
+    ("size", "window", "expected"),
+    [
+        (2, None, [[1, 2], [3, 4], [5]]),
+        (1000, None, [[1, 2, 3, 4, 5]]),
+        (1000, 0.0, [[1, 2], [3], [4], [5]]),
+    ],
+)
+def test_iter_json_lines_batches(
+    size: int, window: float | None, expected: list[list[int]]
+) -> None:
+    response = Response(200, content=iter([b"1\n2\n", b"3\n\n", b"4\n5"]))
+    batches = FastAPIClientBase._iter_json_lines_batches(  # noqa: SLF001
+        response, from_json, size, window
+    )
+    assert list(batches) == expected
@@ -44,6 +44,17 @@ def app() -> FastAPI:
     return app
 
 
+@pytest.fixture
+def app_with_non_ascii_str() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/str-non-ascii", response_class=StreamingResponse)
+    def str_non_ascii() -> Iterable[str]:
+        yield "héllo"
+
+    return app
+
+
 def test_stream_raw(app: FastAPI, client_tester: ClientTester) -> None:
     def client_test(client: Any) -> None:  # noqa: ANN401
         from collections.abc import Iterator
@@ -118,3 +129,31 @@ async def test_stream_raw_async(
         assert await collect_bytes(result_direct.data) == b"hello world!"
 
     await async_client_tester(app, client_test)
+
+
+def test_stream_raw_str_encoding(
+    app_with_non_ascii_str: FastAPI, client_tester: ClientTester
+) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        assert "".join(client.str_non_ascii().data) == "héllo"
+
+        # The encoding override takes precedence over the response's charset.
+        result = client.str_non_ascii(client_exts={"encoding": "latin-1"})
+        assert "".join(result.data) == "héllo".encode().decode("latin-1")
+
+    client_tester(app_with_non_ascii_str, client_test)
+
+
+async def test_stream_raw_str_encoding_async(
+    app_with_non_ascii_str: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        result = await client.str_non_ascii()
+        assert "".join([chunk async for chunk in result.data]) == "héllo"
+
+        # The encoding override takes precedence over the response's charset.
+        result = await client.str_non_ascii(client_exts={"encoding": "latin-1"})
+        text = "".join([chunk async for chunk in result.data])
+        assert text == "héllo".encode().decode("latin-1")
+
+    await async_client_tester(app_with_non_ascii_str, client_test)
@@ -5,6 +5,8 @@ import pytest
 from fastapi import FastAPI
 from fastapi.sse import EventSourceResponse, ServerSentEvent
 
+from fastapi_typed_client import FastAPIClientAsyncBase, FastAPIClientBase
+
 from ..client_tester import AsyncClientTester, ClientTester
 from ..shared import TEXT_AND_NUM_DATA, TextAndNum
 
@@ -198,3 +200,45 @@ async def test_stream_sse_async(
     await async_client_tester(
         app, client_test, import_client_base=True, assert_sorting_of_imports=False
     )
+
+
+_SSE_STREAM = (
+    b"data: 1\n\n"
+    b"data:2\r\n\r\n"
+    b": ping\r\r"
+    b"\n\nevent: update\nid: 7\nretry: 100\ndata: [3,\ndata:  4]\n\n"
+    b"id: a\0b\nretry: 1.5\ndata: 5\n\n"
+    b"data: 6\r\n"
+)
+_SSE_EVENTS = [
+    {"data": b"1"},
+    {"data": "2"},
+    {"comment": "ping"},
+    {"event": "update", "id": "7", "retry": 100, "data": "[3,\n 4]"},
+    {"data": "5"},
+    {"data": "6"},
+]
+
+
+async def _aiter_chunks(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1000])
+async def test_iter_sse_event_fields(chunk_size: int) -> None:
+    chunks = [
+        _SSE_STREAM[start : start + chunk_size]
+        for start in range(0, len(_SSE_STREAM), chunk_size)
+    ]
+    events = list(
+        FastAPIClientBase._iter_sse_event_fields(iter(chunks))  # noqa: SLF001
+    )
+    assert events == _SSE_EVENTS
+    events = [
+        event
+        async for event in FastAPIClientAsyncBase._aiter_sse_event_fields(  # noqa: SLF001
+            _aiter_chunks(chunks)
+        )
+    ]
+    assert events == _SSE_EVENTS
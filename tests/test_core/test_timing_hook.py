@@ -0,0 +1,140 @@
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import TextAndNum
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/items")
+    def create_item(item: TextAndNum) -> list[TextAndNum]:
+        return [item] * 100
+
+    @app.get("/stream")
+    def stream() -> Iterator[TextAndNum]:
+        yield TextAndNum(text="a", num=1)
+
+    @app.get("/broken")
+    def broken() -> int:
+        raise RuntimeError
+
+    return app
+
+
+# `import_client_base=True` is used so we can import `FastAPIClientTiming` from
+# `fastapi_typed_client`.
+
+
+def test_timing_hook(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from collections.abc import Iterable
+        from http import HTTPMethod, HTTPStatus
+        from time import sleep
+
+        import pytest
+        from httpx2 import Client, MockTransport, Response
+
+        from fastapi_typed_client import (
+            FastAPIClientOptions,
+            FastAPIClientTiming,
+            FastAPIClientTracer,
+        )
+
+        timings: list[FastAPIClientTiming] = []
+        options = client._options  # noqa: SLF001
+        options.timing_hook = timings.append
+
+        result = client.create_item(item={"text": "a", "num": 1})
+        assert len(result.data) == 100
+        (timing,) = timings
+        assert timing[:4] == ("create_item", HTTPMethod.POST, "/items", HTTPStatus.OK)
+        assert all(duration >= 0 for duration in timing[4:])
+
+        # The body of streaming responses is read while iterating.
+        assert [item.num for item in client.stream().data] == [1]
+        assert timings[-1].name == "stream"
+        assert timings[-1].read == 0
+
+        # Failed calls are reported without a status.
+        with pytest.raises(RuntimeError):
+            client.broken()
+        assert timings[-1][:4] == ("broken", HTTPMethod.GET, "/broken", None)
+        assert timings[-1].read == timings[-1].validate == 0
+
+        # The whole body is still read while sending, as seen by e.g. the tracer, but
+        # the time the response headers arrived is recorded without changing the
+        # `httpx2` client.
+        def slow_body() -> Iterable[bytes]:
+            yield b"["
+            sleep(0.05)
+            yield b"]"
+
+        tracer = FastAPIClientTracer()
+        slow_client = type(client)(
+            Client(
+                transport=MockTransport(lambda _: Response(200, content=slow_body())),
+                base_url="http://testserver",
+            ),
+            options=FastAPIClientOptions(timing_hook=timings.append, tracer=tracer),
+        )
+        assert slow_client.create_item(item={"text": "a", "num": 1}).data == []
+        (span,) = tracer.spans()
+        assert span.end - span.start >= 50_000_000
+        assert timings[-1].read >= 0.05
+        assert slow_client.client.event_hooks == {"request": [], "response": []}
+
+        # Errors of the hook don't replace the one of a failed call.
+        def broken_hook(_timing: FastAPIClientTiming) -> None:
+            raise ValueError("Broken hook.")
+
+        options.timing_hook = broken_hook
+        with pytest.raises(RuntimeError):
+            client.broken()
+        with pytest.raises(ValueError, match="Broken hook"):
+            client.create_item(item={"text": "a", "num": 1})
+
+        options.timing_hook = None
+        client.create_item(item={"text": "a", "num": 1})
+        assert len(timings) == 4
+
+    client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
+
+
+async def test_timing_hook_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from http import HTTPStatus
+
+        from fastapi_typed_client import FastAPIClientTiming
+
+        timings: list[FastAPIClientTiming] = []
+        options = client._options  # noqa: SLF001
+        options.timing_hook = timings.append
+
+        result = await client.create_item(item={"text": "a", "num": 1})
+        assert len(result.data) == 100
+        (timing,) = timings
+        assert timing.status == HTTPStatus.OK
+        assert timing.send > 0
+        assert timing.validate > 0
+
+    await async_client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+        assert_format_of_generated_code=False,
+    )
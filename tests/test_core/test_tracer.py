@@ -0,0 +1,102 @@
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, Request
+
+from ..client_tester import AsyncClientTester, ClientTester
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/trace-headers")
+    def trace_headers(request: Request) -> list[str | None]:
+        return [
+            request.headers.get("traceparent"),
+            request.headers.get("tracestate"),
+        ]
+
+    return app
+
+
+# `import_client_base=True` is used so we can import `FastAPIClientTracer` from
+# `fastapi_typed_client`.
+
+
+def test_tracer(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from http import HTTPStatus
+
+        from fastapi_typed_client import (
+            FastAPIClientSpan,
+            FastAPIClientTraceContext,
+            FastAPIClientTracer,
+        )
+
+        assert client.trace_headers().data == [None, None]
+
+        # Without a context, every call starts a new trace.
+        exported: list[FastAPIClientSpan] = []
+        options = client._options  # noqa: SLF001
+        tracer = options.tracer = FastAPIClientTracer(on_span=exported.append)
+        traceparent, tracestate = client.trace_headers().data
+        assert tracestate is None
+        (span,) = tracer.spans("trace_headers")
+        assert traceparent == f"00-{span.trace_id}-{span.span_id}-01"
+        assert (span.name, span.parent_id, span.status) == (
+            "trace_headers",
+            None,
+            HTTPStatus.OK,
+        )
+        assert len(span.trace_id) == 32
+        assert len(span.span_id) == 16
+        assert 0 < span.start <= span.end
+        assert exported == [span]
+
+        # With a context, calls are children of its span.
+        context = FastAPIClientTraceContext(
+            "0af7651916cd43dd8448eb211c80319c",
+            "b7ad6b7169203331",
+            sampled=False,
+            state="congo=t61rcWkgMzE",
+        )
+        tracer.context = lambda: context
+        traceparent, tracestate = client.trace_headers().data
+        span = tracer.spans()[-1]
+        assert span.trace_id == context.trace_id
+        assert span.parent_id == context.span_id
+        assert span.span_id != context.span_id
+        assert traceparent == f"00-{context.trace_id}-{span.span_id}-00"
+        assert tracestate == context.state
+        assert len(tracer.spans()) == 2
+        assert tracer.spans("other") == []
+
+    client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+    )
+
+
+async def test_tracer_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from fastapi_typed_client import FastAPIClientTracer
+
+        options = client._options  # noqa: SLF001
+        tracer = options.tracer = FastAPIClientTracer(max_spans=2)
+        for _ in range(3):
+            traceparent, _ = (await client.trace_headers()).data
+        spans = tracer.spans("trace_headers")
+        assert len(spans) == 2
+        assert traceparent == f"00-{spans[-1].trace_id}-{spans[-1].span_id}-01"
+
+    await async_client_tester(
+        app,
+        client_test,
+        import_client_base=True,
+        assert_sorting_of_imports=False,
+    )
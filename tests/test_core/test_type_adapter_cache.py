@@ -0,0 +1,68 @@
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import TEXT_AND_NUM_DATA, TextAndNum
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/foo")
+    def foo() -> TextAndNum:
+        return TEXT_AND_NUM_DATA[0]
+
+    @app.get("/bar")
+    def bar() -> list[TextAndNum]:
+        return TEXT_AND_NUM_DATA
+
+    @app.get("/baz")
+    def baz() -> TextAndNum:
+        return TEXT_AND_NUM_DATA[1]
+
+    return app
+
+
+def test_type_adapter_cache(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from ..shared import TEXT_AND_NUM_DATA
+
+        info = client.type_adapter_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+        assert info.maxsize > 0
+
+        for _ in range(3):
+            assert client.foo().data == TEXT_AND_NUM_DATA[0]
+            assert client.bar().data == TEXT_AND_NUM_DATA
+            assert client.baz().data == TEXT_AND_NUM_DATA[1]
+
+        # Each route resolves its adapter once, routes share adapters per model.
+        info = client.type_adapter_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    client_tester(app, client_test)
+
+
+async def test_type_adapter_cache_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from ..shared import TEXT_AND_NUM_DATA
+
+        info = client.type_adapter_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+        assert info.maxsize > 0
+
+        for _ in range(3):
+            assert (await client.foo()).data == TEXT_AND_NUM_DATA[0]
+            assert (await client.bar()).data == TEXT_AND_NUM_DATA
+            assert (await client.baz()).data == TEXT_AND_NUM_DATA[1]
+
+        # Each route resolves its adapter once, routes share adapters per model.
+        info = client.type_adapter_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    await async_client_tester(app, client_test)
@@ -0,0 +1,137 @@
+from collections.abc import AsyncIterable, Iterable
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.sse import EventSourceResponse
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import TEXT_AND_NUM_DATA, TextAndNum
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items")
+    def items() -> Iterable[TextAndNum]:
+        for _ in range(20):
+            yield from TEXT_AND_NUM_DATA
+
+    @app.get("/events", response_class=EventSourceResponse)
+    async def events() -> AsyncIterable[TextAndNum]:
+        for _ in range(20):
+            for item in TEXT_AND_NUM_DATA:
+                yield item
+
+    return app
+
+
+def test_validation_executor(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from collections.abc import Iterator
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        from multiprocessing import get_context
+        from threading import Event
+
+        import pytest
+        from httpx2 import Client, MockTransport, Response
+
+        from ..shared import TEXT_AND_NUM_DATA
+
+        expected = TEXT_AND_NUM_DATA * 20
+        options = client._options  # noqa: SLF001
+        with ThreadPoolExecutor(4) as executor:
+            options.validation_executor = executor
+            options.validation_window = 8
+            assert list(client.items().data) == expected
+            assert [event.data for event in client.events().data] == expected
+
+            options.validation_executor = None
+            result = client.items(client_exts={"validation_executor": executor})
+            assert list(result.data) == expected
+
+        with ProcessPoolExecutor(2, mp_context=get_context("spawn")) as executor:
+            result = client.items(client_exts={"validation_executor": executor})
+            assert list(result.data) == expected
+            result = client.events(client_exts={"validation_executor": executor})
+            assert [event.data for event in result.data] == expected
+
+        with pytest.raises(ValueError, match="at least 1"):
+            type(options)(validation_window=0)
+
+        # Items are yielded as soon as they arrived, even if the stream then pauses.
+        received = Event()
+
+        def sparse_stream() -> Iterator[bytes]:
+            yield TEXT_AND_NUM_DATA[0].model_dump_json().encode() + b"\n"
+            assert received.wait(5)
+            yield TEXT_AND_NUM_DATA[1].model_dump_json().encode() + b"\n"
+
+        with ThreadPoolExecutor(4) as executor:
+            options.validation_executor = executor
+            sparse_client = type(client)(
+                Client(
+                    transport=MockTransport(
+                        lambda _: Response(200, content=sparse_stream())
+                    ),
+                    base_url="http://testserver",
+                ),
+                options=options,
+            )
+            data = sparse_client.items().data
+            assert next(data) == TEXT_AND_NUM_DATA[0]
+            received.set()
+            assert list(data) == TEXT_AND_NUM_DATA[1:2]
+
+    client_tester(app, client_test)
+
+
+async def test_validation_executor_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from collections.abc import AsyncIterator
+        from concurrent.futures import ThreadPoolExecutor
+
+        from anyio import Event, fail_after
+        from httpx2 import AsyncClient, MockTransport, Response
+
+        from ..shared import TEXT_AND_NUM_DATA
+
+        expected = TEXT_AND_NUM_DATA * 20
+        options = client._options  # noqa: SLF001
+        with ThreadPoolExecutor(4) as executor:
+            options.validation_executor = executor
+            options.validation_window = 8
+            result = await client.items()
+            assert [item async for item in result.data] == expected
+            result = await client.events()
+            assert [event.data async for event in result.data] == expected
+
+        # Items are yielded as soon as they arrived, even if the stream then pauses.
+        received = Event()
+
+        async def sparse_stream() -> AsyncIterator[bytes]:
+            yield TEXT_AND_NUM_DATA[0].model_dump_json().encode() + b"\n"
+            with fail_after(5):
+                await received.wait()
+            yield TEXT_AND_NUM_DATA[1].model_dump_json().encode() + b"\n"
+
+        with ThreadPoolExecutor(4) as executor:
+            options.validation_executor = executor
+            sparse_client = type(client)(
+                AsyncClient(
+                    transport=MockTransport(
+                        lambda _: Response(200, content=sparse_stream())
+                    ),
+                    base_url="http://testserver",
+                ),
+                options=options,
+            )
+            data = (await sparse_client.items()).data
+            assert await anext(data) == TEXT_AND_NUM_DATA[0]
+            received.set()
+            assert [item async for item in data] == TEXT_AND_NUM_DATA[1:2]
+
+    await async_client_tester(app, client_test)
@@ -0,0 +1,114 @@
+from collections.abc import AsyncIterable, Iterable
+from datetime import date
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.sse import EventSourceResponse
+
+from ..client_tester import AsyncClientTester, ClientTester
+from ..shared import TEXT_AND_NUM_DATA, DatedTextAndNums, TextAndNum
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/foo")
+    def foo() -> DatedTextAndNums:
+        return DatedTextAndNums(day=date(2024, 1, 2), items=TEXT_AND_NUM_DATA)
+
+    @app.get("/bar")
+    def bar() -> dict[str, list[TextAndNum] | None]:
+        return {"a": TEXT_AND_NUM_DATA, "b": None}
+
+    @app.get("/pair")
+    def pair() -> tuple[TextAndNum, DatedTextAndNums]:
+        return TEXT_AND_NUM_DATA[0], DatedTextAndNums(day=date(2024, 1, 2), items=[])
+
+    @app.get("/json-lines")
+    def json_lines() -> Iterable[TextAndNum]:
+        yield from TEXT_AND_NUM_DATA
+
+    @app.get("/sse", response_class=EventSourceResponse)
+    async def sse() -> AsyncIterable[TextAndNum]:
+        for item in TEXT_AND_NUM_DATA:
+            yield item
+
+    return app
+
+
+def test_validation_modes(app: FastAPI, client_tester: ClientTester) -> None:
+    def client_test(client: Any) -> None:  # noqa: ANN401
+        from datetime import date
+
+        from ..shared import TEXT_AND_NUM_DATA, DatedTextAndNums
+
+        raw_items = [item.model_dump() for item in TEXT_AND_NUM_DATA]
+
+        validated = client.foo().data
+        assert validated == DatedTextAndNums(
+            day=date(2024, 1, 2), items=TEXT_AND_NUM_DATA
+        )
+
+        # Nested models are constructed, but no values are converted.
+        constructed = client.foo(client_exts={"validation": "construct"}).data
+        assert type(constructed) is DatedTextAndNums
+        assert constructed.day == "2024-01-02"
+        assert constructed.items == TEXT_AND_NUM_DATA
+
+        parsed = client.foo(client_exts={"validation": "none"}).data
+        assert parsed == {"day": "2024-01-02", "items": raw_items}
+
+        constructed = client.bar(client_exts={"validation": "construct"}).data
+        assert constructed == {"a": TEXT_AND_NUM_DATA, "b": None}
+
+        # Fixed-length tuples are constructed position by position.
+        first, second = client.pair(client_exts={"validation": "construct"}).data
+        assert first == TEXT_AND_NUM_DATA[0]
+        assert type(second) is DatedTextAndNums
+        assert second.day == "2024-01-02"
+
+        options = client._options  # noqa: SLF001
+        options.validation = "construct"
+        assert list(client.json_lines().data) == TEXT_AND_NUM_DATA
+        events = list(client.sse().data)
+        assert [event.data for event in events] == TEXT_AND_NUM_DATA
+        assert client.foo(client_exts={"validation": "validate"}).data == validated
+
+        options.validation = "none"
+        assert list(client.json_lines().data) == raw_items
+        events = list(client.sse().data)
+        assert [event.data for event in events] == raw_items
+        assert client.foo(client_exts={"lazy_validation": True}).data == parsed
+
+    client_tester(app, client_test)
+
+
+async def test_validation_modes_async(
+    app: FastAPI, async_client_tester: AsyncClientTester
+) -> None:
+    async def client_test(client: Any) -> None:  # noqa: ANN401
+        from ..shared import TEXT_AND_NUM_DATA, DatedTextAndNums
+
+        raw_items = [item.model_dump() for item in TEXT_AND_NUM_DATA]
+
+        constructed = (await client.foo(client_exts={"validation": "construct"})).data
+        assert type(constructed) is DatedTextAndNums
+        assert constructed.day == "2024-01-02"
+        assert constructed.items == TEXT_AND_NUM_DATA
+
+        options = client._options  # noqa: SLF001
+        options.validation = "construct"
+        result = await client.json_lines()
+        assert [item async for item in result.data] == TEXT_AND_NUM_DATA
+        result = await client.sse()
+        assert [event.data async for event in result.data] == TEXT_AND_NUM_DATA
+
+        options.validation = "none"
+        result = await client.json_lines()
+        assert [item async for item in result.data] == raw_items
+        result = await client.sse()
+        assert [event.data async for event in result.data] == raw_items
+
+    await async_client_tester(app, client_test)